@@ -7,11 +7,12 @@ import pickle
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse
-from starlette.websockets import WebSocket, WebSocketDisconnect
+from starlette.websockets import WebSocket
 
 from py_gql import graphql
+from py_gql.websocket import WebSocketServer, select_subprotocol
 
-from .graphql_ws import GraphQLWSHandler
+from .graphql_ws import StarletteTransport
 from .message_board import MessageBoard
 from .schema import SDL, schema
 
@@ -26,6 +27,8 @@ DB_FILE = "./db.pickle"
 
 app = Starlette(debug=True)
 
+ws_server = WebSocketServer(schema)
+
 
 @app.on_event("startup")
 def on_startup():
@@ -75,16 +78,19 @@ async def graphql_route(request: Request) -> JSONResponse:
 
 @app.websocket_route("/graphql/ws")
 async def ws_graphql_route(ws: WebSocket) -> None:
+    subprotocol = select_subprotocol(ws.scope.get("subprotocols", []))
+    if subprotocol is None:
+        await ws.close(code=1002)
+        return
 
-    await ws.accept(subprotocol="graphql-ws")
-
-    handler = GraphQLWSHandler(ws, schema, context=app.state.message_board)
+    await ws.accept(subprotocol=subprotocol)
 
     try:
-        await handler.handle(ws)
-    except WebSocketDisconnect:
-        logger.info("Disconnected")
-        handler.close()
+        await ws_server.handle(
+            StarletteTransport(ws),
+            subprotocol,
+            context=app.state.message_board,
+        )
     except Exception:
         logger.error(
             "Error when handling GraphqQL over websocket", exc_info=True
@@ -13,7 +13,12 @@ you implement custom behaviors and runtimes.
 from ._pkg import __version__  # isort:skip
 
 from . import lang, schema, tracers, utilities  # noqa: F401
-from ._graphql import graphql, graphql_blocking, process_graphql_query
+from ._graphql import (
+    graphql,
+    graphql_blocking,
+    process_graphql_batch,
+    process_graphql_query,
+)
 from .execution import GraphQLResult, ResolveInfo
 from .sdl import build_schema
 
@@ -23,6 +28,7 @@ __all__ = (
     "graphql",
     "graphql_blocking",
     "process_graphql_query",
+    "process_graphql_batch",
     "GraphQLResult",
     "ResolveInfo",
     "build_schema",
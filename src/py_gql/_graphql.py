@@ -1,8 +1,25 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Callable, Mapping, Optional, Sequence, Type, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
-from .exc import ExecutionError, GraphQLSyntaxError, VariablesCoercionError
+from .exc import (
+    ExecutionError,
+    GraphQLResponseError,
+    GraphQLSyntaxError,
+    VariablesCoercionError,
+)
 from .execution import (
     BlockingExecutor,
     Executor,
@@ -10,12 +27,20 @@ from .execution import (
     Instrumentation,
     execute,
 )
+from .execution.cache import FieldCache
+from .execution.get_operation import get_operation_with_type
 from .execution.runtime import AsyncIORuntime, BlockingRuntime, Runtime
 from .lang import parse
 from .lang.ast import Document
 from .schema import Schema
+from .utilities import coerce_variable_values
 from .validation import Validator, validate_ast
 
+Operation = Tuple[
+    Union[str, Document], Optional[Mapping[str, Any]], Optional[str]
+]
+_Prepared = Tuple[Optional[Document], List[GraphQLResponseError]]
+
 
 def process_graphql_query(
     schema: Schema,
@@ -30,7 +55,11 @@ def process_graphql_query(
     instrumentation: Optional[Instrumentation] = None,
     disable_introspection: bool = False,
     runtime: Optional[Runtime] = None,
-    executor_cls: Type[Executor] = Executor
+    executor_cls: Type[Executor] = Executor,
+    timeout: Optional[float] = None,
+    max_response_nodes: Optional[int] = None,
+    max_response_size: Optional[int] = None,
+    field_cache: Optional[FieldCache] = None
 ) -> Any:
     """
     Execute a GraphQL query.
@@ -75,6 +104,26 @@ def process_graphql_query(
             so use this with caution.
         runtime: Runtime against which to execute field resolvers (defaults to
             `~py_gql.execution.runtime.BlockingRuntime()`).
+        timeout: Maximum duration of the execution in seconds.
+            Fields which have not been resolved when it expires are reported
+            as failed with a :class:`~py_gql.exc.ResolverTimeout` error and
+            the partial result is returned. Pending values are cancelled (or
+            abandoned) depending on the runtime's capabilities and resolvers
+            which are already running synchronously in the current thread
+            cannot be interrupted. Use
+            :func:`~py_gql.execution.runtime.hints.timeout` to set a timeout
+            for individual resolvers.
+        max_response_nodes: Maximum number of values (fields and list
+            entries) in the response. The execution is aborted with a
+            :class:`~py_gql.exc.ResponseTooLarge` error as soon as it is
+            exceeded.
+        max_response_size: Maximum estimated size in bytes of the JSON
+            encoded response. The execution is aborted with a
+            :class:`~py_gql.exc.ResponseTooLarge` error as soon as it is
+            exceeded.
+        field_cache: Cache used to store and reuse the values of fields with a
+            :class:`~py_gql.execution.cache.CacheHint` across executions (see
+            :mod:`py_gql.execution.cache`).
         executor_cls: Executor class to use.
             The executor class defines the implementation of the GraphQL
             resolution algorithm. This **must** be a subclass of
@@ -102,6 +151,9 @@ def process_graphql_query(
         cast(Instrumentation, instrumentation).on_query_end()
         return result
 
+    def _on_execution_error(err: ExecutionError) -> GraphQLResult:
+        return _on_end(GraphQLResult(data=None, errors=[err]))
+
     if isinstance(document, str):
         instrumentation.on_parsing_start()
         try:
@@ -121,21 +173,30 @@ def process_graphql_query(
         return _abort(errors=validation_result.errors)
 
     try:
-        return runtime.map_value(
-            execute(
-                schema,
-                ast,
-                operation_name=operation_name,
-                variables=variables,
-                initial_value=root,
-                context_value=context,
-                instrumentation=instrumentation,
-                middlewares=middlewares,
-                disable_introspection=disable_introspection,
-                executor_cls=executor_cls,
-                runtime=runtime,
-            ),
-            _on_end,
+        # The result is wrapped again as some runtimes can process awaitables
+        # eagerly.
+        return runtime.ensure_wrapped(
+            runtime.map_value(
+                execute(
+                    schema,
+                    ast,
+                    operation_name=operation_name,
+                    variables=variables,
+                    initial_value=root,
+                    context_value=context,
+                    instrumentation=instrumentation,
+                    middlewares=middlewares,
+                    disable_introspection=disable_introspection,
+                    executor_cls=executor_cls,
+                    runtime=runtime,
+                    timeout=timeout,
+                    max_response_nodes=max_response_nodes,
+                    max_response_size=max_response_size,
+                    field_cache=field_cache,
+                ),
+                _on_end,
+                else_=(ExecutionError, _on_execution_error),
+            )
         )
     except VariablesCoercionError as err:
         return _abort(data=None, errors=err.errors)
@@ -143,6 +204,155 @@ def process_graphql_query(
         return _abort(data=None, errors=[err])
 
 
+def process_graphql_batch(
+    schema: Schema,
+    operations: Iterable[Operation],
+    *,
+    root: Any = None,
+    context: Any = None,
+    validators: Optional[Sequence[Validator]] = None,
+    middlewares: Optional[Sequence[Callable[..., Any]]] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    disable_introspection: bool = False,
+    runtime: Optional[Runtime] = None,
+    executor_cls: Type[Executor] = Executor,
+    timeout: Optional[float] = None,
+    max_response_nodes: Optional[int] = None,
+    max_response_size: Optional[int] = None,
+    field_cache: Optional[FieldCache] = None
+) -> Any:
+    """
+    Execute multiple GraphQL operations as part of a single request.
+
+    This is meant for clients sending multiple operations in a single HTTP
+    request (e.g. Apollo's ``BatchHttpLink``). Compared to calling
+    :func:`process_graphql_query` for every operation:
+
+    - Identical documents are only parsed and validated once.
+    - Operations are executed concurrently when the runtime supports it.
+    - All operations are executed with the same ``root`` and ``context``
+      values, which means that loaders stored on the context are shared, and
+      their executors share resolver caches and memoized values (see
+      :func:`~py_gql.execution.memoize`).
+
+    Errors are reported for the operation they occur in and do not prevent
+    executing the other operations.
+
+    Args:
+        schema: Schema to execute the operations against.
+        operations: ``(document, variables, operation_name)`` tuples.
+        **kwargs: See :func:`process_graphql_query`, all settings apply to
+            every operation.
+
+    Returns:
+        Execution results in the same order as ``operations``, wrapped
+        according to the runtime.
+    """
+    schema.validate()
+
+    instrumentation = instrumentation or Instrumentation()
+    runtime = runtime or BlockingRuntime()
+
+    executors = []  # type: List[Executor]
+
+    def _on_end(result: GraphQLResult) -> GraphQLResult:
+        cast(Instrumentation, instrumentation).on_query_end()
+        return result
+
+    def _abort(*args, **kwargs):
+        return cast(Runtime, runtime).ensure_wrapped(
+            _on_end(GraphQLResult(*args, **kwargs))
+        )
+
+    def _on_execution_error(err: ExecutionError) -> GraphQLResult:
+        return _on_end(GraphQLResult(data=None, errors=[err]))
+
+    def _process(
+        prepared: _Prepared,
+        variables: Optional[Mapping[str, Any]],
+        operation_name: Optional[str],
+    ) -> Any:
+        ast, errors = prepared
+        if ast is None:
+            return _abort(errors=errors)
+
+        try:
+            operation, root_type = get_operation_with_type(
+                schema, ast, operation_name
+            )
+            executor = executor_cls(
+                schema,
+                ast,
+                coerce_variable_values(schema, operation, variables or {}),
+                context,
+                instrumentation=instrumentation,
+                disable_introspection=disable_introspection,
+                middlewares=middlewares,
+                runtime=runtime,
+                timeout=timeout,
+                max_response_nodes=max_response_nodes,
+                max_response_size=max_response_size,
+                field_cache=field_cache,
+            )
+            if executors:
+                executor.share_caches(executors[0])
+            else:
+                executors.append(executor)
+
+            return cast(Runtime, runtime).ensure_wrapped(
+                cast(Runtime, runtime).map_value(
+                    executor.execute_operation(operation, root_type, root),
+                    _on_end,
+                    else_=(ExecutionError, _on_execution_error),
+                )
+            )
+        except VariablesCoercionError as err:
+            return _abort(data=None, errors=err.errors)
+        except ExecutionError as err:
+            return _abort(data=None, errors=[err])
+
+    documents = {}
+    results = []
+    for document, variables, operation_name in operations:
+        instrumentation.on_query_start()
+
+        key = document if isinstance(document, str) else id(document)
+        if key not in documents:
+            # Documents are kept alive by the cache so ids are not reused.
+            documents[key] = _prepare_document(
+                schema, document, validators, instrumentation
+            )
+
+        results.append(_process(documents[key], variables, operation_name))
+
+    return runtime.ensure_wrapped(runtime.gather_values(results))
+
+
+def _prepare_document(
+    schema: Schema,
+    document: Union[str, Document],
+    validators: Optional[Sequence[Validator]],
+    instrumentation: Instrumentation,
+) -> _Prepared:
+    if isinstance(document, str):
+        instrumentation.on_parsing_start()
+        try:
+            ast = parse(document)
+        except GraphQLSyntaxError as err:
+            return None, [err]
+        finally:
+            instrumentation.on_parsing_end()
+    else:
+        ast = document
+
+    instrumentation.on_validation_start()
+    validation_result = validate_ast(schema, ast, validators=validators)
+    instrumentation.on_validation_end()
+    if validation_result:
+        return ast, []
+    return None, list(validation_result.errors)
+
+
 async def graphql(
     schema: Schema,
     document: Union[str, Document],
@@ -153,7 +363,11 @@ async def graphql(
     context: Any = None,
     validators: Optional[Sequence[Validator]] = None,
     middlewares: Optional[Sequence[Callable[..., Any]]] = None,
-    instrumentation: Optional[Instrumentation] = None
+    instrumentation: Optional[Instrumentation] = None,
+    timeout: Optional[float] = None,
+    max_response_nodes: Optional[int] = None,
+    max_response_size: Optional[int] = None,
+    field_cache: Optional[FieldCache] = None
 ) -> GraphQLResult:
     """
     Execute a GraphQL query on the AsyncIO runtime.
@@ -178,6 +392,10 @@ async def graphql(
             instrumentation=instrumentation,
             middlewares=middlewares,
             runtime=AsyncIORuntime(),
+            timeout=timeout,
+            max_response_nodes=max_response_nodes,
+            max_response_size=max_response_size,
+            field_cache=field_cache,
         ),
     )
 
@@ -192,7 +410,11 @@ def graphql_blocking(
     context: Any = None,
     validators: Optional[Sequence[Validator]] = None,
     middlewares: Optional[Sequence[Callable[..., Any]]] = None,
-    instrumentation: Optional[Instrumentation] = None
+    instrumentation: Optional[Instrumentation] = None,
+    timeout: Optional[float] = None,
+    max_response_nodes: Optional[int] = None,
+    max_response_size: Optional[int] = None,
+    field_cache: Optional[FieldCache] = None
 ) -> GraphQLResult:
     """
     Execute a GraphQL query in the current thread.
@@ -214,5 +436,9 @@ def graphql_blocking(
             instrumentation=instrumentation,
             middlewares=middlewares,
             executor_cls=BlockingExecutor,
+            timeout=timeout,
+            max_response_nodes=max_response_nodes,
+            max_response_size=max_response_size,
+            field_cache=field_cache,
         ),
     )
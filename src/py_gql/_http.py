@@ -0,0 +1,427 @@
+# -*- coding: utf-8 -*-
+"""
+Request handling shared by the ASGI and WSGI adapters.
+"""
+
+import hashlib
+import http
+import json
+import zlib
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+from urllib.parse import parse_qsl
+
+from ._graphql import Operation
+from .exc import GraphQLResponseError, GraphQLSyntaxError
+from .execution import GraphQLResult, get_operation
+from .execution.cache import CacheStore
+from .lang import parse
+from .schema import Schema
+
+
+Headers = List[Tuple[str, str]]
+
+PERSISTED_QUERY_MAX_AGE = 24 * 3600
+
+
+class HTTPError(Exception):
+    """
+    Raised when a request is not a valid GraphQL request.
+    """
+
+    def __init__(
+        self, status: int, message: str, headers: Optional[Headers] = None
+    ):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or []
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.status, self.message, self.headers)
+
+
+class RequestError(GraphQLResponseError):
+    """
+    Error preventing the execution of a single operation of a request.
+    """
+
+    def __init__(self, message: str, code: Optional[str] = None):
+        super().__init__(message)
+        self.code = code
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.message, self.code)
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.code is None:
+            return {"message": self.message}
+        return {"message": self.message, "extensions": {"code": self.code}}
+
+
+def status_line(status: int) -> str:
+    """
+    >>> status_line(404)
+    '404 Not Found'
+    """
+    return "%d %s" % (status, http.HTTPStatus(status).phrase)
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    >>> accepts_gzip("deflate, gzip;q=1.0, *;q=0.5")
+    True
+    >>> accepts_gzip("gzip;q=0, deflate")
+    False
+    """
+    for token in accept_encoding.lower().split(","):
+        coding, _, params = token.strip().partition(";")
+        if coding.strip() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00")
+    return False
+
+
+def _decode_json_param(params: Dict[str, Any], name: str) -> None:
+    value = params.get(name)
+    if isinstance(value, str):
+        try:
+            params[name] = json.loads(value)
+        except ValueError:
+            raise HTTPError(400, "Invalid JSON in %s parameter" % name)
+
+
+def _check_params(params: Any) -> Dict[str, Any]:
+    if not isinstance(params, dict):
+        raise HTTPError(400, "Request parameters must be a JSON object")
+
+    for name, type_ in (
+        ("query", str),
+        ("operationName", str),
+        ("variables", dict),
+        ("extensions", dict),
+    ):
+        value = params.get(name)
+        if value is not None and not isinstance(value, type_):
+            raise HTTPError(400, "Invalid %s parameter" % name)
+
+    return params
+
+
+def parse_request(
+    method: str,
+    query_string: str,
+    content_type: str,
+    body: bytes,
+    *,
+    allow_get: bool = True,
+    batching: bool = True
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Extract the GraphQL parameters from an HTTP request.
+
+    Returns:
+        The parameters of every operation and whether the request is a batch.
+
+    Raises:
+        HTTPError: If the request is invalid.
+    """
+    if method == "GET" and allow_get:
+        params = dict(parse_qsl(query_string))  # type: Dict[str, Any]
+        _decode_json_param(params, "variables")
+        _decode_json_param(params, "extensions")
+        return [_check_params(params)], False
+
+    if method != "POST":
+        raise HTTPError(
+            405,
+            "Method not allowed",
+            [("allow", "GET, POST" if allow_get else "POST")],
+        )
+
+    media_type = content_type.partition(";")[0].strip().lower()
+
+    if media_type == "application/graphql":
+        params = dict(parse_qsl(query_string))
+        _decode_json_param(params, "variables")
+        try:
+            params["query"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            raise HTTPError(400, "Invalid request body")
+        return [_check_params(params)], False
+
+    if media_type != "application/json":
+        raise HTTPError(415, "Unsupported content type %r" % media_type)
+
+    try:
+        data = json.loads(body.decode("utf-8"))
+    except ValueError:
+        raise HTTPError(400, "Invalid JSON body")
+
+    if isinstance(data, list):
+        if not batching:
+            raise HTTPError(400, "Batched requests are not supported")
+        if not data:
+            raise HTTPError(400, "Empty batch")
+        return [_check_params(params) for params in data], True
+
+    return [_check_params(data)], False
+
+
+def executable(
+    operations: List[Union[Operation, GraphQLResult]]
+) -> List[Operation]:
+    """
+    Operations which must be executed.
+    """
+    return [op for op in operations if not isinstance(op, GraphQLResult)]
+
+
+def merge_results(
+    operations: List[Union[Operation, GraphQLResult]],
+    results: Iterable[GraphQLResult],
+) -> List[GraphQLResult]:
+    """
+    Combine the results of executed operations with those of the operations
+    which could not be executed, in order.
+    """
+    executed = iter(results)
+    return [
+        op if isinstance(op, GraphQLResult) else next(executed)
+        for op in operations
+    ]
+
+
+class BaseGraphQLApp:
+    """
+    Configuration and request processing shared by
+    :class:`py_gql.asgi.GraphQLApp` and :class:`py_gql.wsgi.GraphQLApp`.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        *,
+        root: Any = None,
+        context: Optional[Callable[[Any], Any]] = None,
+        allow_get: bool = True,
+        batching: bool = True,
+        persisted_queries: Optional[CacheStore] = None,
+        gzip: bool = False,
+        gzip_min_size: int = 1024,
+        chunk_size: int = 16384,
+        max_body_size: Optional[int] = 1024 * 1024,
+        **options: Any
+    ):
+        self.schema = schema
+        self.root = root
+        self.context = context
+        self.allow_get = allow_get
+        self.batching = batching
+        self.persisted_queries = persisted_queries
+        self.gzip = gzip
+        self.gzip_min_size = gzip_min_size
+        self.chunk_size = chunk_size
+        self.max_body_size = max_body_size
+        self._options = options
+
+    def prepare(
+        self, method: str, query_string: str, content_type: str, body: bytes
+    ) -> Tuple[List[Union[Operation, GraphQLResult]], bool]:
+        """
+        Parse a request into operations to execute.
+
+        Returns:
+            For every operation either its ``(document, variables,
+            operation_name)`` tuple or the result describing why it cannot
+            be executed, and whether the request is a batch.
+
+        Raises:
+            HTTPError: If the request is invalid.
+        """
+        requests, batch = parse_request(
+            method,
+            query_string,
+            content_type,
+            body,
+            allow_get=self.allow_get,
+            batching=self.batching,
+        )
+
+        operations = []  # type: List[Union[Operation, GraphQLResult]]
+        for params in requests:
+            try:
+                query = self._query(params)
+            except RequestError as err:
+                operations.append(GraphQLResult(errors=[err]))
+                continue
+
+            operation_name = params.get("operationName")
+            document = query  # type: Any
+            if method == "GET":
+                # Only queries can be executed through GET requests as they
+                # should be free of side effects.
+                try:
+                    document = parse(query)
+                    operation = get_operation(document, operation_name)
+                except (GraphQLSyntaxError, GraphQLResponseError):
+                    # Reported when executing the operation.
+                    document = query
+                else:
+                    if operation.operation != "query":
+                        raise HTTPError(
+                            405,
+                            "Can only perform a %s operation from a POST "
+                            "request" % operation.operation,
+                            [("allow", "POST")],
+                        )
+
+            operations.append(
+                (document, params.get("variables"), operation_name)
+            )
+
+        return operations, batch
+
+    def _query(self, params: Dict[str, Any]) -> str:
+        query = params.get("query")  # type: Optional[str]
+        extensions = params.get("extensions") or {}
+        persisted = extensions.get("persistedQuery")
+        store = self.persisted_queries
+
+        if persisted is None or store is None:
+            if query is None:
+                raise RequestError("Must provide query string.")
+            return query
+
+        digest = (
+            persisted.get("sha256Hash") if isinstance(persisted, dict) else None
+        )
+        if not isinstance(digest, str) or persisted.get("version") != 1:
+            raise RequestError("Unsupported persisted query")
+
+        key = ("py_gql.persisted_query", digest)
+        if query is None:
+            try:
+                return cast(str, store.get(key))
+            except KeyError:
+                raise RequestError(
+                    "PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND"
+                )
+
+        if hashlib.sha256(query.encode("utf-8")).hexdigest() != digest:
+            raise RequestError("Provided sha256Hash does not match query")
+
+        store.set(key, query, PERSISTED_QUERY_MAX_AGE)
+        return query
+
+    def encode(
+        self, results: List[GraphQLResult], batch: bool
+    ) -> Iterator[bytes]:
+        """
+        Encode results to JSON in chunks of roughly ``chunk_size`` bytes.
+
+        Results of a batch are encoded one at a time.
+        """
+        encoder = json.JSONEncoder(separators=(",", ":"))
+        chunk_size = self.chunk_size
+        buffer = []  # type: List[str]
+        size = 0
+
+        def _parts() -> Iterator[str]:
+            if not batch:
+                yield from encoder.iterencode(results[0].response())
+                return
+
+            yield "["
+            for index, result in enumerate(results):
+                if index:
+                    yield ","
+                yield from encoder.iterencode(result.response())
+            yield "]"
+
+        for part in _parts():
+            buffer.append(part)
+            size += len(part)
+            if size >= chunk_size:
+                yield "".join(buffer).encode("utf-8")
+                buffer = []
+                size = 0
+
+        if buffer:
+            yield "".join(buffer).encode("utf-8")
+
+    def response(
+        self,
+        results: List[GraphQLResult],
+        batch: bool,
+        accept_encoding: str = "",
+    ) -> Tuple[int, Headers, Iterable[bytes]]:
+        """
+        Build the response for executed results.
+
+        Returns:
+            Status, headers and body chunks.
+        """
+        headers = [("content-type", "application/json")]
+        chunks = self.encode(results, batch)
+
+        if not (self.gzip and accepts_gzip(accept_encoding)):
+            return 200, headers, chunks
+
+        # Small responses are not worth compressing.
+        first = next(chunks, b"")
+        if len(first) < self.gzip_min_size:
+            second = next(chunks, None)
+            if second is None:
+                return 200, headers, [first]
+            chunks = _chain([first, second], chunks)
+        else:
+            chunks = _chain([first], chunks)
+
+        headers.append(("content-encoding", "gzip"))
+        headers.append(("vary", "accept-encoding"))
+        return 200, headers, _gzip(chunks)
+
+    def error_response(
+        self, err: HTTPError
+    ) -> Tuple[int, Headers, Iterable[bytes]]:
+        """
+        Build the response for an invalid request.
+        """
+        body = json.dumps(
+            {"errors": [{"message": err.message}]}, separators=(",", ":")
+        ).encode("utf-8")
+        return (
+            err.status,
+            [("content-type", "application/json")] + err.headers,
+            [body],
+        )
+
+
+def _chain(head: List[bytes], tail: Iterator[bytes]) -> Iterator[bytes]:
+    yield from head
+    yield from tail
+
+
+def _gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+ASGI adapter.
+
+:class:`GraphQLApp` serves a schema over HTTP as an `ASGI
+<https://asgi.readthedocs.io/>`_ application which can be run directly by an
+ASGI server (e.g. ``uvicorn``) or mounted in any ASGI framework.
+
+>>> from py_gql import build_schema
+>>> app = GraphQLApp(build_schema("type Query { hello: String }"))
+>>> # uvicorn.run(app)
+"""
+
+from inspect import isawaitable
+from typing import Any, Callable, Dict, Optional
+
+from ._graphql import process_graphql_batch
+from ._http import BaseGraphQLApp, HTTPError, executable, merge_results
+from .execution.runtime import AsyncIORuntime, Runtime
+from .schema import Schema
+
+
+__all__ = ("GraphQLApp",)
+
+
+class GraphQLApp(BaseGraphQLApp):
+    """
+    ASGI application executing GraphQL requests.
+
+    Supports:
+
+    - ``GET`` requests with the ``query``, ``variables``, ``operationName``
+      and ``extensions`` query parameters (queries only).
+    - ``POST`` requests with a JSON body or an ``application/graphql`` body.
+    - Batched requests, i.e. a JSON array of operations, which are executed
+      together by :func:`~py_gql.process_graphql_batch`.
+    - `Automatic persisted queries
+      <https://www.apollographql.com/docs/apollo-server/performance/apq/>`_
+      when ``persisted_queries`` is set.
+    - Gzip compression of responses when ``gzip`` is set and the client
+      accepts it.
+
+    Responses are encoded and sent in chunks of about ``chunk_size`` bytes
+    instead of being buffered in full.
+
+    Args:
+        schema: Schema to execute requests against.
+        runtime: Runtime used to execute requests, must return awaitables.
+            Defaults to :class:`~py_gql.execution.runtime.AsyncIORuntime`.
+        root: Root value of every operation.
+        context: Function called with the ASGI scope to build the context
+            value of a request, can be a coroutine function. Defaults to
+            using the scope itself.
+        allow_get: Whether to accept ``GET`` requests.
+        batching: Whether to accept batched requests.
+        persisted_queries: Store used to save queries by hash, enables
+            automatic persisted queries.
+        gzip: Whether to compress responses.
+        gzip_min_size: Responses smaller than this many bytes are not
+            compressed.
+        chunk_size: Approximate size of the response chunks in bytes.
+        max_body_size: Maximum size of request bodies in bytes.
+        **options: Other keyword arguments forwarded to
+            :func:`~py_gql.process_graphql_batch` such as ``middlewares``.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        *,
+        runtime: Optional[Runtime] = None,
+        context: Optional[Callable[[Any], Any]] = None,
+        **kwargs: Any
+    ):
+        super().__init__(schema, context=context, **kwargs)
+        self.runtime = runtime or AsyncIORuntime()
+
+    async def __call__(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[[], Any],
+        send: Callable[[Dict[str, Any]], Any],
+    ) -> None:
+        if scope["type"] == "lifespan":
+            return await _lifespan(receive, send)
+
+        if scope["type"] != "http":
+            raise ValueError("Unsupported scope type %r" % scope["type"])
+
+        headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+
+        try:
+            body = await self._read_body(headers, receive)
+            operations, batch = self.prepare(
+                scope["method"],
+                scope.get("query_string", b"").decode("latin-1"),
+                headers.get("content-type", ""),
+                body,
+            )
+        except HTTPError as err:
+            status, response_headers, chunks = self.error_response(err)
+        else:
+            to_execute = executable(operations)
+            results = []  # type: Any
+            if to_execute:
+                context = (
+                    self.context(scope) if self.context is not None else scope
+                )
+                if isawaitable(context):
+                    context = await context
+
+                results = await process_graphql_batch(
+                    self.schema,
+                    to_execute,
+                    root=self.root,
+                    context=context,
+                    runtime=self.runtime,
+                    **self._options,
+                )
+
+            status, response_headers, chunks = self.response(
+                merge_results(operations, results),
+                batch,
+                headers.get("accept-encoding", ""),
+            )
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (name.encode("latin-1"), value.encode("latin-1"))
+                    for name, value in response_headers
+                ],
+            }
+        )
+        for chunk in chunks:
+            await send(
+                {"type": "http.response.body", "body": chunk, "more_body": True}
+            )
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _read_body(
+        self, headers: Dict[str, str], receive: Callable[[], Any]
+    ) -> bytes:
+        max_size = self.max_body_size
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length header")
+        if max_size is not None and length > max_size:
+            raise HTTPError(413, "Request body is too large")
+
+        chunks = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise HTTPError(400, "Client disconnected")
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                raise HTTPError(413, "Request body is too large")
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        return b"".join(chunks)
+
+
+async def _lifespan(
+    receive: Callable[[], Any], send: Callable[[Dict[str, Any]], Any]
+) -> None:
+    # Only needed when running the application on its own.
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
@@ -239,6 +239,15 @@ class InvalidOperationError(ExecutionError):
     pass
 
 
+class ResponseTooLarge(ExecutionError):
+    """
+    Raised when the response exceeds the limits set on the execution.
+
+    See the ``max_response_nodes`` and ``max_response_size`` arguments of
+    :func:`py_gql.execution.execute`.
+    """
+
+
 class VariableCoercionError(GraphQLLocatedError):
     pass
 
@@ -341,6 +350,16 @@ class ResolverError(GraphQLLocatedError):
         return dict_
 
 
+class ResolverTimeout(ResolverError):
+    """
+    Reported when a field could not be resolved in time.
+
+    This is raised by the executor when the execution deadline or the
+    field's own timeout (see :func:`py_gql.execution.runtime.hints.timeout`)
+    expires before the field is resolved.
+    """
+
+
 class SDLError(GraphQLLocatedError):
     """
     Any error that occurred while interpreting a schema definition document.
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
 
+from .batch import batch_resolver
 from .blocking_executor import BlockingExecutor
+from .breadth_first_executor import BreadthFirstExecutor
 from .default_resolver import default_resolver
 from .execute import execute
 from .executor import Executor
 from .get_operation import get_operation
 from .instrumentation import Instrumentation, MultiInstrumentation
+from .memoize import memoize, memoize_by
 from .subscribe import subscribe
 from .wrappers import GraphQLExtension, GraphQLResult, ResolveInfo, ResponsePath
 
@@ -20,6 +23,10 @@ __all__ = (
     "ResponsePath",
     "default_resolver",
     "BlockingExecutor",
+    "BreadthFirstExecutor",
+    "batch_resolver",
+    "memoize",
+    "memoize_by",
     "get_operation",
     "Instrumentation",
     "MultiInstrumentation",
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Batch resolvers.
+
+A batch resolver resolves the same field for multiple parent values in a
+single call. It receives the list of parent values in place of the usual
+``root`` argument and must return a list (or an awaitable resolving to a list)
+of the same length, where each entry is the resolved value for the parent
+value at the same index:
+
+>>> @batch_resolver
+... def resolve_friends(characters, ctx, info, **args):
+...     friends = load_friends([c.id for c in characters])
+...     return [friends.get(c.id, []) for c in characters]
+
+Batch resolvers can also be attached to a field through
+:attr:`py_gql.schema.Field.batch_resolver` or
+``Schema.register_resolver(..., batch=True)``.
+
+:class:`~py_gql.execution.Executor` and
+:class:`~py_gql.execution.BlockingExecutor` call such resolvers once for all
+the items of a list, :class:`~py_gql.execution.BreadthFirstExecutor` calls
+them once for all parent values of a given level of the response. Fields
+resolved outside of a list are resolved with a single parent value at a time.
+
+The ``info`` argument corresponds to the first parent value and raising a
+:class:`~py_gql.exc.ResolverError` will fail the field for all parent values.
+Middlewares wrap the batch call and as such receive the list of parent
+values.
+"""
+
+from typing import Any, Callable, Iterable, List, TypeVar
+
+from .._string_utils import stringify_path
+from .._utils import is_iterable
+from .wrappers import ResponsePath
+
+
+Fn = TypeVar("Fn", bound=Callable[..., Any])
+
+_BATCH_RESOLVER_ATTR = "__py_gql_batch_resolver__"
+
+
+def batch_resolver(func: Fn) -> Fn:
+    """
+    Mark a resolver as a batch resolver.
+
+    >>> @batch_resolver
+    ... def resolver(roots, ctx, info):
+    ...     return [root.value for root in roots]
+
+    >>> is_batch_resolver(resolver)
+    True
+
+    """
+    setattr(func, _BATCH_RESOLVER_ATTR, True)
+    return func
+
+
+def is_batch_resolver(func: Callable[..., Any]) -> bool:
+    """
+    Check whether a resolver has been marked with :func:`batch_resolver`.
+    """
+    return getattr(func, _BATCH_RESOLVER_ATTR, False)
+
+
+def check_batch_result(
+    result: Iterable[Any], count: int, path: ResponsePath
+) -> List[Any]:
+    """
+    Validate the value returned by a batch resolver.
+
+    Args:
+        result: Value returned by the batch resolver.
+        count: Number of parent values passed to the batch resolver.
+        path: Path of the (first) resolved field, used in error messages.
+
+    Returns:
+        The resolved values as a list.
+
+    Raises:
+        RuntimeError: If the value isn't a list of ``count`` elements.
+    """
+    if not is_iterable(result, False):
+        raise RuntimeError(
+            'Batch resolver for field "%s" must return a list of values'
+            % stringify_path(path)
+        )
+
+    values = result if isinstance(result, list) else list(result)
+    if len(values) != count:
+        raise RuntimeError(
+            'Batch resolver for field "%s" returned %d values for %d parent '
+            "values" % (stringify_path(path), len(values), count)
+        )
+
+    return values
@@ -6,7 +6,12 @@ from .._utils import OrderedDict
 from ..exc import CoercionError, ResolverError
 from ..lang import ast as _ast
 from ..schema import Field, GraphQLType, ObjectType
-from .executor import Executor
+from .executor import (
+    _MISSING,
+    Executor,
+    _unwrap_batched_value,
+    is_leaf_list_item_type,
+)
 from .wrappers import GroupedFields, ResolveInfo, ResponsePath
 
 
@@ -64,9 +69,19 @@ class BlockingExecutor(Executor):
 
         try:
             coerced_args = self.argument_values(field_definition, node)
-            resolved = resolver(
-                parent_value, self.context_value, info, **coerced_args
+            batched = (
+                self._batched_values.get(
+                    (id(nodes), id(parent_value)), _MISSING
+                )
+                if self._batched_values
+                else _MISSING
             )
+            if batched is not _MISSING:
+                resolved = _unwrap_batched_value(batched)
+            else:
+                resolved = self.call_resolver(
+                    resolver, parent_value, info, coerced_args
+                )
         except (CoercionError, ResolverError) as err:
             self.add_error(err, path, node)
             return None
@@ -87,10 +102,30 @@ class BlockingExecutor(Executor):
         info: ResolveInfo,
         resolved_value: Any,
     ) -> List[Any]:
-        return [
-            self.complete_value(inner_type, nodes, path + [index], info, entry)
-            for index, entry in enumerate(resolved_value)
-        ]
+        if is_leaf_list_item_type(inner_type):
+            return self.complete_leaf_list_value(
+                inner_type, nodes, path, resolved_value
+            )
+
+        entries = (
+            resolved_value
+            if isinstance(resolved_value, list)
+            else list(resolved_value)
+        )
+
+        prefetched = self.prefetch_batch_fields(
+            inner_type, nodes, path, info, entries
+        )
+
+        return self._clear_batched_values(
+            prefetched,
+            [
+                self.complete_value(
+                    inner_type, nodes, path + [index], info, entry
+                )
+                for index, entry in enumerate(entries)
+            ],
+        )
 
     def complete_non_nullable_value(
         self,
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import functools as ft
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .._utils import OrderedDict
+from ..exc import CoercionError, ResolverError
+from ..lang import ast as _ast
+from ..schema import Field, GraphQLType, ObjectType
+from .batch import check_batch_result
+from .executor import Executor
+from .wrappers import GroupedFields, ResolveInfo, ResponsePath
+
+
+Resolver = Callable[..., Any]
+
+
+class BreadthFirstExecutor(Executor):
+    """
+    Executor implementation resolving the response level by level.
+
+    The default :class:`Executor` walks the response depth-first, fully
+    resolving every object before moving on to its siblings. This executor
+    instead resolves all the fields at a given depth of the response before
+    moving on to the next one. As a result, fields using a
+    :func:`~py_gql.execution.batch_resolver` are resolved in a single call
+    for all of their parent values across the current level (e.g. all the
+    ``friends`` of all the ``heroes``), which makes it possible to load them
+    with a single ``WHERE id IN (...)`` query without relying on a data loader
+    library.
+
+    Other resolvers are called once per parent value as usual and the
+    response is the same as when using :class:`Executor`.
+    """
+
+    __slots__ = Executor.__slots__ + ("_next_level",)
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._next_level = None  # type: Optional[List[_PendingObject]]
+
+    def reset_state(self) -> None:
+        super().reset_state()
+        self._next_level = None
+
+    def prefetch_batch_fields(
+        self,
+        inner_type: GraphQLType,
+        nodes: List[_ast.Field],
+        path: ResponsePath,
+        info: ResolveInfo,
+        entries: List[Any],
+    ) -> Any:
+        # Batch resolvers are called for the whole level when resolving the
+        # list items' fields.
+        return []
+
+    def execute_fields(
+        self,
+        parent_type: ObjectType,
+        root: Any,
+        path: ResponsePath,
+        fields: GroupedFields,
+    ) -> Any:
+        iterated = list(self._iterate_fields(parent_type, fields))
+        result = OrderedDict(
+            (key, None) for key, _, _ in iterated
+        )  # type: Dict[str, Any]
+        pending = _PendingObject(parent_type, root, path, iterated, result)
+
+        if self._next_level is not None:
+            # Nested object: its fields will be filled in when resolving the
+            # next level of the response.
+            self._next_level.append(pending)
+            return result
+
+        return self.runtime.map_value(
+            self._execute_levels([pending]), lambda _: result
+        )
+
+    def _execute_levels(self, level: List["_PendingObject"]) -> Any:
+        next_level = []  # type: List[_PendingObject]
+        self._next_level = next_level
+
+        def _next(_):
+            if next_level:
+                return self._execute_levels(next_level)
+            self._next_level = None
+            return None
+
+        def _abort(err):
+            self._next_level = None
+            raise err
+
+        try:
+            resolved = self.runtime.gather_values(self._execute_level(level))
+        except Exception:
+            self._next_level = None
+            raise
+
+        return self.runtime.unwrap_value(
+            self.runtime.map_value(resolved, _next, else_=(Exception, _abort))
+        )
+
+    def _execute_level(self, level: List["_PendingObject"]) -> List[Any]:
+        pending = []  # type: List[Any]
+        # Field nodes are grouped per parent type and selection set (see
+        # `collect_fields`) so they identify all the parent values sharing the
+        # same field and arguments.
+        batches = (
+            OrderedDict()
+        )  # type: Dict[int, Tuple[ObjectType, str, Field, List[_ast.Field], List[_PendingObject]]]  # noqa: B950
+
+        for obj in level:
+            for key, field_def, nodes in obj.fields:
+                if self.batch_field_resolver(obj.parent_type, field_def):
+                    try:
+                        batches[id(nodes)][4].append(obj)
+                    except KeyError:
+                        batches[id(nodes)] = (
+                            obj.parent_type,
+                            key,
+                            field_def,
+                            nodes,
+                            [obj],
+                        )
+                else:
+                    pending.append(
+                        self.runtime.map_value(
+                            self.resolve_field(
+                                obj.parent_type,
+                                obj.value,
+                                field_def,
+                                nodes,
+                                obj.path + [key],
+                            ),
+                            ft.partial(obj.result.__setitem__, key),
+                        )
+                    )
+
+        for parent_type, key, field_def, nodes, objs in batches.values():
+            pending.append(
+                self.runtime.map_value(
+                    self.resolve_field_batch(
+                        parent_type,
+                        [obj.value for obj in objs],
+                        field_def,
+                        nodes,
+                        [obj.path + [key] for obj in objs],
+                    ),
+                    ft.partial(_set_values, [obj.result for obj in objs], key),
+                )
+            )
+
+        return pending
+
+    def resolve_field_batch(
+        self,
+        parent_type: ObjectType,
+        parent_values: List[Any],
+        field_definition: Field,
+        nodes: List[_ast.Field],
+        paths: List[ResponsePath],
+    ) -> Any:
+        """
+        Resolve and complete a field for multiple parent values at once.
+
+        Args:
+            parent_type: Type shared by all the parent values.
+            parent_values: Values to resolve the field for.
+            field_definition: Field to resolve, which must be using a batch
+                resolver.
+            nodes: Field nodes, shared by all parent values.
+            paths: Response path of the field for each of the parent values.
+
+        Returns:
+            The list of completed values (wrapped according to the runtime).
+        """
+        resolver = self.batch_field_resolver(parent_type, field_definition)
+        assert resolver is not None
+        node = nodes[0]
+        context = self.context_value
+        instrumentation = self.instrumentation
+        infos = [
+            ResolveInfo(
+                field_definition, path, parent_type, nodes, self.runtime, self
+            )
+            for path in paths
+        ]
+
+        _call_hook(
+            instrumentation.on_field_start, parent_values, context, infos
+        )
+
+        def end():
+            _call_hook(
+                instrumentation.on_field_end, parent_values, context, infos
+            )
+
+        def fail(err):
+            for index, path in enumerate(paths):
+                self.add_error(err if not index else copy.copy(err), path, node)
+            end()
+            return [None] * len(paths)
+
+        def complete(res):
+            end()
+            values = check_batch_result(res, len(paths), paths[0])
+            return self.runtime.gather_values(
+                self.complete_value(
+                    field_definition.type, nodes, path, info, value
+                )
+                for path, info, value in zip(paths, infos, values)
+            )
+
+        try:
+            coerced_args = self.argument_values(field_definition, node)
+            self.check_deadline(paths[0])
+        except (CoercionError, ResolverError) as err:
+            return fail(err)
+
+        def cancelled():
+            _call_hook(
+                instrumentation.on_field_cancelled,
+                parent_values,
+                context,
+                infos,
+            )
+
+        try:
+            resolved = self.bound_by_deadline(
+                resolver(parent_values, context, infos[0], **coerced_args),
+                paths[0],
+            )
+            if self._track_cancellation:
+                resolved = self.runtime.handle_cancellation(resolved, cancelled)
+            return self.runtime.unwrap_value(
+                self.runtime.map_value(
+                    self.runtime.unwrap_value(resolved),
+                    complete,
+                    else_=(ResolverError, fail),
+                )
+            )
+        except ResolverError as err:
+            return fail(err)
+
+
+def _call_hook(
+    hook: Callable[[Any, Any, ResolveInfo], None],
+    parent_values: List[Any],
+    context: Any,
+    infos: List[ResolveInfo],
+) -> None:
+    for value, info in zip(parent_values, infos):
+        hook(value, context, info)
+
+
+class _PendingObject:
+    __slots__ = ("parent_type", "value", "path", "fields", "result")
+
+    def __init__(
+        self,
+        parent_type: ObjectType,
+        value: Any,
+        path: ResponsePath,
+        fields: List[Tuple[str, Field, List[_ast.Field]]],
+        result: Dict[str, Any],
+    ):
+        self.parent_type = parent_type
+        self.value = value
+        self.path = path
+        self.fields = fields
+        self.result = result
+
+
+def _set_values(
+    results: List[Dict[str, Any]], key: str, values: List[Any]
+) -> None:
+    for result, value in zip(results, values):
+        result[key] = value
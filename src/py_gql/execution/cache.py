@@ -0,0 +1,497 @@
+# -*- coding: utf-8 -*-
+"""
+Field level result caching.
+
+Fields can be marked as cacheable with a :class:`CacheHint`, either from the
+SDL through the ``@cacheControl`` schema directive (see
+:class:`CacheControlDirective`):
+
+.. code-block:: graphql
+
+    type Query {
+        countries: [Country!]! @cacheControl(maxAge: 3600)
+        viewer: User @cacheControl(maxAge: 60, scope: PRIVATE)
+    }
+
+or programmatically with :func:`set_cache_hint`. Hints set on object types
+and interfaces apply to all the fields returning them which don't have their
+own hint.
+
+Hints are used by :class:`FieldCache` which, when passed to the executor,
+stores resolved values and reuses them across executions, and by
+:class:`CacheControl` which computes the cache policy of a whole response
+(e.g. to set the HTTP ``Cache-Control`` header).
+"""
+
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .._utils import OrderedDict
+from ..exc import SchemaDirectiveError
+from ..schema import (
+    Argument,
+    Directive,
+    EnumType,
+    Field,
+    GraphQLCompositeType,
+    Int,
+    InterfaceType,
+    NonNullType,
+    ObjectType,
+    unwrap_type,
+)
+from ..sdl import SchemaDirective
+from .instrumentation import Instrumentation
+from .wrappers import GraphQLExtension, ResolveInfo, ResponsePath
+
+
+__all__ = (
+    "PUBLIC",
+    "PRIVATE",
+    "CacheHint",
+    "set_cache_hint",
+    "get_cache_hint",
+    "CacheControlDirective",
+    "CacheStore",
+    "MemoryCacheStore",
+    "FieldCache",
+    "CacheControl",
+)
+
+
+PUBLIC = "PUBLIC"
+PRIVATE = "PRIVATE"
+
+
+class CacheHint:
+    """
+    Describe how long the value of a field can be cached and by whom.
+
+    Args:
+        max_age: Number of seconds the value can be cached for. ``0`` means
+            the value must not be cached.
+        scope: Either :data:`PUBLIC` (the value is the same for every user)
+            or :data:`PRIVATE` (the value depends on the current user).
+
+    Attributes:
+        max_age (int): Number of seconds the value can be cached for.
+        scope (str): Either :data:`PUBLIC` or :data:`PRIVATE`.
+    """
+
+    __slots__ = ("max_age", "scope")
+
+    def __init__(self, max_age: int, scope: str = PUBLIC):
+        if max_age < 0:
+            raise ValueError("max_age must be >= 0, got %r" % max_age)
+
+        if scope not in (PUBLIC, PRIVATE):
+            raise ValueError(
+                "scope must be one of %s, %s, got %r" % (PUBLIC, PRIVATE, scope)
+            )
+
+        self.max_age = max_age
+        self.scope = scope
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, CacheHint)
+            and self.max_age == other.max_age
+            and self.scope == other.scope
+        )
+
+    def __repr__(self) -> str:
+        return "CacheHint(%d, %s)" % (self.max_age, self.scope)
+
+    def http_header(self) -> Optional[str]:
+        """
+        Value of the matching HTTP ``Cache-Control`` header, or ``None`` if
+        the value should not be cached.
+
+        >>> CacheHint(60, PRIVATE).http_header()
+        'max-age=60, private'
+        """
+        if not self.max_age:
+            return None
+        return "max-age=%d, %s" % (self.max_age, self.scope.lower())
+
+
+_Hinted = Union[Field, ObjectType, InterfaceType]
+
+
+def set_cache_hint(
+    definition: _Hinted, max_age: int, scope: str = PUBLIC
+) -> None:
+    """
+    Set the cache hint of a field, object type or interface.
+
+    >>> from py_gql.schema import Field, ObjectType, String
+    >>> field = Field("name", String)
+    >>> set_cache_hint(field, 60)
+    >>> get_cache_hint(ObjectType("Object", [field]), field)
+    CacheHint(60, PUBLIC)
+    """
+    definition.cache_hint = CacheHint(max_age, scope)
+
+
+def get_cache_hint(
+    parent_type: ObjectType, field_definition: Field
+) -> Optional[CacheHint]:
+    """
+    Find the cache hint applying to a field.
+
+    This is the field's own hint or the hint of the (object or interface) type
+    it returns.
+
+    Args:
+        parent_type: Type the field is resolved on.
+        field_definition: Field definition.
+
+    Returns:
+        The relevant hint if there is one.
+    """
+    hint = field_definition.cache_hint
+    if hint is None:
+        return_type = unwrap_type(field_definition.type)
+        if isinstance(return_type, (ObjectType, InterfaceType)):
+            hint = return_type.cache_hint
+    return hint
+
+
+CacheControlScope = EnumType(
+    "CacheControlScope",
+    [PUBLIC, PRIVATE],
+    description="Whether a cached value can be shared between users.",
+)
+
+
+class CacheControlDirective(SchemaDirective):
+    """
+    Implementation of the ``@cacheControl`` directive.
+
+    The directive doesn't need to be defined in the SDL; pass this class to
+    :func:`py_gql.build_schema` through ``schema_directives``. Its definition
+    is:
+
+    .. code-block:: graphql
+
+        enum CacheControlScope { PUBLIC PRIVATE }
+
+        directive @cacheControl(
+            maxAge: Int! = 0
+            scope: CacheControlScope = PUBLIC
+        ) on FIELD_DEFINITION | OBJECT | INTERFACE
+
+    Raises:
+        SchemaDirectiveError: If ``maxAge`` is negative.
+    """
+
+    definition = Directive(
+        "cacheControl",
+        ["FIELD_DEFINITION", "OBJECT", "INTERFACE"],
+        [
+            Argument("maxAge", NonNullType(Int), default_value=0),
+            Argument("scope", CacheControlScope, default_value=PUBLIC),
+        ],
+        description="Describe how the value of a field can be cached.",
+    )
+
+    def __init__(self, args: Mapping[str, Any]):
+        super().__init__(args)
+        if args["maxAge"] < 0:
+            raise SchemaDirectiveError(
+                'Invalid "@cacheControl" directive: maxAge must be >= 0, '
+                "got %d" % args["maxAge"]
+            )
+        self.hint = CacheHint(args["maxAge"], args["scope"])
+
+    def on_field(self, field: Field) -> Field:
+        self._set_hint(field)
+        return field
+
+    def on_object(self, object_type: ObjectType) -> ObjectType:
+        self._set_hint(object_type)
+        return object_type
+
+    def on_interface(self, interface_type: InterfaceType) -> InterfaceType:
+        self._set_hint(interface_type)
+        return interface_type
+
+    def _set_hint(self, definition: _Hinted) -> None:
+        definition.cache_hint = self.hint
+
+
+class CacheStore:
+    """
+    Storage backend for :class:`FieldCache`.
+
+    Implementations must be thread safe if they are used with a runtime
+    completing values in multiple threads. Values are Python objects as
+    returned by the resolvers which means non in-memory implementations need
+    to serialize them.
+    """
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Load a value from the store.
+
+        Raises:
+            KeyError: If the value is not in the store or has expired.
+        """
+        raise NotImplementedError()
+
+    def set(self, key: Hashable, value: Any, max_age: float) -> None:
+        """
+        Save a value to the store for ``max_age`` seconds.
+        """
+        raise NotImplementedError()
+
+
+class MemoryCacheStore(CacheStore):
+    """
+    In-memory, thread safe :class:`CacheStore` implementation.
+
+    Entries expire after their ``max_age`` and the least recently used
+    entries are evicted once the store is full.
+
+    Args:
+        max_size: Maximum number of entries.
+        clock: Function returning the current time in seconds.
+    """
+
+    def __init__(
+        self, max_size: int = 1024, clock: Callable[[], float] = time.monotonic
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1, got %r" % max_size)
+
+        self.max_size = max_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # type: Dict[Hashable, Tuple[float, Any]]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            expires, value = self._entries[key]
+            if expires <= self._clock():
+                del self._entries[key]
+                raise KeyError(key)
+            self._entries.move_to_end(key)  # type: ignore
+            return value
+
+    def set(self, key: Hashable, value: Any, max_age: float) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + max_age, value)
+            self._entries.move_to_end(key)  # type: ignore
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)  # type: ignore
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+def default_identity(value: Any) -> Optional[Hashable]:
+    """
+    Identify a parent value through its ``id`` key or attribute.
+
+    Returns:
+        The identifier or ``None`` if the value cannot be identified, in which
+        case its fields are not cached.
+    """
+    if isinstance(value, dict):
+        return value.get("id")
+    return getattr(value, "id", None)
+
+
+class FieldCache:
+    """
+    Cache resolved field values across executions.
+
+    When a field has a :class:`CacheHint` with a positive ``max_age``, the
+    executor looks up its value before calling the resolver and stores the
+    resolved value for ``max_age`` seconds. Values are keyed on the parent
+    type and identity (see ``identify``), the field and its coerced
+    arguments; root fields are assumed to not depend on the root value.
+
+    Warning:
+        Cached values are shared across executions and must not be mutated.
+        Fields resolved through a batch resolver for multiple parent values
+        at once are not cached.
+
+    Args:
+        store: Storage backend, defaults to a :class:`MemoryCacheStore`.
+        identify: Function returning a hashable identifier for a parent value
+            or ``None`` if it cannot be identified. Defaults to
+            :func:`default_identity`.
+        session_key: Function returning a hashable identifier for the current
+            user from the context value. Fields with a :data:`PRIVATE` scope
+            are only cached when this is set, separately for every user.
+    """
+
+    def __init__(
+        self,
+        store: Optional[CacheStore] = None,
+        identify: Callable[[Any], Optional[Hashable]] = default_identity,
+        session_key: Optional[Callable[[Any], Optional[Hashable]]] = None,
+    ):
+        self.store = store if store is not None else MemoryCacheStore()
+        self._identify = identify
+        self._session_key = session_key
+
+    def lookup(
+        self,
+        parent_type: ObjectType,
+        parent_value: Any,
+        field_definition: Field,
+        path: ResponsePath,
+        args: Dict[str, Any],
+        context: Any,
+    ) -> Optional[Tuple[Hashable, int]]:
+        """
+        Compute the cache key and max age of a field.
+
+        Returns:
+            ``None`` if the field should not be cached.
+        """
+        hint = get_cache_hint(parent_type, field_definition)
+        if hint is None or not hint.max_age:
+            return None
+
+        if len(path) == 1:
+            identity = None  # type: Optional[Hashable]
+        else:
+            identity = self._identify(parent_value)
+            if identity is None:
+                return None
+
+        if hint.scope == PRIVATE:
+            if self._session_key is None:
+                return None
+            session = self._session_key(context)
+            if session is None:
+                return None
+        else:
+            session = None
+
+        key = (
+            parent_type.name,
+            field_definition.name,
+            identity,
+            _freeze(args),
+            session,
+        )
+
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key, hint.max_age
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Load a cached value.
+
+        Raises:
+            KeyError: If the value is not cached.
+        """
+        return self.store.get(key)
+
+    def set(self, key: Hashable, value: Any, max_age: int) -> None:
+        """
+        Cache a resolved value.
+        """
+        self.store.set(key, value, max_age)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    elif isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class CacheControl(Instrumentation, GraphQLExtension):
+    """
+    Compute the cache policy of a response.
+
+    The policy of a response is the lowest ``max_age`` of all of its fields
+    and it is :data:`PRIVATE` if any of its fields is. Root fields and fields
+    returning composite types which don't have a hint use
+    ``default_max_age``; other fields inherit the policy of their parent.
+
+    This implements :class:`~py_gql.execution.GraphQLExtension` in order to
+    be included in the response under the ``cacheControl`` key and a new
+    instance should be used for every execution.
+
+    Hints are folded into the policy as fields are resolved so memory usage
+    doesn't depend on the size of the response.
+
+    Args:
+        default_max_age: Max age of root and composite fields without a hint.
+    """
+
+    name = "cacheControl"
+
+    def __init__(self, default_max_age: int = 0):
+        self.default_max_age = default_max_age
+        self._max_age = None  # type: Optional[int]
+        self._private = False
+
+    def on_field_start(
+        self, root: Any, context: Any, info: ResolveInfo
+    ) -> None:
+        hint = get_cache_hint(info.parent_type, info.field_definition)
+
+        if hint is not None:
+            max_age = hint.max_age
+            self._private = self._private or hint.scope == PRIVATE
+        elif len(info.path) == 1 or isinstance(
+            unwrap_type(info.field_definition.type), GraphQLCompositeType
+        ):
+            max_age = self.default_max_age
+        else:
+            return
+
+        if self._max_age is None or max_age < self._max_age:
+            self._max_age = max_age
+
+    @property
+    def policy(self) -> CacheHint:
+        """
+        Aggregated cache policy of the response.
+        """
+        return CacheHint(
+            self._max_age or 0, PRIVATE if self._private else PUBLIC
+        )
+
+    def http_header(self) -> Optional[str]:
+        """
+        Value of the HTTP ``Cache-Control`` header matching the policy, or
+        ``None`` if the response should not be cached.
+        """
+        return self.policy.http_header()
+
+    def payload(self) -> Dict[str, Any]:
+        policy = self.policy
+        return {
+            "version": 1,
+            "policy": {"maxAge": policy.max_age, "scope": policy.scope},
+        }
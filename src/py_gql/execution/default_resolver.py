@@ -1,13 +1,23 @@
 # -*- coding: utf-8 -*-
 
+import collections
+import operator
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 
 if TYPE_CHECKING:
     from .wrappers import ResolveInfo
 
 
+Resolver = Callable[..., Any]
+
+# Descriptor type used by namedtuple for its fields.
+_NAMEDTUPLE_FIELD_TYPE = type(
+    vars(collections.namedtuple("_Sample", ["field"]))["field"]
+)
+
+
 def default_resolver(
     root: Any,
     context: Any,
@@ -58,3 +68,96 @@ def default_resolver(
         return field_value(context, info, **args)
     else:
         return field_value
+
+
+def specialized_default_resolver(python_name: str) -> Resolver:
+    """
+    Build a resolver equivalent to :func:`default_resolver` for a single key.
+
+    :func:`default_resolver` needs to inspect every ``root`` value it receives
+    and look up the key to use from the field definition. As the executor
+    usually resolves the same field over many values of the same Python type
+    (e.g. lists of dicts or namedtuples), the returned resolver binds the key
+    once and compiles a getter for each ``root`` type the first time it
+    encounters it (:func:`operator.itemgetter` for namedtuple fields and
+    :func:`operator.attrgetter` for other objects), only falling back to
+    inspecting the value when it sees a new type.
+
+    Args:
+        python_name: Key or attribute name to look up.
+
+    Returns:
+        Resolver function with the same semantics as :func:`default_resolver`.
+
+    """
+    # Type -> getter or None for mappings. Writes to a dict are atomic which
+    # makes this safe to share across threads.
+    getters = {}  # type: Dict[type, Optional[Callable[[Any], Any]]]
+
+    def resolve(
+        root: Any,
+        context: Any,
+        info: "ResolveInfo",
+        *,
+        __type: Any = type,
+        __callable: Any = callable,
+        **args: Any
+    ) -> Any:
+        root_type = __type(root)
+        try:
+            getter = getters[root_type]
+        except KeyError:
+            getter = getters[root_type] = _compile_getter(
+                root_type, python_name
+            )
+
+        if getter is None:
+            return root.get(python_name, None)
+
+        try:
+            field_value = getter(root)
+        except AttributeError:  # Same as getattr(root, python_name, None)
+            return None
+
+        if __callable(field_value):
+            return field_value(context, info, **args)
+        else:
+            return field_value
+
+    return resolve
+
+
+def _compile_getter(
+    cls: type, python_name: str
+) -> Optional[Callable[[Any], Any]]:
+    if issubclass(cls, Mapping):
+        return None
+
+    index = _namedtuple_field_index(cls, python_name)
+    if index is not None:
+        return operator.itemgetter(index)
+
+    return operator.attrgetter(python_name)
+
+
+def _namedtuple_field_index(cls: type, python_name: str) -> Optional[int]:
+    # Namedtuple fields can be read by index as long as no class in the MRO
+    # overrides them or customises attribute access.
+    if not issubclass(cls, tuple) or (
+        cls.__getattribute__ is not tuple.__getattribute__
+    ):
+        return None
+
+    for base in cls.__mro__:
+        namespace = vars(base)
+        if python_name in namespace:
+            fields = namespace.get("_fields", ())  # type: Tuple[str, ...]
+            if (
+                base.__bases__ == (tuple,)
+                and python_name in fields
+                and type(namespace[python_name]) is _NAMEDTUPLE_FIELD_TYPE
+            ):
+                return fields.index(python_name)
+            return None
+
+    return None
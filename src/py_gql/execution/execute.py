@@ -1,15 +1,15 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Callable, Mapping, Optional, Sequence, Type, cast
+from typing import Any, Callable, Mapping, Optional, Sequence, Type
 
 from ..lang import ast as _ast
 from ..schema import Schema
 from ..utilities import coerce_variable_values
+from .cache import FieldCache
 from .executor import Executor
 from .get_operation import get_operation_with_type
 from .instrumentation import Instrumentation
 from .runtime import BlockingRuntime, Runtime
-from .wrappers import GraphQLResult
 
 
 Resolver = Callable[..., Any]
@@ -27,7 +27,11 @@ def execute(
     instrumentation: Optional[Instrumentation] = None,
     disable_introspection: bool = False,
     runtime: Optional[Runtime] = None,
-    executor_cls: Type[Executor] = Executor
+    executor_cls: Type[Executor] = Executor,
+    timeout: Optional[float] = None,
+    max_response_nodes: Optional[int] = None,
+    max_response_size: Optional[int] = None,
+    field_cache: Optional[FieldCache] = None
 ) -> Any:
     """
     Execute a query or mutation against a schema.
@@ -63,6 +67,26 @@ def execute(
             so use this with caution.
         runtime: Runtime against which to execute field resolvers (defaults to
             `~py_gql.execution.runtime.BlockingRuntime()`).
+        timeout: Maximum duration of the execution in seconds.
+            Fields which have not been resolved when it expires are reported
+            as failed with a :class:`~py_gql.exc.ResolverTimeout` error and
+            the partial result is returned. Pending values are cancelled (or
+            abandoned) depending on the runtime's capabilities and resolvers
+            which are already running synchronously in the current thread
+            cannot be interrupted. Use
+            :func:`~py_gql.execution.runtime.hints.timeout` to set a timeout
+            for individual resolvers.
+        max_response_nodes: Maximum number of values (fields and list
+            entries) in the response. The execution is aborted with a
+            :class:`~py_gql.exc.ResponseTooLarge` error as soon as it is
+            exceeded.
+        max_response_size: Maximum estimated size in bytes of the JSON
+            encoded response. The execution is aborted with a
+            :class:`~py_gql.exc.ResponseTooLarge` error as soon as it is
+            exceeded.
+        field_cache: Cache used to store and reuse the values of fields with a
+            :class:`~py_gql.execution.cache.CacheHint` across executions (see
+            :mod:`py_gql.execution.cache`).
         executor_cls: Executor class to use.
             The executor class defines the implementation of the GraphQL
             resolution algorithm. This **must** be a subclass of
@@ -73,6 +97,7 @@ def execute(
 
     Raises:
         RuntimeError: on invalid operation.
+        ResponseTooLarge: when the response exceeds the configured limits.
     """
     instrumentation = instrumentation or Instrumentation()
     runtime = runtime or BlockingRuntime()
@@ -93,38 +118,10 @@ def execute(
         disable_introspection=disable_introspection,
         middlewares=middlewares,
         runtime=runtime,
+        timeout=timeout,
+        max_response_nodes=max_response_nodes,
+        max_response_size=max_response_size,
+        field_cache=field_cache,
     )
 
-    if operation.operation == "query":
-        exe_fn = executor.execute_fields
-    elif operation.operation == "mutation":
-        exe_fn = executor.execute_fields_serially
-    elif operation.operation == "subscription":
-        raise RuntimeError(
-            "`execute` does not support subscriptions, "
-            "use the `subscribe` helper."
-        )
-    else:
-        raise RuntimeError("Unknown operation type %s." % operation.operation)
-
-    instrumentation.on_execution_start()
-
-    def _on_finish(data):
-        cast(Instrumentation, instrumentation).on_execution_end()
-        return GraphQLResult(data=data, errors=executor.errors)
-
-    return runtime.ensure_wrapped(
-        runtime.map_value(
-            runtime.unwrap_value(
-                exe_fn(
-                    root_type,
-                    initial_value,
-                    [],
-                    executor.collect_fields(
-                        root_type, operation.selection_set.selections
-                    ),
-                )
-            ),
-            _on_finish,
-        )
-    )
+    return executor.execute_operation(operation, root_type, initial_value)
@@ -1,14 +1,19 @@
 # -*- coding: utf-8 -*-
 
+import copy
+import functools as ft
+import time
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
     Sequence,
     Tuple,
+    Type,
     TypeVar,
     Union,
     cast,
@@ -19,6 +24,8 @@ from .._utils import OrderedDict, apply_middlewares, is_iterable
 from ..exc import (
     CoercionError,
     ResolverError,
+    ResolverTimeout,
+    ResponseTooLarge,
     ScalarSerializationError,
     UnknownEnumValue,
 )
@@ -34,11 +41,17 @@ from ..schema import (
     ObjectType,
     ScalarType,
     Schema,
+    unwrap_type,
 )
-from .default_resolver import default_resolver
-from .instrumentation import Instrumentation
+from .batch import check_batch_result, is_batch_resolver
+from .cache import FieldCache
+from .default_resolver import default_resolver, specialized_default_resolver
+from .instrumentation import Instrumentation, implements_hook
+from .memoize import MemoKey, get_memo_key
 from .runtime import BlockingRuntime, Runtime
+from .runtime.hints import get_timeout
 from .wrappers import (
+    GraphQLResult,
     GroupedFields,
     ResolutionContext,
     ResolveInfo,
@@ -60,12 +73,34 @@ class Executor(ResolutionContext):
     This is the core executor class implementing all of the operations necessary
     to fulfill a GraphQL query or mutation as defined [in the spec](
     https://spec.graphql.org/June2018/#sec-Execution).
+
+    Attributes:
+        response_nodes (int): Number of values completed so far. This is only
+            tracked when response limits are set or the instrumentation
+            implements :meth:`~Instrumentation.on_response_size`.
+        response_size (int): Estimated size in bytes of the JSON encoded
+            values completed so far (tracked alongside ``response_nodes``).
     """
 
     __slots__ = ResolutionContext.__slots__ + (
         "instrumentation",
         "runtime",
         "_default_resolver",
+        "_specialized_resolvers",
+        "_class_runtime_types",
+        "_batch_resolvers",
+        "_batch_fields",
+        "_batched_values",
+        "_batched_refs",
+        "_track_cancellation",
+        "_timeout",
+        "_deadline",
+        "_max_response_nodes",
+        "_max_response_size",
+        "_track_response_size",
+        "response_nodes",
+        "response_size",
+        "_field_cache",
     )
 
     def __init__(
@@ -78,7 +113,11 @@ class Executor(ResolutionContext):
         middlewares: Optional[Sequence[Callable[..., Any]]] = None,
         instrumentation: Optional[Instrumentation] = None,
         disable_introspection: bool = False,
-        runtime: Optional[Runtime] = None
+        runtime: Optional[Runtime] = None,
+        timeout: Optional[float] = None,
+        max_response_nodes: Optional[int] = None,
+        max_response_size: Optional[int] = None,
+        field_cache: Optional[FieldCache] = None
     ):
         super().__init__(
             schema,
@@ -91,15 +130,118 @@ class Executor(ResolutionContext):
         self.instrumentation = instrumentation or Instrumentation()
         self.runtime = runtime or BlockingRuntime()
         self._default_resolver = schema.default_resolver or default_resolver
+        self._specialized_resolvers = {}  # type: Dict[str, Resolver]
+        self._class_runtime_types = {}  # type: Dict[type, Optional[ObjectType]]
+        self._batch_resolvers = {}  # type: Dict[Resolver, Optional[Resolver]]
+        self._batch_fields = (
+            {}
+        )  # type: Dict[Tuple[str, int], List[Tuple[str, Field, List[_ast.Field], Resolver]]]  # noqa: B950
+        # Values resolved ahead of time by `prefetch_batch_fields` and the
+        # number of additional list completions using them.
+        self._batched_values = {}  # type: Dict[Tuple[int, int], Any]
+        self._batched_refs = {}  # type: Dict[Tuple[int, int], int]
+        # Only watch for cancelled resolvers if someone is listening.
+        self._track_cancellation = implements_hook(
+            self.instrumentation, "on_field_cancelled"
+        )
+        self._timeout = timeout
+        self._deadline = (
+            time.monotonic() + timeout if timeout is not None else None
+        )  # type: Optional[float]
+        self._max_response_nodes = max_response_nodes
+        self._max_response_size = max_response_size
+        self._track_response_size = (
+            max_response_nodes is not None
+            or max_response_size is not None
+            or implements_hook(self.instrumentation, "on_response_size")
+        )
+        self.response_nodes = 0
+        self.response_size = 0
+        self._field_cache = field_cache
+
+    def reset_state(self) -> None:
+        super().reset_state()
+        self._batched_values = {}
+        self._batched_refs = {}
+        self.response_nodes = 0
+        self.response_size = 0
+        # The timeout applies to every execution.
+        self._deadline = (
+            time.monotonic() + self._timeout
+            if self._timeout is not None
+            else None
+        )
+
+    def share_caches(self, other: ResolutionContext) -> None:
+        super().share_caches(other)
+        if isinstance(other, Executor):
+            self._specialized_resolvers = other._specialized_resolvers
+            self._class_runtime_types = other._class_runtime_types
+            self._batch_resolvers = other._batch_resolvers
+
+    def execute_operation(
+        self,
+        operation: _ast.OperationDefinition,
+        root_type: ObjectType,
+        initial_value: Any = None,
+    ) -> Any:
+        """
+        Execute a query or mutation operation of the current document.
+
+        Returns:
+            Execution result wrapped according to the runtime.
+        """
+        if operation.operation == "query":
+            exe_fn = self.execute_fields
+        elif operation.operation == "mutation":
+            exe_fn = self.execute_fields_serially
+        elif operation.operation == "subscription":
+            raise RuntimeError(
+                "`execute` does not support subscriptions, "
+                "use the `subscribe` helper."
+            )
+        else:
+            raise RuntimeError(
+                "Unknown operation type %s." % operation.operation
+            )
+
+        self.instrumentation.on_execution_start()
+
+        def _on_finish(data):
+            self.report_response_size()
+            self.instrumentation.on_execution_end()
+            return GraphQLResult(data=data, errors=self.errors)
+
+        runtime = self.runtime
+        return runtime.ensure_wrapped(
+            runtime.map_value(
+                runtime.unwrap_value(
+                    exe_fn(
+                        root_type,
+                        initial_value,
+                        [],
+                        self.collect_fields(
+                            root_type, operation.selection_set.selections
+                        ),
+                    )
+                ),
+                _on_finish,
+            )
+        )
 
     def field_resolver(
         self, parent_type: ObjectType, field_definition: Field
     ) -> Resolver:
         base = (
             field_definition.resolver
+            or field_definition.batch_resolver
             or parent_type.default_resolver
             or self._default_resolver
         )
+
+        if base is default_resolver:
+            return self._specialized_default_resolver(field_definition)
+
         try:
             return self._resolver_cache[base]
         except KeyError:
@@ -108,29 +250,301 @@ class Executor(ResolutionContext):
                 if base is not self._default_resolver
                 else base
             )
+            timeout = get_timeout(base)
+            if timeout is not None:
+                wrapped = self._resolver_with_timeout(wrapped, timeout)
+            if _uses_batch_resolver(field_definition, base):
+                wrapped = self._unbatched_resolver(wrapped)
+            memo_key = get_memo_key(base)
+            if memo_key is not None:
+                wrapped = self._memoized_resolver(wrapped, memo_key)
             if self._middlewares:
                 wrapped = apply_middlewares(wrapped, self._middlewares)
             self._resolver_cache[base] = wrapped
             return wrapped
 
+    def _resolver_with_timeout(
+        self, resolver: Resolver, timeout: float
+    ) -> Resolver:
+        runtime = self.runtime
+
+        def resolve(root, context, info, **args):
+            return runtime.with_timeout(
+                resolver(root, context, info, **args),
+                timeout,
+                ft.partial(_raise_timeout, info.path),
+            )
+
+        return resolve
+
+    def _memoized_resolver(
+        self, resolver: Resolver, memo_key: MemoKey
+    ) -> Resolver:
+        runtime = self.runtime
+
+        def resolve(root, context, info, **args):
+            # Wrapped resolvers are shared between forks of the executor so
+            # the values must be looked up on the current one.
+            memoized = info._context._memoized_values
+            key = (
+                info.parent_type.name,
+                info.field_definition.name,
+                memo_key(root, args),
+            )
+            try:
+                value = memoized[key][1]
+            except KeyError:
+                value = runtime.share_value(
+                    resolver(root, context, info, **args)
+                )
+                # Keep the parent value alive as default keys rely on its id.
+                memoized[key] = (root, value)
+            except TypeError:  # Unhashable key
+                return resolver(root, context, info, **args)
+
+            # Errors are reported for every path the value is used at.
+            return runtime.map_value(
+                value, _identity, else_=(ResolverError, _raise_copy)
+            )
+
+        return resolve
+
+    def check_deadline(self, path: ResponsePath) -> None:
+        """
+        Fail the resolution of a field if the execution deadline has passed.
+
+        Raises:
+            ResolverTimeout: If the deadline has passed.
+        """
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            _raise_timeout(path)
+
+    def bound_by_deadline(self, value: Any, path: ResponsePath) -> Any:
+        """
+        Fail the resolution of a field if its value is not available by the
+        execution deadline.
+
+        Args:
+            value: Resolved value (wrapped according to the runtime).
+            path: Path of the field being resolved.
+
+        Returns:
+            The value to use in place of ``value``.
+        """
+        if self._deadline is None:
+            return value
+        return self.runtime.with_timeout(
+            value,
+            self._deadline - time.monotonic(),
+            ft.partial(_raise_timeout, path),
+        )
+
+    def report_response_size(self) -> None:
+        """
+        Report the size of the response to the instrumentation if it is being
+        tracked.
+        """
+        if self._track_response_size:
+            self.instrumentation.on_response_size(
+                self.response_nodes, self.response_size
+            )
+
+    def _count_response_value(
+        self, path: ResponsePath, size: int, count: int = 1
+    ) -> None:
+        # Account for ``count`` values of ``size`` total bytes completed at
+        # ``path`` (the key or separator included) and fail the execution
+        # once a limit is exceeded. Values completed concurrently in different
+        # threads may be miscounted, which is fine for an estimate.
+        key = path[-1]
+        self.response_nodes += count
+        self.response_size += size + (
+            len(key) + 4 if isinstance(key, str) else 1
+        )
+
+        if (
+            self._max_response_nodes is not None
+            and self.response_nodes > self._max_response_nodes
+        ):
+            self.report_response_size()
+            raise ResponseTooLarge(
+                "Response exceeded the limit of %d values"
+                % self._max_response_nodes
+            )
+
+        if (
+            self._max_response_size is not None
+            and self.response_size > self._max_response_size
+        ):
+            self.report_response_size()
+            raise ResponseTooLarge(
+                "Response exceeded the limit of %d bytes"
+                % self._max_response_size
+            )
+
+    def call_resolver(
+        self,
+        resolver: Resolver,
+        parent_value: Any,
+        info: ResolveInfo,
+        args: Dict[str, Any],
+    ) -> Any:
+        """
+        Call a field resolver, going through the field cache and bounding the
+        resolved value by the execution deadline if they are set.
+
+        Args:
+            resolver: Wrapped resolver, see :meth:`field_resolver`.
+            parent_value: Value the field is resolved on.
+            info: Resolution info for the field.
+            args: Coerced field arguments.
+
+        Returns:
+            The resolved value (wrapped according to the runtime).
+        """
+        field_cache = self._field_cache
+        if field_cache is not None:
+            lookup = field_cache.lookup(
+                info.parent_type,
+                parent_value,
+                info.field_definition,
+                info.path,
+                args,
+                self.context_value,
+            )
+            if lookup is not None:
+                key, max_age = lookup
+                try:
+                    return field_cache.get(key)
+                except KeyError:
+                    pass
+
+                def _store(value: Any) -> Any:
+                    field_cache.set(key, value, max_age)
+                    return value
+
+                return self.runtime.map_value(
+                    self.runtime.unwrap_value(
+                        self._call_resolver(resolver, parent_value, info, args)
+                    ),
+                    _store,
+                )
+
+        return self._call_resolver(resolver, parent_value, info, args)
+
+    def _call_resolver(
+        self,
+        resolver: Resolver,
+        parent_value: Any,
+        info: ResolveInfo,
+        args: Dict[str, Any],
+    ) -> Any:
+        if self._deadline is None:
+            return resolver(parent_value, self.context_value, info, **args)
+
+        self.check_deadline(info.path)
+        return self.bound_by_deadline(
+            resolver(parent_value, self.context_value, info, **args), info.path,
+        )
+
+    def _unbatched_resolver(self, resolver: Resolver) -> Resolver:
+        # Batch resolvers are called with a single parent value when resolving
+        # fields one by one.
+        runtime = self.runtime
+
+        def resolve(root, context, info, **args):
+            return runtime.map_value(
+                runtime.unwrap_value(resolver([root], context, info, **args)),
+                lambda result: check_batch_result(result, 1, info.path)[0],
+            )
+
+        return resolve
+
+    def batch_field_resolver(
+        self, parent_type: ObjectType, field_definition: Field
+    ) -> Optional[Resolver]:
+        """
+        Return the wrapped batch resolver for a field if it has one.
+
+        This is either :attr:`py_gql.schema.Field.batch_resolver` or the
+        field's resolver if it has been marked with
+        :func:`~py_gql.execution.batch_resolver`.
+        """
+        base = (
+            field_definition.batch_resolver
+            or field_definition.resolver
+            or parent_type.default_resolver
+            or self._default_resolver
+        )
+
+        try:
+            return self._batch_resolvers[base]
+        except KeyError:
+            if _uses_batch_resolver(field_definition, base):
+                resolver = self.runtime.wrap_callable(base)
+                timeout = get_timeout(base)
+                if timeout is not None:
+                    resolver = self._resolver_with_timeout(resolver, timeout)
+                if self._middlewares:
+                    resolver = apply_middlewares(resolver, self._middlewares)
+                wrapped = resolver  # type: Optional[Resolver]
+            else:
+                wrapped = None
+            self._batch_resolvers[base] = wrapped
+            return wrapped
+
+    def _specialized_default_resolver(
+        self, field_definition: Field
+    ) -> Resolver:
+        # Replace the built-in default resolver with a version bound to the
+        # looked up key which avoids re-inspecting the type of every single
+        # resolved value.
+        key = field_definition.python_name
+        try:
+            return self._specialized_resolvers[key]
+        except KeyError:
+            resolver = specialized_default_resolver(key)
+            if self._middlewares:
+                resolver = apply_middlewares(resolver, self._middlewares)
+            self._specialized_resolvers[key] = resolver
+            return resolver
+
     def resolve_type(
         self, value: Any, info: ResolveInfo, abstract_type: GraphQLAbstractType,
     ) -> Optional[ObjectType]:
 
-        maybe_type = None  # type: Optional[Union[ObjectType, str]]
-
         if abstract_type.resolve_type is not None:
-            maybe_type = abstract_type.resolve_type(
-                value, self.context_value, info
+            return self._runtime_type(
+                value,
+                abstract_type.resolve_type(value, self.context_value, info),
             )
-        else:
-            # Default type resolution
-            maybe_type = (
-                value.get("__typename__", None)
-                if isinstance(value, dict)
-                else getattr(value, "__typename__", None)
+
+        # Default type resolution
+        if isinstance(value, dict):
+            return self._runtime_type(value, value.get("__typename__", None))
+
+        instance_attributes = getattr(value, "__dict__", None)
+        if instance_attributes and "__typename__" in instance_attributes:
+            return self._runtime_type(
+                value, instance_attributes["__typename__"]
             )
 
+        # Outside of instance attributes, the runtime type only depends on the
+        # value's class so we can avoid looking it up for every value.
+        cls = type(value)
+        try:
+            return self._class_runtime_types[cls]
+        except KeyError:
+            runtime_type = self._runtime_type(
+                value, getattr(value, "__typename__", None)
+            )
+            if _class_determines_typename(cls):
+                self._class_runtime_types[cls] = runtime_type
+            return runtime_type
+
+    def _runtime_type(
+        self, value: Any, maybe_type: Optional[Union[ObjectType, str]]
+    ) -> Optional[ObjectType]:
         if maybe_type is None:
             maybe_type = type(value).__name__
 
@@ -177,17 +591,36 @@ class Executor(ResolutionContext):
         except CoercionError as err:
             return fail(err)
 
+        batched = (
+            self._batched_values.get((id(nodes), id(parent_value)), _MISSING)
+            if self._batched_values
+            else _MISSING
+        )
+
         try:
+            if batched is not _MISSING:
+                resolved = _unwrap_batched_value(batched)
+            elif self._deadline is None and self._field_cache is None:
+                resolved = resolver(
+                    parent_value, self.context_value, info, **coerced_args
+                )
+            else:
+                resolved = self.call_resolver(
+                    resolver, parent_value, info, coerced_args
+                )
+            if self._track_cancellation:
+                resolved = self.runtime.handle_cancellation(
+                    resolved,
+                    ft.partial(
+                        self.instrumentation.on_field_cancelled,
+                        parent_value,
+                        self.context_value,
+                        info,
+                    ),
+                )
             return self.runtime.unwrap_value(
                 self.runtime.map_value(
-                    self.runtime.unwrap_value(
-                        resolver(
-                            parent_value,
-                            self.context_value,
-                            info,
-                            **coerced_args,
-                        )
-                    ),
+                    self.runtime.unwrap_value(resolved),
                     complete,
                     else_=(ResolverError, fail),
                 )
@@ -266,11 +699,356 @@ class Executor(ResolutionContext):
         info: ResolveInfo,
         resolved_value: Any,
     ) -> Any:
-        return self.runtime.gather_values(
-            self.complete_value(inner_type, nodes, path + [index], info, entry)
-            for index, entry in enumerate(resolved_value)
+        if is_leaf_list_item_type(inner_type):
+            return self.complete_leaf_list_value(
+                inner_type, nodes, path, resolved_value
+            )
+
+        entries = (
+            resolved_value
+            if isinstance(resolved_value, list)
+            else list(resolved_value)
         )
 
+        def _complete(prefetched):
+            return self.runtime.map_value(
+                self.runtime.gather_values(
+                    self.complete_value(
+                        inner_type, nodes, path + [index], info, entry
+                    )
+                    for index, entry in enumerate(entries)
+                ),
+                ft.partial(self._clear_batched_values, prefetched),
+            )
+
+        return self.runtime.map_value(
+            self.prefetch_batch_fields(inner_type, nodes, path, info, entries),
+            _complete,
+        )
+
+    def prefetch_batch_fields(
+        self,
+        inner_type: GraphQLType,
+        nodes: List[_ast.Field],
+        path: ResponsePath,
+        info: ResolveInfo,
+        entries: List[Any],
+    ) -> Any:
+        """
+        Resolve fields using a batch resolver for all the entries of a list.
+
+        This calls every batch resolver selected on the list items once with
+        all the relevant entries instead of once per entry. Resolved values are
+        stored on the executor and picked up by :meth:`resolve_field` when
+        completing the corresponding entries.
+
+        Returns:
+            The (possibly wrapped) list of keys under which values have been
+            stored, which are cleared once the list has been completed.
+        """
+        if isinstance(inner_type, NonNullType):
+            inner_type = inner_type.type
+
+        if not isinstance(inner_type, GraphQLCompositeType):
+            return []
+
+        if isinstance(inner_type, GraphQLAbstractType):
+            possible_types = self.schema.get_possible_types(
+                inner_type
+            )  # type: Sequence[ObjectType]
+        else:
+            possible_types = [cast(ObjectType, inner_type)]
+
+        batch_fields = {
+            t.name: fields
+            for t, fields in (
+                (t, self._list_item_batch_fields(t, nodes))
+                for t in possible_types
+            )
+            if fields
+        }
+
+        if not batch_fields:
+            return []
+
+        if isinstance(inner_type, GraphQLAbstractType):
+            groups = self._group_list_entries_by_type(
+                inner_type, info, entries, batch_fields
+            )
+        else:
+            indices = [
+                i for i, entry in enumerate(entries) if entry is not None
+            ]
+            groups = [
+                (
+                    cast(ObjectType, inner_type),
+                    [entries[i] for i in indices],
+                    indices,
+                )
+            ]
+
+        pending = []  # type: List[Any]
+
+        for runtime_type, values, indices in groups:
+            if len(values) < 2:
+                continue
+
+            for key, field_def, field_nodes, resolver in batch_fields[
+                runtime_type.name
+            ]:
+                pending.append(
+                    self._prefetch_batch_field(
+                        resolver,
+                        runtime_type,
+                        field_def,
+                        field_nodes,
+                        path + [indices[0], key],
+                        values,
+                    )
+                )
+
+        if not pending:
+            return []
+
+        def _flatten(stored):
+            return [key for keys in stored for key in keys]
+
+        return self.runtime.map_value(
+            self.runtime.gather_values(pending), _flatten
+        )
+
+    def _group_list_entries_by_type(
+        self,
+        abstract_type: GraphQLAbstractType,
+        info: ResolveInfo,
+        entries: List[Any],
+        batch_fields: Dict[str, Any],
+    ) -> List[Tuple[ObjectType, List[Any], List[int]]]:
+        groups = (
+            OrderedDict()
+        )  # type: Dict[str, Tuple[ObjectType, List[Any], List[int]]]
+
+        for index, entry in enumerate(entries):
+            if entry is None:
+                continue
+
+            runtime_type = self.resolve_type(entry, info, abstract_type)
+            # Invalid types will be reported when completing the entry.
+            if (
+                not isinstance(runtime_type, ObjectType)
+                or runtime_type.name not in batch_fields
+            ):
+                continue
+
+            try:
+                group = groups[runtime_type.name]
+            except KeyError:
+                group = groups[runtime_type.name] = (runtime_type, [], [])
+
+            group[1].append(entry)
+            group[2].append(index)
+
+        return list(groups.values())
+
+    def _list_item_batch_fields(
+        self, item_type: ObjectType, nodes: List[_ast.Field]
+    ) -> List[Tuple[str, Field, List[_ast.Field], Resolver]]:
+        cache_key = item_type.name, id(nodes)
+        try:
+            return self._batch_fields[cache_key]
+        except KeyError:
+            fields = self.collect_fields(
+                item_type,
+                [
+                    selection
+                    for field in nodes
+                    if field.selection_set
+                    for selection in field.selection_set.selections
+                ],
+            )
+            batch_fields = []
+            for key, field_def, field_nodes in self._iterate_fields(
+                item_type, fields
+            ):
+                resolver = self.batch_field_resolver(item_type, field_def)
+                if resolver is not None:
+                    batch_fields.append((key, field_def, field_nodes, resolver))
+            self._batch_fields[cache_key] = batch_fields
+            return batch_fields
+
+    def _prefetch_batch_field(
+        self,
+        resolver: Resolver,
+        parent_type: ObjectType,
+        field_definition: Field,
+        nodes: List[_ast.Field],
+        path: ResponsePath,
+        parent_values: List[Any],
+    ) -> Any:
+        keys = [(id(nodes), id(value)) for value in parent_values]
+
+        try:
+            coerced_args = self.argument_values(field_definition, nodes[0])
+            self.check_deadline(path)
+        except (CoercionError, ResolverTimeout):
+            # Will be reported when resolving each entry.
+            return []
+
+        info = ResolveInfo(
+            field_definition, path, parent_type, nodes, self.runtime, self
+        )
+
+        def store(result):
+            for key, value in zip(
+                keys, check_batch_result(result, len(keys), path)
+            ):
+                self._store_batched_value(key, value)
+            return keys
+
+        def store_error(err):
+            for key in keys:
+                self._store_batched_value(key, _BatchError(err))
+            return keys
+
+        try:
+            resolved = resolver(
+                parent_values, self.context_value, info, **coerced_args
+            )
+            return self.runtime.map_value(
+                self.runtime.unwrap_value(
+                    self.bound_by_deadline(resolved, path)
+                ),
+                store,
+                else_=(ResolverError, store_error),
+            )
+        except ResolverError as err:
+            return store_error(err)
+
+    def _store_batched_value(self, key: Tuple[int, int], value: Any) -> None:
+        # The same parent value can appear in concurrently completed lists, in
+        # which case the first resolved value is kept until they are all done.
+        if key in self._batched_values:
+            self._batched_refs[key] = self._batched_refs.get(key, 0) + 1
+        else:
+            self._batched_values[key] = value
+
+    def _clear_batched_values(
+        self, keys: List[Tuple[int, int]], completed: T
+    ) -> T:
+        batched_values, batched_refs = self._batched_values, self._batched_refs
+        if not batched_refs:
+            for key in keys:
+                del batched_values[key]
+            return completed
+
+        for key in keys:
+            refs = batched_refs.pop(key, 0)
+            if refs:
+                if refs > 1:
+                    batched_refs[key] = refs - 1
+            else:
+                del batched_values[key]
+        return completed
+
+    def complete_leaf_list_value(
+        self,
+        inner_type: GraphQLType,
+        nodes: List[_ast.Field],
+        path: ResponsePath,
+        resolved_value: Iterable[Any],
+    ) -> List[Any]:
+        """
+        Complete a list of scalars or enum values.
+
+        This is equivalent to calling :meth:`complete_value` for every entry
+        but resolves the completion strategy once for the whole list and
+        serializes all non null entries in bulk (see
+        :meth:`py_gql.schema.ScalarType.serialize_many` and
+        :meth:`py_gql.schema.EnumType.get_names`).
+        """
+        non_nullable = isinstance(inner_type, NonNullType)
+        leaf_type = unwrap_type(inner_type)
+        entries = (
+            resolved_value
+            if isinstance(resolved_value, list)
+            else list(resolved_value)
+        )
+
+        if isinstance(leaf_type, ScalarType):
+            serialize = leaf_type.serialize  # type: Callable[[Any], Any]
+            serialize_many = (
+                leaf_type.serialize_many
+            )  # type: Callable[[Sequence[Any]], List[Any]]
+            error_cls = ScalarSerializationError  # type: Type[Exception]
+        else:
+            serialize = cast(EnumType, leaf_type).get_name
+            serialize_many = cast(EnumType, leaf_type).get_names
+            error_cls = UnknownEnumValue
+
+        present = [entry for entry in entries if entry is not None]
+
+        try:
+            serialized = serialize_many(present)
+        except error_cls as err:
+            # Bulk serialization doesn't tell us which entry failed so we
+            # go through them one by one to report the correct path.
+            for index, entry in enumerate(entries):
+                if entry is None:
+                    continue
+                try:
+                    serialize(entry)
+                except error_cls as entry_err:
+                    raise RuntimeError(
+                        'Field "%s" cannot be serialized as "%s": %s'
+                        % (stringify_path(path + [index]), leaf_type, entry_err)
+                    ) from entry_err
+
+            raise RuntimeError(
+                'Field "%s" cannot be serialized as "%s": %s'
+                % (stringify_path(path), leaf_type, err)
+            ) from err
+
+        if len(serialized) != len(present):
+            raise RuntimeError(
+                'Field "%s" cannot be serialized as "%s": expected %d values '
+                "but got %d"
+                % (
+                    stringify_path(path),
+                    leaf_type,
+                    len(present),
+                    len(serialized),
+                )
+            )
+
+        if self._track_response_size:
+            # The list itself and all of its entries, including nulls.
+            self._count_response_value(
+                path,
+                sum(_estimated_size(value) for value in serialized)
+                + 4 * (len(entries) - len(present))
+                + len(entries)
+                + 2,
+                len(entries) + 1,
+            )
+
+        if len(present) == len(entries):
+            completed = serialized
+        else:
+            serialized_iter = iter(serialized)
+            completed = [
+                None if entry is None else next(serialized_iter)
+                for entry in entries
+            ]
+
+        # Serializers can return None as well so this needs to be checked
+        # once serialized values and null entries have been merged.
+        if non_nullable and None in completed:
+            for index, value in enumerate(completed):
+                if value is None:
+                    self._handle_non_nullable_value(nodes, path + [index], None)
+
+        return completed
+
     def complete_non_nullable_value(
         self,
         inner_type: GraphQLType,
@@ -299,6 +1077,8 @@ class Executor(ResolutionContext):
             )
 
         if resolved_value is None:
+            if self._track_response_size:
+                self._count_response_value(path, 4)
             return None
 
         if isinstance(field_type, ListType):
@@ -307,27 +1087,37 @@ class Executor(ResolutionContext):
                     'Field "%s" is a list type and resolved value should be '
                     "iterable" % stringify_path(path)
                 )
+            if self._track_response_size and not is_leaf_list_item_type(
+                field_type.type
+            ):
+                self._count_response_value(path, 2)
             return self.complete_list_value(
                 field_type.type, nodes, path, info, resolved_value
             )
 
         if isinstance(field_type, ScalarType):
             try:
-                return field_type.serialize(resolved_value)
+                serialized = field_type.serialize(resolved_value)
             except ScalarSerializationError as err:
                 raise RuntimeError(
                     'Field "%s" cannot be serialized as "%s": %s'
                     % (stringify_path(path), field_type, err)
                 ) from err
+            if self._track_response_size:
+                self._count_response_value(path, _estimated_size(serialized))
+            return serialized
 
         if isinstance(field_type, EnumType):
             try:
-                return field_type.get_name(resolved_value)
+                name = field_type.get_name(resolved_value)
             except UnknownEnumValue as err:
                 raise RuntimeError(
                     'Field "%s" cannot be serialized as "%s": %s'
                     % (stringify_path(path), field_type, err)
                 ) from err
+            if self._track_response_size:
+                self._count_response_value(path, len(name) + 2)
+            return name
 
         if isinstance(field_type, GraphQLCompositeType):
             if isinstance(field_type, GraphQLAbstractType):
@@ -352,6 +1142,9 @@ class Executor(ResolutionContext):
             else:
                 runtime_type = cast(ObjectType, field_type)
 
+            if self._track_response_size:
+                self._count_response_value(path, 2)
+
             return self.execute_fields(
                 runtime_type,
                 resolved_value,
@@ -386,3 +1179,79 @@ class Executor(ResolutionContext):
                 )
             )
         return resolved_value
+
+
+_MISSING = object()
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _raise_copy(err: ResolverError) -> None:
+    raise copy.copy(err)
+
+
+def _raise_timeout(path: ResponsePath) -> None:
+    # Errors raised for batch resolvers are shared by all the parent values
+    # and mention the path of the first one.
+    raise ResolverTimeout('Field "%s" timed out' % stringify_path(path))
+
+
+def _estimated_size(value: Any) -> int:
+    # Rough size of a serialized leaf value once JSON encoded.
+    if isinstance(value, str):
+        return len(value) + 2
+    elif value is None or value is True:
+        return 4
+    elif value is False:
+        return 5
+    elif isinstance(value, int):
+        return len(str(value))
+    elif isinstance(value, float):
+        return 8
+    return len(str(value))
+
+
+class _BatchError:
+    # Wraps an error raised by a batch resolver for a given parent value.
+    __slots__ = ("error",)
+
+    def __init__(self, error: ResolverError):
+        self.error = error
+
+
+def _unwrap_batched_value(value: Any) -> Any:
+    if type(value) is _BatchError:
+        raise copy.copy(value.error)
+    return value
+
+
+def _uses_batch_resolver(field_definition: Field, resolver: Resolver) -> bool:
+    if resolver is field_definition.batch_resolver:
+        return True
+    return is_batch_resolver(resolver)
+
+
+def is_leaf_list_item_type(type_: GraphQLType) -> bool:
+    """
+    Check whether list items of a given type can be completed in bulk.
+
+    This is the case for scalars and enums, whether they are nullable or not.
+    """
+    if isinstance(type_, NonNullType):
+        type_ = type_.type
+    return isinstance(type_, (ScalarType, EnumType))
+
+
+def _class_determines_typename(cls: type) -> bool:
+    # Whether the `__typename__` looked up on instances of a class (outside of
+    # their `__dict__`) is guaranteed to be the same for all instances, i.e.
+    # it's either missing or a plain class attribute.
+    try:
+        class_attribute = cls.__typename__  # type: ignore
+    except AttributeError:
+        return not hasattr(cls, "__getattr__")
+    return class_attribute is None or isinstance(
+        class_attribute, (str, ObjectType)
+    )
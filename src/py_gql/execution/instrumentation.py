@@ -71,6 +71,29 @@ class Instrumentation:
         This will be called after field resolution ends.
         """
 
+    def on_field_cancelled(
+        self, root: Any, context: Any, info: ResolveInfo
+    ) -> None:  # noqa: D401
+        """
+        This will be called instead of :meth:`on_field_end` when the resolver
+        was still running when the runtime cancelled it.
+
+        This happens when a sibling field raised an error aborting the
+        execution and the runtime supports cancellation (see
+        :meth:`py_gql.execution.runtime.Runtime.handle_cancellation`).
+        """
+
+    def on_response_size(self, nodes: int, size: int) -> None:  # noqa: D401
+        """
+        This will be called with the size of the response once the execution
+        result is ready or when the execution is aborted for exceeding the
+        response limits.
+
+        Args:
+            nodes: Number of values (fields and list entries) completed.
+            size: Estimated size of the JSON encoded response in bytes.
+        """
+
 
 class MultiInstrumentation(Instrumentation):
     """
@@ -124,3 +147,50 @@ class MultiInstrumentation(Instrumentation):
     def on_field_end(self, root: Any, context: Any, info: ResolveInfo) -> None:
         for i in self.instrumentations[::-1]:
             i.on_field_end(root, context, info)
+
+    def on_field_cancelled(
+        self, root: Any, context: Any, info: ResolveInfo
+    ) -> None:
+        for i in self.instrumentations[::-1]:
+            i.on_field_cancelled(root, context, info)
+
+    def on_response_size(self, nodes: int, size: int) -> None:
+        for i in self.instrumentations:
+            i.on_response_size(nodes, size)
+
+
+def implements_hook(instrumentation: Instrumentation, name: str) -> bool:
+    """
+    Check whether an instrumentation overrides one of the hooks of
+    :class:`Instrumentation`, looking into the instrumentations combined by
+    :class:`MultiInstrumentation`.
+
+    This is used by executors to skip work which is only required to call
+    some hooks when no instrumentation implements them.
+
+    >>> class Tracker(Instrumentation):
+    ...     def on_field_cancelled(self, root, context, info):
+    ...         pass
+    >>> implements_hook(Tracker(), "on_field_cancelled")
+    True
+    >>> implements_hook(Tracker(), "on_field_end")
+    False
+    >>> implements_hook(
+    ...     MultiInstrumentation(Instrumentation(), Instrumentation()),
+    ...     "on_field_cancelled",
+    ... )
+    False
+    >>> implements_hook(
+    ...     MultiInstrumentation(Instrumentation(), Tracker()),
+    ...     "on_field_cancelled",
+    ... )
+    True
+    """
+    if isinstance(instrumentation, MultiInstrumentation):
+        return any(
+            implements_hook(inner, name)
+            for inner in instrumentation.instrumentations
+        )
+    return getattr(type(instrumentation), name) is not getattr(
+        Instrumentation, name
+    )
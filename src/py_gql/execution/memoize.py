@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Per execution resolver memoization.
+
+Resolvers marked with :func:`memoize` are called at most once per execution
+for a given field, parent value and set of arguments, e.g. when the same
+field is selected multiple times through aliases or fragments:
+
+>>> @memoize
+... def resolve_viewer(root, ctx, info):
+...     return load_user(ctx.user_id)
+
+Use :func:`memoize_by` to control how calls are identified.
+
+Concurrent duplicate calls share the same pending value (see
+:meth:`py_gql.execution.runtime.Runtime.share_value`). Errors raised
+synchronously by the resolver are not memoized.
+
+Memoized values are only kept for the duration of the execution; see
+:mod:`py_gql.execution.cache` to reuse values across executions.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from .cache import _freeze
+
+
+Fn = TypeVar("Fn", bound=Callable[..., Any])
+MemoKey = Callable[[Any, Dict[str, Any]], Hashable]
+
+_MEMOIZE_ATTR = "__py_gql_memoize__"
+
+
+def default_memo_key(parent_value: Any, args: Dict[str, Any]) -> Hashable:
+    """
+    Identify a call through the identity of the parent value and the value
+    of the arguments.
+
+    Parent values are compared by identity as they are usually not hashable;
+    this means that equal but distinct parent values are not deduplicated.
+    """
+    return id(parent_value), _freeze(args)
+
+
+def memoize(func: Fn) -> Fn:
+    """
+    Mark a resolver to be called at most once per execution for a given
+    field, parent value and set of arguments.
+
+    Calls are identified with :func:`default_memo_key`, use :func:`memoize_by`
+    to customise this.
+
+    >>> @memoize
+    ... def resolver(root, ctx, info, **args):
+    ...     pass
+
+    >>> get_memo_key(resolver) is default_memo_key
+    True
+
+    """
+    setattr(func, _MEMOIZE_ATTR, default_memo_key)
+    return func
+
+
+def memoize_by(key: MemoKey) -> Callable[[Fn], Fn]:
+    """
+    Mark a resolver as memoized using a custom key function.
+
+    >>> @memoize_by(lambda root, args: (root["id"], args.get("first")))
+    ... def resolver(root, ctx, info, **args):
+    ...     pass
+
+    Args:
+        key: Function used to compute the memoization key from the parent
+            value and the coerced arguments. It must return a hashable value.
+
+    Returns:
+        Decorator which marks the resolver and returns it unchanged.
+    """
+
+    def decorator(func: Fn) -> Fn:
+        setattr(func, _MEMOIZE_ATTR, key)
+        return func
+
+    return decorator
+
+
+def get_memo_key(func: Callable[..., Any]) -> Optional[MemoKey]:
+    """
+    Return the memoization key function of a resolver marked with
+    :func:`memoize`, if any.
+    """
+    return getattr(func, _MEMOIZE_ATTR, None)
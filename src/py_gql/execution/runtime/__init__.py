@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
+from . import hints
 from .asyncio import AsyncIORuntime
 from .base import Runtime, SubscriptionRuntime
 from .blocking import BlockingRuntime
+from .processpool import ProcessPoolRuntime
+from .streams import StreamBuffer
 from .threadpool import ThreadPoolRuntime
 
 
@@ -11,4 +14,7 @@ __all__ = [
     "BlockingRuntime",
     "AsyncIORuntime",
     "ThreadPoolRuntime",
+    "ProcessPoolRuntime",
+    "StreamBuffer",
+    "hints",
 ]
@@ -1,13 +1,20 @@
 # -*- coding: utf-8 -*-
 import asyncio
+import collections
 import functools as ft
-from inspect import isawaitable, iscoroutinefunction
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from inspect import isawaitable, iscoroutine, iscoroutinefunction
 from typing import (
     Any,
     AsyncIterable,
     AsyncIterator,
     Awaitable,
     Callable,
+    Coroutine,
+    Deque,
+    Dict,
     Iterable,
     List,
     Optional,
@@ -19,6 +26,8 @@ from typing import (
 )
 
 from .base import SubscriptionRuntime
+from .hints import get_max_concurrency, is_non_blocking
+from .streams import BLOCK, DROP_NEWEST, StreamBuffer
 
 
 T = TypeVar("T")
@@ -28,33 +37,235 @@ AnyFn = Callable[..., Any]
 AnyFnGen = Callable[..., T]
 MaybeAwaitable = Union[Awaitable[T], T]
 
+# Only available from Python 3.12.
+_eager_task_factory = getattr(
+    asyncio, "eager_task_factory", None
+)  # type: Optional[Callable[..., asyncio.Future[Any]]]
+
+
+class ThreadPoolStats:
+    """
+    Statistics about synchronous functions offloaded to threads.
+
+    Attributes:
+        submitted (int): Number of function calls submitted so far.
+        completed (int): Number of function calls which have finished running.
+        queued (int): Number of function calls waiting for a thread.
+        max_queued (int): Highest observed value of :attr:`queued`.
+        running (int): Number of function calls currently running.
+        total_wait_time (float): Cumulated time in seconds that function calls
+            spent waiting for a thread.
+        max_wait_time (float): Longest time in seconds that a single function
+            call spent waiting for a thread.
+    """
+
+    __slots__ = (
+        "submitted",
+        "completed",
+        "queued",
+        "max_queued",
+        "running",
+        "total_wait_time",
+        "max_wait_time",
+        "_lock",
+    )
+
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.completed = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.running = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def average_wait_time(self) -> float:
+        """
+        Average time in seconds that function calls spent waiting for a thread.
+        """
+        started = self.submitted - self.queued
+        return self.total_wait_time / started if started else 0.0
+
+    def _on_submit(self) -> None:
+        with self._lock:
+            self.submitted += 1
+            self.queued += 1
+            if self.queued > self.max_queued:
+                self.max_queued = self.queued
+
+    # The state list is a single element marker shared by the different
+    # callbacks for a given function call which is used to guard against the
+    # race between a call starting and its future being cancelled.
+
+    def _on_start(self, wait_time: float, state: List[str]) -> None:
+        with self._lock:
+            if state[0] == "cancelled":
+                # The call started before the cancellation could take effect.
+                self.submitted += 1
+            else:
+                self.queued -= 1
+            state[0] = "started"
+            self.running += 1
+            self.total_wait_time += wait_time
+            if wait_time > self.max_wait_time:
+                self.max_wait_time = wait_time
+
+    def _on_end(self) -> None:
+        with self._lock:
+            self.running -= 1
+            self.completed += 1
+
+    def _on_cancel(self, state: List[str]) -> None:
+        with self._lock:
+            if state[0] == "queued":
+                self.submitted -= 1
+                self.queued -= 1
+                state[0] = "cancelled"
+
 
 class AsyncIORuntime(SubscriptionRuntime):
     """
     Executor implementation to work with Python's asyncio module.
+
+    Args:
+        loop: Event loop to use, defaults to the current event loop.
+        execute_blocking_functions_in_thread: If ``True``, non async
+            resolvers will be executed in a thread pool, unless they are
+            marked with :func:`~py_gql.execution.runtime.hints.non_blocking`.
+        max_concurrency: Maximum number of resolvers which can run
+            concurrently (across all executions using this runtime).
+            Resolvers over the limit wait for a running one to complete before
+            starting; resolved values are still gathered in order.
+            Use :func:`~py_gql.execution.runtime.hints.max_concurrency` to
+            set a limit for specific resolvers.
+        executor: Executor used to run non async resolvers.
+            Defaults to the loop's default executor unless ``max_workers`` is
+            set. Using a dedicated executor isolates resolvers from other
+            users of the default executor.
+        max_workers: If set and ``executor`` isn't, the runtime will create a
+            dedicated :py:class:`concurrent.futures.ThreadPoolExecutor` with
+            this many threads.
+
+        eager: If ``True``, results which are available immediately are
+            processed synchronously instead of going through the event loop.
+            This applies to completed futures and, from Python 3.12, to
+            coroutines which return without suspending: they are started
+            as soon as they are received in their own task through
+            :py:func:`asyncio.eager_task_factory`. This avoids creating
+            intermediate coroutines, which can significantly speed up queries
+            where most async resolvers do not actually need to wait (e.g. when
+            hitting a cache).
+
+    Attributes:
+        thread_pool_stats (ThreadPoolStats): Statistics about functions
+            offloaded to threads, such as the current queue depth and wait
+            times.
     """
 
+    supports_buffered_streams = True
+
     def __init__(
         self,
         loop: Optional[asyncio.AbstractEventLoop] = None,
         execute_blocking_functions_in_thread: bool = True,
+        max_concurrency: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        eager: bool = False,
     ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                "max_concurrency must be >= 1, got %r" % max_concurrency
+            )
+
+        if executor is not None and max_workers is not None:
+            raise ValueError("Cannot set both executor and max_workers")
+
         self.loop = loop or asyncio.get_event_loop()
         self._execute_blocking_functions_in_thread = (
             execute_blocking_functions_in_thread
         )
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency)
+            if max_concurrency is not None
+            else None
+        )  # type: Optional[asyncio.Semaphore]
+        self._resolver_semaphores = (
+            {}
+        )  # type: Dict[Callable[..., Any], asyncio.Semaphore]
+
+        self._owns_executor = executor is None and max_workers is not None
+        if executor is None and max_workers is not None:
+            executor = ThreadPoolExecutor(
+                max_workers, thread_name_prefix="py_gql"
+            )
 
-    def submit(
-        self, fn: AnyFnGen[T], *args: Any, **kwargs: Any
-    ) -> MaybeAwaitable[T]:
-        if (
+        self._executor = executor
+        self.thread_pool_stats = ThreadPoolStats()
+        self._eager = eager
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shutdown the thread pool used to run non async resolvers.
+
+        This only applies to the thread pool created when ``max_workers`` is
+        set; executors provided by the caller are left untouched. The runtime
+        can also be used as a context manager to call this automatically.
+
+        Args:
+            wait: Wait for pending calls to complete before returning.
+        """
+        if self._owns_executor:
+            cast(Executor, self._executor).shutdown(wait=wait)
+
+    def __enter__(self) -> "AsyncIORuntime":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.shutdown()
+
+    def _should_run_in_thread(self, fn: Callable[..., Any]) -> bool:
+        return (
             self._execute_blocking_functions_in_thread
             and not iscoroutinefunction(fn)
-        ):
+            and not is_non_blocking(fn)
+        )
 
-            return self.loop.run_in_executor(
-                None, ft.partial(fn, *args, **kwargs)
-            )
+    def run_in_thread(
+        self, fn: AnyFnGen[T], *args: Any, **kwargs: Any
+    ) -> "asyncio.Future[T]":
+        """
+        Run a synchronous function in the runtime's executor.
+
+        This ignores hints and always offloads the function call.
+        """
+        stats = self.thread_pool_stats
+        submitted_at = time.perf_counter()
+        state = ["queued"]
+
+        def run() -> T:
+            stats._on_start(time.perf_counter() - submitted_at, state)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                stats._on_end()
+
+        def on_done(future: "asyncio.Future[T]") -> None:
+            if future.cancelled():
+                stats._on_cancel(state)
+
+        stats._on_submit()
+        future = self.loop.run_in_executor(self._executor, run)
+        future.add_done_callback(on_done)
+        return future
+
+    def submit(
+        self, fn: AnyFnGen[T], *args: Any, **kwargs: Any
+    ) -> MaybeAwaitable[T]:
+        if self._should_run_in_thread(fn):
+            return self.run_in_thread(fn, *args, **kwargs)
 
         return fn(*args, **kwargs)
 
@@ -80,20 +291,38 @@ class AsyncIORuntime(SubscriptionRuntime):
         done_append = done.append
         has_pending = False
 
-        for index, value in enumerate(values):
-            if _isawaitable_fast(value):
-                has_pending = True
-                pending_append(cast(Awaitable[T], value))
-                pending_idx_append(index)
-
-            done_append(cast(T, value))
+        try:
+            for index, value in enumerate(values):
+                if _isawaitable_fast(value):
+                    has_pending = True
+                    pending_append(cast(Awaitable[T], value))
+                    pending_idx_append(index)
+
+                done_append(cast(T, value))
+        except Exception:
+            # Pending values will never be awaited.
+            for awaitable in pending:
+                if iscoroutine(awaitable):
+                    cast(Coroutine[Any, Any, T], awaitable).close()
+                elif isinstance(awaitable, asyncio.Future):
+                    awaitable.cancel()
+            raise
 
         if has_pending:
 
             async def _await_values() -> Iterable[T]:
-                for i, awaited in zip(
-                    pending_idx, await asyncio.gather(*pending)
-                ):
+                futures = [
+                    asyncio.ensure_future(awaitable) for awaitable in pending
+                ]
+                try:
+                    results = await asyncio.gather(*futures)
+                except BaseException:
+                    # Results of the other values will be discarded.
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+                for i, awaited in zip(pending_idx, results):
                     done[i] = awaited
                 return done
 
@@ -110,6 +339,17 @@ class AsyncIORuntime(SubscriptionRuntime):
 
         if _isawaitable_fast(value):
 
+            if self._eager:
+                try:
+                    done, value = _await_now(cast(Awaitable[T], value))
+                except Exception as err:
+                    if else_ and isinstance(err, else_[0]):
+                        return else_[1](err)
+                    raise
+
+                if done:
+                    return self.map_value(value, then, else_)
+
             async def _await_value() -> G:
                 try:
                     return then(await cast(Awaitable[T], value))
@@ -130,6 +370,14 @@ class AsyncIORuntime(SubscriptionRuntime):
     def unwrap_value(self, value):
         if _isawaitable_fast(value):
 
+            if self._eager:
+                done = True
+                while done and _isawaitable_fast(value):
+                    done, value = _await_now(value)
+
+                if done:
+                    return value
+
             async def _await_value():
                 cur = await value
                 while _isawaitable_fast(cur):
@@ -141,28 +389,123 @@ class AsyncIORuntime(SubscriptionRuntime):
 
         return value
 
+    def with_timeout(
+        self,
+        value: MaybeAwaitable[T],
+        timeout: float,
+        on_timeout: Callable[[], T],
+    ) -> MaybeAwaitable[T]:
+        if not _isawaitable_fast(value):
+            return value
+
+        async def _await_value() -> T:
+            try:
+                return await asyncio.wait_for(
+                    cast(Awaitable[T], value), max(timeout, 0)
+                )
+            except asyncio.TimeoutError:
+                return on_timeout()
+
+        return _await_value()
+
+    def handle_cancellation(
+        self, value: MaybeAwaitable[T], callback: Callable[[], None]
+    ) -> MaybeAwaitable[T]:
+        if not _isawaitable_fast(value):
+            return value
+
+        async def _await_value() -> T:
+            try:
+                return await cast(Awaitable[T], value)
+            except asyncio.CancelledError:
+                callback()
+                raise
+
+        return _await_value()
+
+    def share_value(self, value: MaybeAwaitable[T]) -> MaybeAwaitable[T]:
+        if not _isawaitable_fast(value) or isinstance(value, _Shared):
+            return value
+
+        if self._eager:
+            done, value = _await_now(cast(Awaitable[T], value))
+            if done:
+                return value
+
+        return _Shared(asyncio.ensure_future(cast(Awaitable[T], value)))
+
     def map_stream(
         self,
         source_stream: AsyncIterator[T],
         map_value: Callable[[T], Awaitable[G]],
+        buffer: Optional[StreamBuffer] = None,
     ) -> AsyncIterable[G]:
+        if buffer is not None:
+            return BufferedAsyncMap(source_stream, map_value, buffer)
         return AsyncMap(source_stream, map_value)
 
     def wrap_callable(self, func: Callable[..., Any]) -> Callable[..., Any]:
-        if (
-            self._execute_blocking_functions_in_thread
-            and not iscoroutinefunction(func)
-        ):
+        semaphores = self._semaphores_for(func)
+
+        if self._should_run_in_thread(func):
+
+            call_in_thread = ft.partial(self.run_in_thread, func)
+
+            if semaphores:
+                return ft.partial(_call_limited, semaphores, call_in_thread)
 
             async def wrapped(*args, **kwargs):
-                return await self.loop.run_in_executor(
-                    None, ft.partial(func, *args, **kwargs)
-                )
+                return await call_in_thread(*args, **kwargs)
 
             return wrapped
 
+        if semaphores:
+            return ft.partial(_call_limited, semaphores, func)
+
         return func
 
+    def _semaphores_for(
+        self, func: Callable[..., Any]
+    ) -> List[asyncio.Semaphore]:
+        # Resolver specific semaphore (if any) is always acquired first to
+        # avoid deadlocks.
+        semaphores = []
+
+        limit = get_max_concurrency(func)
+        if limit is not None:
+            try:
+                semaphore = self._resolver_semaphores[func]
+            except KeyError:
+                semaphore = asyncio.Semaphore(limit)
+                self._resolver_semaphores[func] = semaphore
+            semaphores.append(semaphore)
+
+        if self._semaphore is not None:
+            semaphores.append(self._semaphore)
+
+        return semaphores
+
+
+async def _call_limited(
+    semaphores: List[asyncio.Semaphore],
+    func: Callable[..., Any],
+    *args: Any,
+    **kwargs: Any
+) -> Any:
+    acquired = []  # type: List[asyncio.Semaphore]
+    try:
+        for semaphore in semaphores:
+            await semaphore.acquire()
+            acquired.append(semaphore)
+
+        result = func(*args, **kwargs)
+        if _isawaitable_fast(result):
+            return await result
+        return result
+    finally:
+        for semaphore in reversed(acquired):
+            semaphore.release()
+
 
 # This is helper class is necessary because we cannot use async generators in
 # order to support Python 3.5.
@@ -181,6 +524,179 @@ class AsyncMap:
             await type(self.source_stream).__anext__(self.source_stream)
         )
 
+    async def aclose(self):
+        # Propagate to the source stream (e.g. async generators) so that it can
+        # release its resources.
+        aclose = getattr(self.source_stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+class BufferedAsyncMap:
+    """
+    Asynchronous iterator mapping values from a source stream, pulling them
+    in the background and mapping up to ``buffer.concurrency`` values ahead
+    of the consumer (see :mod:`py_gql.execution.runtime.streams`).
+
+    The source stream is consumed from a separate task which is started on
+    the first iteration and stopped by :meth:`aclose`.
+
+    Attributes:
+        dropped (int): Number of source values discarded according to the
+            buffer policy.
+    """
+
+    def __init__(
+        self,
+        source_stream: AsyncIterator[Any],
+        map_value: Callable[[Any], Awaitable[Any]],
+        buffer: StreamBuffer,
+    ):
+        self.source_stream = source_stream
+        self.map_value = map_value
+        self.buffer = buffer
+        self.dropped = 0
+        # Source values waiting to be mapped.
+        self._queue = collections.deque()  # type: Deque[Any]
+        # Values being mapped, in order.
+        self._mapped = collections.deque()  # type: Deque[asyncio.Future[Any]]
+        self._producer = None  # type: Optional[asyncio.Future[None]]
+        self._error = None  # type: Optional[Exception]
+        self._exhausted = False
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._producer is None:
+            self._producer = asyncio.ensure_future(self._produce())
+
+        while not self._mapped:
+            if self._error is not None:
+                err, self._error = self._error, None
+                raise err
+            if self._exhausted:
+                raise StopAsyncIteration()
+            self._readable.clear()
+            await self._readable.wait()
+
+        # The value is only released once consumed so that it counts towards
+        # the concurrency limit.
+        try:
+            return await self._mapped[0]
+        finally:
+            if self._mapped:
+                self._mapped.popleft()
+                self._schedule()
+
+    async def aclose(self):
+        producer = self._producer
+        if producer is not None:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+        for value in self._mapped:
+            value.cancel()
+        self._mapped.clear()
+        self._queue.clear()
+        self._exhausted = True
+
+        aclose = getattr(self.source_stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def _produce(self):
+        queue = self._queue
+        max_size = self.buffer.max_size
+        policy = self.buffer.policy
+        source_stream = self.source_stream
+        anext = type(source_stream).__anext__
+
+        try:
+            while True:
+                try:
+                    value = await anext(source_stream)
+                except StopAsyncIteration:
+                    return
+
+                if len(queue) >= max_size:
+                    if policy == BLOCK:
+                        while len(queue) >= max_size:
+                            self._writable.clear()
+                            await self._writable.wait()
+                    elif policy == DROP_NEWEST:
+                        self.dropped += 1
+                        continue
+                    else:
+                        # DROP_OLDEST and COALESCE
+                        queue.popleft()
+                        self.dropped += 1
+
+                queue.append(value)
+                self._schedule()
+        except Exception as err:
+            self._error = err
+        finally:
+            self._exhausted = True
+            self._readable.set()
+
+    def _schedule(self):
+        # Start mapping queued values up to the concurrency limit.
+        queue, mapped = self._queue, self._mapped
+        while queue and len(mapped) < self.buffer.concurrency:
+            mapped.append(
+                asyncio.ensure_future(self.map_value(queue.popleft()))
+            )
+            self._readable.set()
+        if len(queue) < self.buffer.max_size:
+            self._writable.set()
+
+
+def _await_now(value: Awaitable[T]) -> Tuple[bool, MaybeAwaitable[T]]:
+    # Try to get the result of a value without going through the event loop.
+    # This returns a tuple of (True, result) when the result was available
+    # immediately and (False, awaitable) otherwise, in which case the returned
+    # awaitable must be used in place of the original value.
+    if isinstance(value, asyncio.Future):
+        if value.done():
+            return True, value.result()
+        return False, value
+
+    if _eager_task_factory is not None and iscoroutine(value):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False, value
+        # The coroutine runs in its own task (so that the current task,
+        # timeouts and context variables behave as they would otherwise)
+        # which is started synchronously until it first suspends.
+        task = _eager_task_factory(loop, value)
+        if task.done():
+            return True, task.result()
+        return False, task
+
+    return False, value
+
+
+class _Shared:
+    """
+    Awaitable wrapping a task which can be awaited by any number of
+    consumers. Cancelling one of them doesn't cancel the task, which keeps
+    running for the others.
+    """
+
+    __slots__ = ("task",)
+
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+
+    def __await__(self):
+        return asyncio.shield(self.task).__await__()
+
 
 def _isawaitable_fast(value, cache={}, __isawaitable=isawaitable):
     # This is faster than the default isawaitable which is benefitial for the
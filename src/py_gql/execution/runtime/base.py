@@ -3,6 +3,8 @@
 import abc
 from typing import Any, Callable, Iterable, Optional, Tuple, Type, TypeVar
 
+from .streams import StreamBuffer
+
 
 T = TypeVar("T")
 E = TypeVar("E", bound=Exception)
@@ -76,6 +78,59 @@ class Runtime(abc.ABC):
         """
         raise NotImplementedError()
 
+    def handle_cancellation(
+        self, value: Any, callback: Callable[[], None]
+    ) -> Any:
+        """
+        Register a callback to be called if a wrapped value is cancelled.
+
+        Runtimes supporting cancellation cancel outstanding values when
+        gathered sibling values fail, as their results are going to be
+        discarded. This is used to notify instrumentation.
+
+        The default implementation (for runtimes which do not support
+        cancellation) returns the value unchanged and never calls
+        ``callback``.
+
+        Returns:
+            The value to use in place of ``value``.
+        """
+        return value
+
+    def with_timeout(
+        self, value: Any, timeout: float, on_timeout: Callable[[], Any]
+    ) -> Any:
+        """
+        Bound how long a wrapped value can take to complete.
+
+        If ``value`` isn't available after ``timeout`` seconds, runtimes
+        should cancel the underlying work (or abandon it if it cannot be
+        cancelled) and use the result of calling ``on_timeout`` in its place;
+        exceptions raised by ``on_timeout`` must propagate as if raised by
+        ``value``.
+
+        The default implementation, suitable for runtimes where values are
+        always available immediately, returns the value unchanged.
+        """
+        return value
+
+    def share_value(self, value: Any) -> Any:
+        """
+        Make a wrapped value safe to be consumed multiple times.
+
+        This is used to share the result of a single call between multiple
+        consumers (e.g. memoized resolvers): every consumer goes through
+        :meth:`map_value` or :meth:`unwrap_value` on the returned value and
+        the underlying work must only run once. Runtimes supporting
+        cancellation should not cancel the underlying work when a single
+        consumer is cancelled.
+
+        The default implementation, suitable for runtimes where wrapped values
+        can be consumed multiple times (such as futures), returns the value
+        unchanged.
+        """
+        return value
+
     @abc.abstractmethod
     def wrap_callable(self, func: AnyFn) -> AnyFn:
         """
@@ -93,10 +148,27 @@ class SubscriptionRuntime(Runtime):
     that subscriptions are available.
     """
 
+    #: Whether :meth:`map_stream` supports the ``buffer`` argument.
+    supports_buffered_streams = False
+
     @abc.abstractmethod
     def map_stream(
-        self, source_stream: Any, map_value: Callable[[Any], Any]
+        self,
+        source_stream: Any,
+        map_value: Callable[[Any], Any],
+        buffer: Optional[StreamBuffer] = None,
     ) -> Any:
         """
-        Apply a mapping function to a stream / iterable of values."""
+        Apply a mapping function to a stream / iterable of values.
+
+        Args:
+            source_stream: Stream of values.
+            map_value: Mapping function.
+            buffer: If set, values should be pulled from the source stream and
+                mapped ahead of the consumer according to this configuration
+                (see :mod:`py_gql.execution.runtime.streams`). Only used
+                when :attr:`supports_buffered_streams` is set, runtimes which
+                do not support this should raise
+                :py:class:`NotImplementedError`.
+        """
         raise NotImplementedError()
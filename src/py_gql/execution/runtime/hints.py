@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Resolver hints.
+
+Hints are attributes attached to resolver functions which runtimes can use to
+decide how to schedule them. They are purely advisory: a runtime which doesn't
+support a given hint will ignore it and resolvers should behave the same
+(modulo performance characteristics) regardless of the runtime.
+"""
+
+from typing import Any, Callable, Optional, TypeVar
+
+
+Fn = TypeVar("Fn", bound=Callable[..., Any])
+
+_MAX_CONCURRENCY_ATTR = "__py_gql_max_concurrency__"
+_NON_BLOCKING_ATTR = "__py_gql_non_blocking__"
+_TIMEOUT_ATTR = "__py_gql_timeout__"
+
+
+def max_concurrency(limit: int) -> Callable[[Fn], Fn]:
+    """
+    Limit how many calls to the decorated resolver can run concurrently.
+
+    This is supported by :class:`~py_gql.execution.runtime.AsyncIORuntime` and
+    applies across all executions sharing the same runtime instance.
+
+    >>> @max_concurrency(10)
+    ... async def resolver(root, ctx, info):
+    ...     pass
+
+    >>> get_max_concurrency(resolver)
+    10
+
+    Args:
+        limit: Maximum number of concurrent calls.
+
+    Returns:
+        Decorator which marks the resolver and returns it unchanged.
+
+    Raises:
+        ValueError: If ``limit`` is lower than 1.
+    """
+    if limit < 1:
+        raise ValueError("Concurrency limit must be >= 1, got %r" % limit)
+
+    def decorator(func: Fn) -> Fn:
+        setattr(func, _MAX_CONCURRENCY_ATTR, limit)
+        return func
+
+    return decorator
+
+
+def get_max_concurrency(func: Callable[..., Any]) -> Optional[int]:
+    """
+    Extract the concurrency limit set with :func:`max_concurrency`.
+
+    Returns:
+        ``None`` if no limit was set.
+    """
+    return getattr(func, _MAX_CONCURRENCY_ATTR, None)
+
+
+def timeout(seconds: float) -> Callable[[Fn], Fn]:
+    """
+    Limit how long the decorated resolver can take to produce its value.
+
+    Unlike other hints, this is enforced by the executor for all built-in
+    runtimes: once the timeout expires the pending value is cancelled (or
+    abandoned if the runtime cannot cancel it) and the field is reported as
+    failed with a :class:`~py_gql.exc.ResolverTimeout` error. Synchronous
+    resolvers running in the current thread (e.g. with
+    :class:`~py_gql.execution.runtime.BlockingRuntime`) cannot be interrupted.
+
+    >>> @timeout(0.5)
+    ... async def resolver(root, ctx, info):
+    ...     pass
+
+    >>> get_timeout(resolver)
+    0.5
+
+    Args:
+        seconds: Maximum duration in seconds.
+
+    Returns:
+        Decorator which marks the resolver and returns it unchanged.
+
+    Raises:
+        ValueError: If ``seconds`` isn't positive.
+    """
+    if seconds <= 0:
+        raise ValueError("Timeout must be > 0, got %r" % seconds)
+
+    def decorator(func: Fn) -> Fn:
+        setattr(func, _TIMEOUT_ATTR, seconds)
+        return func
+
+    return decorator
+
+
+def get_timeout(func: Callable[..., Any]) -> Optional[float]:
+    """
+    Extract the timeout set with :func:`timeout`.
+
+    Returns:
+        ``None`` if no timeout was set.
+    """
+    return getattr(func, _TIMEOUT_ATTR, None)
+
+
+def non_blocking(func: Fn) -> Fn:
+    """
+    Mark a synchronous resolver as cheap and safe to call inline.
+
+    Runtimes which offload synchronous resolvers to threads (such as
+    :class:`~py_gql.execution.runtime.AsyncIORuntime` and
+    :class:`~py_gql.execution.runtime.ThreadPoolRuntime`) will call resolvers
+    marked this way directly instead, avoiding the cost of a thread hop for
+    trivial computations such as attribute lookups. Only use this for
+    resolvers which do not perform any blocking I/O.
+
+    >>> @non_blocking
+    ... def resolver(root, ctx, info):
+    ...     return root.value
+
+    >>> is_non_blocking(resolver)
+    True
+
+    """
+    setattr(func, _NON_BLOCKING_ATTR, True)
+    return func
+
+
+def is_non_blocking(func: Callable[..., Any]) -> bool:
+    """
+    Check whether a resolver has been marked with :func:`non_blocking`.
+    """
+    return getattr(func, _NON_BLOCKING_ATTR, False)
+
+
+_CPU_BOUND_ATTR = "__py_gql_cpu_bound__"
+
+
+def cpu_bound(func: Fn) -> Fn:
+    """
+    Mark a synchronous resolver as CPU bound.
+
+    Runtimes which support it (such as
+    :class:`~py_gql.execution.runtime.ProcessPoolRuntime`) will run resolvers
+    marked this way in a separate process, side stepping the GIL.
+
+    As the call has to be sent to another process, the resolver must be
+    picklable (i.e. defined at the module level), only receives the parent
+    value and field arguments (``context`` and ``info`` will be ``None``) and
+    all of these, as well as its return value, must be picklable. Other
+    runtimes call the resolver as usual, so it should not rely on the
+    ``context`` and ``info`` arguments either way.
+
+    >>> @cpu_bound
+    ... def resolver(root, ctx, info):
+    ...     return sum(i * i for i in range(root))
+
+    >>> is_cpu_bound(resolver)
+    True
+
+    """
+    setattr(func, _CPU_BOUND_ATTR, True)
+    return func
+
+
+def is_cpu_bound(func: Callable[..., Any]) -> bool:
+    """
+    Check whether a resolver has been marked with :func:`cpu_bound`.
+    """
+    return getattr(func, _CPU_BOUND_ATTR, False)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import functools
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from .hints import is_cpu_bound
+from .threadpool import ThreadPoolRuntime
+
+
+class ProcessPoolRuntime(ThreadPoolRuntime):
+    """
+    Runtime implementation which executes CPU bound resolvers in a process
+    pool.
+
+    Resolvers marked with :func:`~py_gql.execution.runtime.hints.cpu_bound`
+    are submitted to a :py:class:`concurrent.futures.ProcessPoolExecutor`
+    which allows them to run in parallel regardless of the GIL. Everything
+    else runs locally in a thread pool, exactly as with
+    :class:`~py_gql.execution.runtime.ThreadPoolRuntime` and resulting futures
+    are chained in the same way.
+
+    Calls to CPU bound resolvers are made with the parent value and field
+    arguments only (``context`` and ``info`` are not sent to the worker
+    process and will be ``None``); these as well as the resolver and its
+    return value must be picklable.
+
+    Args:
+        max_workers: Number of worker processes, forwarded to
+            :py:class:`concurrent.futures.ProcessPoolExecutor`.
+        executor: Executor used to run CPU bound resolvers. Defaults to
+            a new :py:class:`concurrent.futures.ProcessPoolExecutor`. Use this
+            to share a process pool between runtimes or configure it further.
+        thread_max_workers: Number of threads used to run other resolvers,
+            forwarded to :py:class:`concurrent.futures.ThreadPoolExecutor`.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        thread_max_workers: Optional[int] = None,
+    ):
+        if executor is not None and max_workers is not None:
+            raise ValueError("Cannot set both executor and max_workers.")
+
+        super().__init__(max_workers=thread_max_workers)
+        self._processes = (
+            executor
+            if executor is not None
+            else ProcessPoolExecutor(max_workers=max_workers)
+        )  # type: Executor
+        self._owns_processes = executor is None
+
+    def wrap_callable(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        if is_cpu_bound(func):
+            return functools.partial(self._submit_cpu_bound, func)
+        return super().wrap_callable(func)
+
+    def _submit_cpu_bound(
+        self, func: Callable[..., Any], root: Any, *_: Any, **args: Any
+    ) -> "Future[Any]":
+        return self._processes.submit(_call_cpu_bound, func, root, args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shutdown the underlying thread and process pools.
+
+        The process pool is only shutdown if it was created by the runtime.
+
+        Args:
+            wait: Wait for pending calls to complete before returning.
+        """
+        self._inner.shutdown(wait=wait)
+        if self._owns_processes:
+            self._processes.shutdown(wait=wait)
+
+
+def _call_cpu_bound(
+    func: Callable[..., Any], root: Any, args: Dict[str, Any]
+) -> Any:
+    return func(root, None, None, **args)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Buffering of subscription streams.
+
+By default, response streams pull an event from the source stream, execute it
+and wait for it to be consumed before pulling the next one: a slow consumer
+stalls the source. :class:`StreamBuffer` configures response streams to pull
+events in the background instead, buffering them according to one of the
+following policies when the consumer falls behind:
+
+- :data:`BLOCK`: stop pulling from the source stream until there is space in
+  the buffer (i.e. apply backpressure to the source).
+- :data:`DROP_OLDEST`: discard the oldest buffered event.
+- :data:`DROP_NEWEST`: discard the incoming event.
+- :data:`COALESCE`: only keep the latest event, replacing any buffered event.
+
+Buffered events are executed concurrently (up to ``concurrency`` events
+ahead of the consumer) and always delivered in order.
+
+>>> buffer = StreamBuffer(max_size=100, policy=DROP_OLDEST, concurrency=4)
+>>> # subscribe(..., runtime=AsyncIORuntime(), buffer=buffer)
+"""
+
+
+BLOCK = "BLOCK"
+DROP_OLDEST = "DROP_OLDEST"
+DROP_NEWEST = "DROP_NEWEST"
+COALESCE = "COALESCE"
+
+_POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST, COALESCE)
+
+
+class StreamBuffer:
+    """
+    Buffering configuration for a response stream.
+
+    Args:
+        max_size: Maximum number of events waiting to be executed.
+            Ignored for :data:`COALESCE` which keeps at most one event.
+        policy: What to do with incoming events when the buffer is full.
+        concurrency: Maximum number of events executed (or waiting to be
+            consumed) concurrently.
+    """
+
+    __slots__ = ("max_size", "policy", "concurrency")
+
+    def __init__(
+        self, max_size: int = 1, policy: str = BLOCK, concurrency: int = 1
+    ):
+        if policy not in _POLICIES:
+            raise ValueError(
+                "Invalid buffer policy %r, expected one of %s"
+                % (policy, ", ".join(_POLICIES))
+            )
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1, got %r" % max_size)
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1, got %r" % concurrency)
+
+        self.max_size = 1 if policy == COALESCE else max_size
+        self.policy = policy
+        self.concurrency = concurrency
+
+    def __repr__(self) -> str:
+        return "StreamBuffer(max_size=%d, policy=%s, concurrency=%d)" % (
+            self.max_size,
+            self.policy,
+            self.concurrency,
+        )
@@ -1,10 +1,16 @@
 # -*- coding: utf-8 -*-
 
 import functools
+import heapq
+import itertools
+import threading
+import time
 from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import (
     Any,
     Callable,
+    Generic,
     Iterable,
     List,
     Optional,
@@ -16,12 +22,13 @@ from typing import (
 )
 
 from .base import Runtime
+from .hints import is_non_blocking
 
 
 T = TypeVar("T")
 G = TypeVar("G")
 E = TypeVar("E", bound=Exception)
-MaybeFuture = Union["Future[T]", T]
+MaybeFuture = Union["Future[T]", "Deferred[T]", T]
 
 
 class ThreadPoolRuntime(Runtime):
@@ -29,7 +36,14 @@ class ThreadPoolRuntime(Runtime):
     Runtime implementation which executes in a thread pool.
 
     This offloads every function passed to it in a thread pool by wrapping
-    :py:class:`concurrent.futures.ThreadPoolExecutor`.
+    :py:class:`concurrent.futures.ThreadPoolExecutor`, unless it has been
+    marked with :func:`~py_gql.execution.runtime.hints.non_blocking` in which
+    case it is called inline.
+
+    Intermediate values are chained through lightweight :class:`Deferred`
+    objects and values which are already available are processed
+    synchronously; only the final result of an execution is exposed as a
+    :py:class:`concurrent.futures.Future`.
 
     All init arguments will be forwarded to
     :py:class:`concurrent.futures.ThreadPoolExecutor`.
@@ -43,6 +57,8 @@ class ThreadPoolRuntime(Runtime):
 
     def ensure_wrapped(self, value):
         if _is_future_fast(value):
+            if isinstance(value, Deferred):
+                return value.as_future()
             return value
 
         outer = Future()  # type: ignore
@@ -58,11 +74,264 @@ class ThreadPoolRuntime(Runtime):
     def unwrap_value(self, value):
         return unwrap_future(value)
 
-    def wrap_callable(self, func):
+    def with_timeout(self, value, timeout, on_timeout):
+        if not _is_future_fast(value) or value.done():
+            return value
+
+        target = Deferred(value)  # type: ignore
+
+        def on_done(f):
+            # Release the timer, and through it the value, right away.
+            _TIMEOUTS.cancel(timer)
+            try:
+                r = f.result()
+            except CancelledError:
+                target.cancel()
+            except Exception as err:
+                target.set_exception(err)
+            else:
+                target.set_result(r)
+
+        def expire():
+            if target.done():
+                return
+            try:
+                r = on_timeout()
+            except Exception as err:
+                target.set_exception(err)
+            else:
+                target.set_result(r)
+            # Abandon the value, this is a no-op if it is already running.
+            value.cancel()
+
+        timer = _TIMEOUTS.schedule(timeout, expire)
+        value.add_done_callback(on_done)
+        return target
+
+    def share_value(self, value):
+        if not _is_future_fast(value) or value.done():
+            return value
+
+        shared = _SharedDeferred()  # type: _SharedDeferred[Any]
+
+        def on_done(f):
+            try:
+                r = f.result()
+            except CancelledError:
+                shared._finish(_CANCELLED, None)
+            except Exception as err:
+                shared.set_exception(err)
+            else:
+                shared.set_result(r)
+
+        value.add_done_callback(on_done)
+        return shared
+
+    def handle_cancellation(self, value, callback):
+        if _is_future_fast(value) and not value.done():
+            value.add_done_callback(
+                lambda f: callback() if f.cancelled() else None
+            )
+        return value
+
+    def wrap_callable(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        if is_non_blocking(func):
+            return func
         return functools.partial(self._inner.submit, func)
 
 
-def _is_future_fast(value, cache={}, __isinstance=isinstance, __future=Future):
+_PENDING = 0
+_FINISHED = 1
+_FAILED = 2
+_CANCELLED = 3
+
+
+class Deferred(Generic[T]):
+    """
+    Lightweight placeholder for a value which will be available later.
+
+    This implements the subset of the :py:class:`concurrent.futures.Future`
+    interface used to chain values internally (:meth:`done`,
+    :meth:`cancelled`, :meth:`result`, :meth:`add_done_callback`,
+    :meth:`cancel`) without the cost of a condition variable per instance.
+    Use :meth:`as_future` to expose it to code expecting a proper
+    :py:class:`concurrent.futures.Future`.
+
+    Setting the result, exception or cancelling a deferred which is already
+    done is a no-op.
+
+    Args:
+        source: Future or deferred this value is derived from, which will be
+            cancelled along with this one.
+    """
+
+    __slots__ = ("_lock", "_state", "_value", "_callbacks", "_source")
+
+    def __init__(self, source: Any = None) -> None:
+        self._lock = threading.Lock()
+        self._state = _PENDING
+        self._value = None  # type: Any
+        self._callbacks = []  # type: List[Callable[[Deferred[T]], Any]]
+        self._source = source
+
+    def done(self) -> bool:
+        return self._state != _PENDING
+
+    def cancelled(self) -> bool:
+        return self._state == _CANCELLED
+
+    def result(self, timeout: Optional[float] = None) -> T:
+        if self._state == _PENDING:
+            event = threading.Event()
+            self.add_done_callback(lambda _: event.set())
+            if not event.wait(timeout):
+                raise FutureTimeoutError()
+
+        if self._state == _FINISHED:
+            return cast(T, self._value)
+        elif self._state == _FAILED:
+            raise self._value
+        raise CancelledError()
+
+    def add_done_callback(self, fn: Callable[["Deferred[T]"], Any]) -> None:
+        if self._state == _PENDING:
+            with self._lock:
+                if self._state == _PENDING:
+                    self._callbacks.append(fn)
+                    return
+        fn(self)
+
+    def set_result(self, value: T) -> None:
+        self._finish(_FINISHED, value)
+
+    def set_exception(self, exc: Exception) -> None:
+        self._finish(_FAILED, exc)
+
+    def cancel(self) -> bool:
+        return self._finish(_CANCELLED, None)
+
+    def _finish(self, state: int, value: Any) -> bool:
+        with self._lock:
+            if self._state != _PENDING:
+                return False
+            self._state = state
+            self._value = value
+            callbacks, self._callbacks = self._callbacks, []
+            source, self._source = self._source, None
+
+        if state == _CANCELLED and source is not None:
+            source.cancel()
+
+        for cb in callbacks:
+            cb(self)
+        return True
+
+    def as_future(self) -> "Future[T]":
+        """
+        Expose this deferred as a :py:class:`concurrent.futures.Future`.
+
+        Cancelling the returned future will cancel this deferred.
+        """
+        future = Future()  # type: Future[T]
+
+        def on_done(d: "Deferred[T]") -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            if d._state == _FINISHED:
+                future.set_result(d._value)
+            elif d._state == _FAILED:
+                future.set_exception(d._value)
+            else:
+                future.cancel()
+
+        def on_cancel(f: "Future[T]") -> None:
+            if f.cancelled():
+                self.cancel()
+
+        future.add_done_callback(on_cancel)
+        self.add_done_callback(on_done)
+        return future
+
+
+class _SharedDeferred(Deferred[T]):
+    # Deferred consumed by multiple independent chains (see
+    # `ThreadPoolRuntime.share_value`): cancelling one of them must not cancel
+    # the value for the others, nor the work it is derived from.
+
+    __slots__ = ()
+
+    def cancel(self) -> bool:
+        return False
+
+
+class _TimeoutScheduler:
+    # Runs timeout callbacks from a single background thread (started lazily)
+    # instead of using one `threading.Timer` thread per timeout.
+    #
+    # Heap entries are `[deadline, sequence, callback]` lists which double as
+    # handles: cancelling an entry clears its callback so that it doesn't keep
+    # anything alive until its deadline, and cancelled entries are dropped
+    # when they reach the top of the heap or when they make up most of it.
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._heap = []  # type: List[List[Any]]
+        self._cancelled = 0
+        self._counter = itertools.count()
+        self._thread = None  # type: Optional[threading.Thread]
+
+    def __len__(self) -> int:
+        return len(self._heap) - self._cancelled
+
+    def schedule(self, delay: float, callback: Callable[[], Any]) -> List[Any]:
+        entry = [time.monotonic() + delay, next(self._counter), callback]
+        with self._cond:
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="py_gql-timeouts", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return entry
+
+    def cancel(self, entry: List[Any]) -> None:
+        with self._cond:
+            if entry[2] is None:
+                return
+            entry[2] = None
+            self._cancelled += 1
+            if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+                self._heap = [e for e in self._heap if e[2] is not None]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    if self._heap[0][2] is None:
+                        heapq.heappop(self._heap)
+                        self._cancelled -= 1
+                        continue
+                    delay = self._heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        entry = heapq.heappop(self._heap)
+                        callback, entry[2] = entry[2], None
+                        break
+                    self._cond.wait(delay)
+            callback()
+
+
+_TIMEOUTS = _TimeoutScheduler()
+
+
+def _is_future_fast(
+    value, cache={}, __isinstance=isinstance, __future=(Future, Deferred)
+):
     t = type(value)
     try:
         return cache[t]
@@ -71,10 +340,30 @@ def _is_future_fast(value, cache={}, __isinstance=isinstance, __future=Future):
         return res
 
 
+def _is_resolved(value: Any) -> bool:
+    # Whether a future has completed successfully and its result can be
+    # processed synchronously.
+    if isinstance(value, Deferred):
+        return value._state == _FINISHED
+    return (
+        value.done()
+        and not value.cancelled()
+        and value.exception(timeout=0) is None
+    )
+
+
 def unwrap_future(maybe_future):
-    if _is_future_fast(maybe_future):
+    if not _is_future_fast(maybe_future):
+        return maybe_future
 
-        outer = Future()  # type: ignore
+    while _is_resolved(maybe_future):
+        maybe_future = maybe_future.result()
+        if not _is_future_fast(maybe_future):
+            return maybe_future
+
+    if not maybe_future.done():
+
+        outer = Deferred(maybe_future)  # type: ignore
 
         def cb(f):
             try:
@@ -101,76 +390,65 @@ def gather_futures(source: Iterable[MaybeFuture[T]]) -> "MaybeFuture[List[T]]":
 
     If all futures in the ``source`` sequence complete successfully, the result
     is an aggregate list of returned values. The order of result values
-    corresponds to the order of the provided futures.
+    corresponds to the order of the provided futures. If all the futures have
+    already completed successfully, the list is returned directly.
 
     The first raised exception is immediately propagated to the future returned
-    from ``gather_futures()``. Other futures in the provided sequence won’t be
-    cancelled and will continue to run.
+    from ``gather_futures()`` and other futures in the provided sequence are
+    cancelled as their results would be discarded (futures which are already
+    running will still run to completion).
 
     Cancelling ``gather_futures()`` will attempt to cancel the source futures
     that haven't already completed. If any Future from the ``source`` sequence
     is cancelled, it is treated as if it raised `CancelledError` – the
-    ``gather_futures()`` call is not cancelled in this case. This is to prevent
-    the cancellation of one submitted Future to cause other futures to be
-    cancelled.
+    ``gather_futures()`` call is not cancelled in this case but fails with
+    that error.
     """
-    done = 0
-    pending = []  # type: List[Future[T]]
-    result = []  # type: List[MaybeFuture[T]]
-
-    pending_append = pending.append
-    result_append = result.append
-
-    source_values = list(source)
-    target_count = len(source_values)
+    pending = []  # type: List[Tuple[int, Union[Future[T], Deferred[T]]]]
+    result = list(source)  # type: List[Any]
 
-    for maybe_future in source_values:
-        if not _is_future_fast(maybe_future):
-            result_append(maybe_future)
-            done += 1
-        else:
-            pending_append(cast("Future[T]", maybe_future))
-            result_append(maybe_future)
-
-    if target_count == 0:
-        return []
+    for index, maybe_future in enumerate(result):
+        if _is_future_fast(maybe_future):
+            if _is_resolved(maybe_future):
+                result[index] = maybe_future.result()
+            else:
+                pending.append((index, maybe_future))
 
     if not pending:
         return cast(List[T], result)
 
-    def handle_cancel(d: "Future[List[T]]") -> Any:
+    outer = Deferred()  # type: Deferred[List[T]]
+    lock = threading.Lock()
+    remaining = len(pending)
+
+    def handle_cancel(d: "Deferred[List[T]]") -> Any:
         if d.cancelled():
-            for inner in pending:
+            for _, inner in pending:
                 inner.cancel()
 
-    def on_finish(d: "Future[T]") -> Any:
-        nonlocal done
-        done += 1
+    def on_finish(index: int, d: "Union[Future[T], Deferred[T]]") -> Any:
+        nonlocal remaining
 
         try:
-            d.result()
+            value = d.result()
         except Exception as err:
             outer.set_exception(err)
+            for _, inner in pending:
+                inner.cancel()
             return
 
-        if done == target_count:
-            outer.set_result(
-                cast(
-                    "List[T]",
-                    [
-                        cast("Future[T]", v).result()
-                        if _is_future_fast(v)
-                        else v
-                        for v in result
-                    ],
-                )
-            )
+        with lock:
+            result[index] = value
+            remaining -= 1
+            finished = remaining == 0
 
-    outer = Future()  # type: Future[List[T]]
-    outer.add_done_callback(handle_cancel)
+        if finished:
+            outer.set_result(cast("List[T]", result))
 
-    for f in pending:
-        f.add_done_callback(on_finish)
+    for index, f in pending:
+        f.add_done_callback(functools.partial(on_finish, index))
+
+    outer.add_done_callback(handle_cancel)
 
     return outer
 
@@ -181,38 +459,48 @@ def chain(
     else_: Optional[Tuple[Type[E], Callable[[E], G]]] = None,
 ) -> "MaybeFuture[G]":
 
-    if not _is_future_fast(source):
-        try:
-            res = then(cast(T, source))
-        except Exception as err:
-            if else_ is not None:
-                exc_type, cb = else_
-                if isinstance(err, exc_type):
-                    return cb(err)
-            raise
-        else:
-            return res
+    if _is_future_fast(source):
+        if not _is_resolved(source):
+            return _chain_deferred(
+                cast("Union[Future[T], Deferred[T]]", source), then, else_
+            )
+        source = source.result()  # type: ignore
+
+    try:
+        res = then(source)  # type: ignore
+    except Exception as err:
+        if else_ is not None:
+            exc_type, cb = else_
+            if isinstance(err, exc_type):
+                return cb(err)
+        raise
     else:
+        return res
 
-        target = Future()  # type: Future[G]
 
-        def on_finish(f: "Future[T]") -> None:
+def _chain_deferred(
+    source: "Union[Future[T], Deferred[T]]",
+    then: Callable[[T], G],
+    else_: Optional[Tuple[Type[E], Callable[[E], G]]] = None,
+) -> "Deferred[G]":
+    target = Deferred(source)  # type: Deferred[G]
+
+    def on_finish(f: "Union[Future[T], Deferred[T]]") -> None:
+        try:
             try:
                 res = then(f.result())
             except CancelledError:
                 target.cancel()
+                return
             except Exception as err:
-                if else_ is not None:
-                    exc_type, cb = else_
-                    if isinstance(err, exc_type):
-                        target.set_result(cb(err))
-                    else:
-                        target.set_exception(err)
+                if else_ is not None and isinstance(err, else_[0]):
+                    res = else_[1](err)
                 else:
-                    target.set_exception(err)
-            else:
-                target.set_result(res)
-
-        cast("Future[T]", source).add_done_callback(on_finish)
+                    raise
+        except Exception as err:
+            target.set_exception(err)
+        else:
+            target.set_result(res)
 
-        return target
+    source.add_done_callback(on_finish)
+    return target
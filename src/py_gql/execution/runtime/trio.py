@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+"""
+Runtime implementation based on `Trio <https://trio.readthedocs.io>`_.
+
+This module requires Trio to be installed and as such isn't imported in
+:mod:`py_gql.execution.runtime`; import :class:`TrioRuntime` from here
+directly.
+"""
+
+import builtins
+import functools as ft
+from inspect import iscoroutine, iscoroutinefunction
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import trio
+
+from .asyncio import AsyncMap, _isawaitable_fast
+from .base import SubscriptionRuntime
+from .hints import get_max_concurrency, is_non_blocking
+from .streams import StreamBuffer
+
+
+T = TypeVar("T")
+G = TypeVar("G")
+E = TypeVar("E", bound=Exception)
+AnyFnGen = Callable[..., T]
+MaybeAwaitable = Union[Awaitable[T], T]
+
+
+class TrioRuntime(SubscriptionRuntime):
+    """
+    Runtime implementation built on top of Trio's structured concurrency.
+
+    Concurrent values are gathered in a nursery: when one of them raises, all
+    of its siblings which are still running are cancelled before the error is
+    propagated instead of being left to run to completion (non
+    :class:`~py_gql.exc.ResolverError` exceptions abort the whole execution).
+
+    This must be used from within a Trio task (e.g. ``trio.run``), which
+    includes AnyIO applications running on the Trio backend.
+
+    Args:
+        execute_blocking_functions_in_thread: If ``True``, non async
+            resolvers will be executed in worker threads through
+            :func:`trio.to_thread.run_sync`, unless they are marked with
+            :func:`~py_gql.execution.runtime.hints.non_blocking`.
+        max_workers: Maximum number of worker threads used by this runtime
+            at any one time. Defaults to Trio's global thread limiter.
+        max_concurrency: Maximum number of resolvers which can run
+            concurrently (across all executions using this runtime).
+            Use :func:`~py_gql.execution.runtime.hints.max_concurrency` to
+            set a limit for specific resolvers.
+    """
+
+    def __init__(
+        self,
+        execute_blocking_functions_in_thread: bool = True,
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                "max_concurrency must be >= 1, got %r" % max_concurrency
+            )
+
+        self._execute_blocking_functions_in_thread = (
+            execute_blocking_functions_in_thread
+        )
+        self._limiter = (
+            trio.CapacityLimiter(max_workers)
+            if max_workers is not None
+            else None
+        )  # type: Optional[trio.CapacityLimiter]
+        self._semaphore = (
+            trio.Semaphore(max_concurrency)
+            if max_concurrency is not None
+            else None
+        )  # type: Optional[trio.Semaphore]
+        self._resolver_semaphores = (
+            {}
+        )  # type: Dict[Callable[..., Any], trio.Semaphore]
+
+    def _should_run_in_thread(self, fn: Callable[..., Any]) -> bool:
+        return (
+            self._execute_blocking_functions_in_thread
+            and not iscoroutinefunction(fn)
+            and not is_non_blocking(fn)
+        )
+
+    async def run_in_thread(
+        self, fn: AnyFnGen[T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Run a synchronous function in a worker thread.
+
+        This ignores hints and always offloads the function call.
+        """
+        return cast(
+            T,
+            await trio.to_thread.run_sync(
+                ft.partial(fn, *args, **kwargs), limiter=self._limiter
+            ),
+        )
+
+    def submit(
+        self, fn: AnyFnGen[T], *args: Any, **kwargs: Any
+    ) -> MaybeAwaitable[T]:
+        if self._should_run_in_thread(fn):
+            return self.run_in_thread(fn, *args, **kwargs)
+
+        return fn(*args, **kwargs)
+
+    def ensure_wrapped(self, value: MaybeAwaitable[T]) -> Awaitable[T]:
+        if _isawaitable_fast(value):
+            return cast(Awaitable[T], value)
+
+        async def _make_awaitable() -> T:
+            return cast(T, value)
+
+        return _make_awaitable()
+
+    def gather_values(
+        self, values: Iterable[MaybeAwaitable[T]]
+    ) -> MaybeAwaitable[Iterable[T]]:
+
+        pending = []  # type: List[Tuple[int, Awaitable[T]]]
+        done = []  # type: List[Any]
+
+        try:
+            for index, value in enumerate(values):
+                if _isawaitable_fast(value):
+                    pending.append((index, cast(Awaitable[T], value)))
+                done.append(value)
+        except Exception:
+            _close_all(awaitable for _, awaitable in pending)
+            raise
+
+        if not pending:
+            return done
+
+        if len(pending) == 1:
+            index, awaitable = pending[0]
+
+            async def _await_value() -> Iterable[T]:
+                done[index] = await awaitable
+                return done
+
+            return _await_value()
+
+        async def _store(index: int, awaitable: Awaitable[T]) -> None:
+            done[index] = await awaitable
+
+        async def _await_values() -> Iterable[T]:
+            started = 0
+            try:
+                async with trio.open_nursery() as nursery:
+                    for index, awaitable in pending:
+                        nursery.start_soon(_store, index, awaitable)
+                        started += 1
+            except _EXCEPTION_GROUPS as err:
+                # Surface the first error as asyncio.gather would.
+                first = _first_error(err)
+                if first is None:
+                    raise
+                raise first
+            finally:
+                _close_all(awaitable for _, awaitable in pending[started:])
+            return done
+
+        return _await_values()
+
+    def map_value(
+        self,
+        value: MaybeAwaitable[T],
+        then: Callable[[T], G],
+        else_: Optional[Tuple[Type[E], Callable[[E], G]]] = None,
+    ) -> MaybeAwaitable[G]:
+
+        if _isawaitable_fast(value):
+
+            async def _await_value() -> G:
+                try:
+                    return then(await cast(Awaitable[T], value))
+                except Exception as err:
+                    if else_ and isinstance(err, else_[0]):
+                        return else_[1](err)
+                    raise
+
+            return _await_value()
+
+        try:
+            return then(cast(T, value))
+        except Exception as err:
+            if else_ and isinstance(err, else_[0]):
+                return else_[1](err)
+            raise
+
+    def unwrap_value(self, value):
+        if _isawaitable_fast(value):
+
+            async def _await_value():
+                cur = await value
+                while _isawaitable_fast(cur):
+                    cur = await cur
+
+                return cur
+
+            return _await_value()
+
+        return value
+
+    def with_timeout(
+        self,
+        value: MaybeAwaitable[T],
+        timeout: float,
+        on_timeout: Callable[[], T],
+    ) -> MaybeAwaitable[T]:
+        if not _isawaitable_fast(value):
+            return value
+
+        async def _await_value() -> T:
+            with trio.move_on_after(max(timeout, 0)):
+                return await cast(Awaitable[T], value)
+            return on_timeout()
+
+        return _await_value()
+
+    def handle_cancellation(
+        self, value: MaybeAwaitable[T], callback: Callable[[], None]
+    ) -> MaybeAwaitable[T]:
+        if not _isawaitable_fast(value):
+            return value
+
+        async def _await_value() -> T:
+            try:
+                return await cast(Awaitable[T], value)
+            except trio.Cancelled:
+                callback()
+                raise
+
+        return _await_value()
+
+    def share_value(self, value: MaybeAwaitable[T]) -> MaybeAwaitable[T]:
+        if not _isawaitable_fast(value) or isinstance(value, _SharedAwaitable):
+            return value
+        return _SharedAwaitable(cast(Awaitable[T], value))
+
+    def map_stream(
+        self,
+        source_stream: AsyncIterator[T],
+        map_value: Callable[[T], Awaitable[G]],
+        buffer: Optional[StreamBuffer] = None,
+    ) -> AsyncIterable[G]:
+        if buffer is not None:
+            # This would require running the source stream in the background
+            # which Trio only allows within a nursery.
+            raise NotImplementedError(
+                "TrioRuntime does not support buffered streams"
+            )
+        return AsyncMap(source_stream, map_value)
+
+    def wrap_callable(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        semaphores = self._semaphores_for(func)
+
+        if self._should_run_in_thread(func):
+            func = ft.partial(self.run_in_thread, func)
+
+        if semaphores:
+            return ft.partial(_call_limited, semaphores, func)
+
+        return func
+
+    def _semaphores_for(self, func: Callable[..., Any]) -> List[trio.Semaphore]:
+        # Resolver specific semaphore (if any) is always acquired first to
+        # avoid deadlocks.
+        semaphores = []
+
+        limit = get_max_concurrency(func)
+        if limit is not None:
+            try:
+                semaphore = self._resolver_semaphores[func]
+            except KeyError:
+                semaphore = self._resolver_semaphores[func] = trio.Semaphore(
+                    limit
+                )
+            semaphores.append(semaphore)
+
+        if self._semaphore is not None:
+            semaphores.append(self._semaphore)
+
+        return semaphores
+
+
+async def _call_limited(
+    semaphores: List[trio.Semaphore],
+    func: Callable[..., Any],
+    *args: Any,
+    **kwargs: Any
+) -> Any:
+    acquired = []  # type: List[trio.Semaphore]
+    try:
+        for semaphore in semaphores:
+            await semaphore.acquire()
+            acquired.append(semaphore)
+
+        result = func(*args, **kwargs)
+        if _isawaitable_fast(result):
+            return await result
+        return result
+    finally:
+        for semaphore in reversed(acquired):
+            semaphore.release()
+
+
+class _SharedAwaitable:
+    # Awaitable which can be awaited multiple times, possibly concurrently.
+    # The first consumer drives the wrapped awaitable in its own task while
+    # others wait for it to complete; as trio doesn't allow running it in a
+    # separate task, cancelling the first consumer fails the others.
+
+    __slots__ = ("_awaitable", "_started", "_done", "_result", "_error")
+
+    def __init__(self, awaitable: Awaitable[Any]):
+        self._awaitable = awaitable
+        self._started = False
+        self._done = trio.Event()
+        self._result = None  # type: Any
+        self._error = None  # type: Optional[BaseException]
+
+    def __await__(self):
+        return self._wait().__await__()
+
+    async def _wait(self) -> Any:
+        if not self._started:
+            self._started = True
+            try:
+                self._result = await self._awaitable
+            except trio.Cancelled:
+                self._error = RuntimeError(
+                    "Shared value was cancelled while being awaited"
+                )
+                raise
+            except Exception as err:
+                self._error = err
+                raise
+            finally:
+                self._done.set()
+            return self._result
+
+        await self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+def _exception_group_types() -> Tuple[Type[BaseException], ...]:
+    # Depending on the versions of Python and Trio, nurseries raise
+    # (Base)ExceptionGroup or trio.MultiError when multiple tasks fail.
+    group = getattr(builtins, "BaseExceptionGroup", None)
+    if group is not None:
+        return (group,)
+    try:
+        from exceptiongroup import BaseExceptionGroup as _Group
+    except ImportError:
+        return (trio.MultiError,)
+    return (_Group,)
+
+
+_EXCEPTION_GROUPS = _exception_group_types()
+
+
+def _first_error(err: BaseException) -> Optional[Exception]:
+    # First leaf exception of an exception group, unless it isn't a regular
+    # exception (e.g. a cancellation).
+    while isinstance(err, _EXCEPTION_GROUPS):
+        err = err.exceptions[0]  # type: ignore
+    return err if isinstance(err, Exception) else None
+
+
+def _close_all(awaitables: Iterable[Awaitable[Any]]) -> None:
+    # Coroutines which will never be awaited.
+    for awaitable in awaitables:
+        if iscoroutine(awaitable):
+            cast(Coroutine[Any, Any, Any], awaitable).close()
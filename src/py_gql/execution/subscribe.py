@@ -10,7 +10,7 @@ from ..utilities import coerce_variable_values
 from .executor import Executor
 from .get_operation import get_operation_with_type
 from .instrumentation import Instrumentation
-from .runtime import SubscriptionRuntime
+from .runtime import StreamBuffer, SubscriptionRuntime
 from .wrappers import GraphQLResult, ResolveInfo
 
 
@@ -27,7 +27,8 @@ def subscribe(
     context_value: Optional[Any] = None,
     instrumentation: Optional[Instrumentation] = None,
     runtime: SubscriptionRuntime,
-    executor_cls: Type[Executor] = Executor
+    executor_cls: Type[Executor] = Executor,
+    buffer: Optional[StreamBuffer] = None
 ) -> Any:
     """
     Execute a subscription against a schema and return the appropriate response stream.
@@ -58,12 +59,17 @@ def subscribe(
             The executor class defines the implementation of the GraphQL
             resolution algorithm. This **must** be a subclass of
             `py_gql.execution.Executor`.
+        buffer: If set, source events are pulled in the background and
+            buffered according to this configuration instead of being pulled
+            as results are consumed (see
+            :mod:`py_gql.execution.runtime.streams`).
 
     Returns:
         An iterator over subscription results. Exact type dependent on the runtime.
 
     Raises:
-        RuntimeError: on invalid operation.
+        RuntimeError: on invalid operation or when ``buffer`` is set and the
+            runtime doesn't support buffered streams.
     """
     instrumentation = instrumentation or Instrumentation()
 
@@ -98,6 +104,12 @@ def subscribe(
             % type(runtime)
         )
 
+    if buffer is not None and not runtime.supports_buffered_streams:
+        raise RuntimeError(
+            "Runtime of type '%s' doesn't support buffered subscription "
+            "streams." % type(runtime)
+        )
+
     _on_event = ft.partial(
         execute_subscription_event, executor, root_type, operation
     )
@@ -107,7 +119,12 @@ def subscribe(
     # MapSourceToResponseEvent
     # Needs to be mapped to support async subscription resolvers.
     def _on_stream_created(source_stream):
-        response_stream = runtime.map_stream(source_stream, _on_event)
+        if buffer is not None:
+            response_stream = runtime.map_stream(
+                source_stream, _on_event, buffer=buffer
+            )
+        else:
+            response_stream = runtime.map_stream(source_stream, _on_event)
 
         cast(Instrumentation, instrumentation).on_execution_end()
         return response_stream
@@ -170,24 +187,23 @@ def execute_subscription_event(
     operation: _ast.OperationDefinition,
     event: Any,
 ) -> Any:
-    # As we carry the executor through the source stream iteration we need to
-    # clear the errors between events.
-    # REVIEW: We could split the Executor in 2 parts to maintain the benefit
-    # of the caches while isolating the errors.
-    executor.clear_errors()
-
-    return executor.runtime.ensure_wrapped(
-        executor.runtime.map_value(
-            executor.runtime.unwrap_value(
-                executor.execute_fields(
+    # Events are executed on a fork of the executor: they share its caches
+    # but not its errors which allows executing them concurrently.
+    event_executor = executor.fork()
+    runtime = event_executor.runtime
+
+    return runtime.ensure_wrapped(
+        runtime.map_value(
+            runtime.unwrap_value(
+                event_executor.execute_fields(
                     root_type,
                     event,
                     [],
-                    executor.collect_fields(
+                    event_executor.collect_fields(
                         root_type, operation.selection_set.selections
                     ),
                 )
             ),
-            lambda data: GraphQLResult(data=data, errors=executor.errors),
+            lambda data: GraphQLResult(data=data, errors=event_executor.errors),
         )
     )
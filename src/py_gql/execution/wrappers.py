@@ -1,15 +1,18 @@
 # -*- coding: utf-8 -*-
 
+import copy
 import json
 from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
     Optional,
     Sequence,
     Set,
     Tuple,
+    TypeVar,
     Union,
 )
 
@@ -36,6 +39,8 @@ Resolver = Callable[..., Any]
 ResponsePath = List[Union[str, int]]
 GroupedFields = Dict[str, List[ast.Field]]
 
+C = TypeVar("C", bound="ResolutionContext")
+
 
 class ResolutionContext:
     """
@@ -53,6 +58,7 @@ class ResolutionContext:
         "_field_defs",
         "_argument_values",
         "_resolver_cache",
+        "_memoized_values",
         "_middlewares",
         "_disable_introspection",
         "_errors",
@@ -96,6 +102,9 @@ class ResolutionContext:
             {}
         )  # type: Dict[Tuple[Field, ast.Field], Dict[str, Any]]
         self._resolver_cache = {}  # type: Dict[Resolver, Resolver]
+        # Values of memoized resolvers along with the parent value they were
+        # resolved on, see py_gql.execution.memoize.
+        self._memoized_values = {}  # type: Dict[Hashable, Tuple[Any, Any]]
 
     def add_error(
         self,
@@ -125,6 +134,44 @@ class ResolutionContext:
         """
         self._errors[:] = []
 
+    def fork(self: C) -> C:
+        """
+        Create a copy of this instance which shares its caches (collected
+        fields, coerced arguments, wrapped resolvers, etc.) but holds its own
+        execution state (errors, memoized values, etc.).
+
+        This is cheap and lets multiple executions of the same operation, such
+        as subscription events, run concurrently without interfering with each
+        other.
+        """
+        forked = copy.copy(self)
+        forked.reset_state()
+        return forked
+
+    def reset_state(self) -> None:
+        """
+        Reset the per-execution state of this instance, keeping the caches.
+
+        Subclasses which track additional per-execution state must extend
+        this method.
+        """
+        self._errors = []
+        self._memoized_values = {}
+
+    def share_caches(self, other: "ResolutionContext") -> None:
+        """
+        Use the caches of ``other`` which do not depend on the document or
+        variables (field definitions, wrapped resolvers, etc.) as well as its
+        memoized values.
+
+        This is used to execute multiple operations as part of a single
+        request (see :func:`~py_gql.process_graphql_batch`) and expects both
+        instances to share the same schema and configuration.
+        """
+        self._field_defs = other._field_defs
+        self._resolver_cache = other._resolver_cache
+        self._memoized_values = other._memoized_values
+
     def collect_fields(
         self,
         parent_type: ObjectType,
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+Whole response caching.
+
+:class:`ResponseCache` wraps :func:`~py_gql.process_graphql_query` and stores
+encoded responses so that repeated queries skip parsing, validation,
+execution and encoding entirely. How long a response can be cached for is
+derived from the cache hints of the fields it contains (see
+:mod:`py_gql.execution.cache`).
+"""
+
+import hashlib
+import json
+import math
+import time
+from typing import Any, Callable, Hashable, Mapping, Optional, Union
+
+from ._graphql import process_graphql_query
+from .exc import GraphQLSyntaxError, InvalidOperationError
+from .execution import (
+    GraphQLResult,
+    Instrumentation,
+    MultiInstrumentation,
+    get_operation,
+)
+from .execution.cache import (
+    PRIVATE,
+    PUBLIC,
+    CacheControl,
+    CacheHint,
+    CacheStore,
+    MemoryCacheStore,
+)
+from .execution.runtime import BlockingRuntime, Runtime
+from .lang import parse, print_ast
+from .lang.ast import Document
+from .schema import Schema
+
+
+__all__ = ("ResponseCache", "CachedResponse", "fingerprint")
+
+
+def fingerprint(
+    document: Union[str, Document],
+    operation_name: Optional[str] = None,
+    variables: Optional[Mapping[str, Any]] = None,
+    scope: Optional[Hashable] = None,
+) -> Optional[str]:
+    """
+    Compute a stable digest identifying a request.
+
+    Documents are identified by their exact text and variables by their
+    canonical JSON encoding.
+
+    Returns:
+        ``None`` if the request cannot be fingerprinted, e.g. when variables
+        cannot be serialized.
+    """
+    text = document if isinstance(document, str) else print_ast(document)
+    try:
+        encoded_variables = json.dumps(
+            variables or {}, sort_keys=True, separators=(",", ":")
+        )
+    except (TypeError, ValueError):
+        return None
+
+    digest = hashlib.sha256()
+    for part in (
+        text,
+        operation_name or "",
+        encoded_variables,
+        repr(scope) if scope is not None else "",
+    ):
+        encoded = part.encode("utf-8")
+        # Length prefix to avoid ambiguous concatenations.
+        digest.update(b"%d:" % len(encoded))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def encode_json(result: GraphQLResult) -> bytes:
+    """
+    Default response encoder, using the standard lib :py:mod:`json` module.
+    """
+    return result.json(separators=(",", ":")).encode("utf-8")
+
+
+class CachedResponse:
+    """
+    Encoded response returned by :class:`ResponseCache`.
+
+    Attributes:
+        body (bytes): Encoded response.
+        policy (py_gql.execution.cache.CacheHint): Cache policy of the
+            response.
+        hit (bool): Whether the response was served from the cache.
+    """
+
+    __slots__ = ("body", "policy", "hit")
+
+    def __init__(self, body: bytes, policy: CacheHint, hit: bool = False):
+        self.body = body
+        self.policy = policy
+        self.hit = hit
+
+    def http_header(self) -> Optional[str]:
+        """
+        Value of the HTTP ``Cache-Control`` header matching the policy, or
+        ``None`` if the response should not be cached.
+        """
+        return self.policy.http_header()
+
+
+class ResponseCache:
+    """
+    Cache encoded responses keyed on the query document, operation name,
+    variables and an optional, user supplied, scope.
+
+    Responses are only stored when they are the result of a query operation
+    (not a mutation or subscription) without errors and when all their fields
+    are cacheable, in which case they are kept for the lowest ``max_age``
+    of their fields. Responses containing private fields (see
+    :data:`~py_gql.execution.cache.PRIVATE`) are only stored when a ``scope``
+    is provided and only served for that same scope.
+
+    Documents are identified by their exact text, which means that the same
+    query formatted differently will be cached separately; this is what makes
+    it possible to skip parsing entirely on cache hits.
+
+    Args:
+        schema: Schema to execute queries against.
+        store: Storage backend, defaults to a
+            :class:`~py_gql.execution.cache.MemoryCacheStore`.
+        default_max_age: Max age of root and composite fields without a
+            cache hint (see :class:`~py_gql.execution.cache.CacheControl`).
+        encode: Function used to encode results.
+        runtime: Runtime used to execute queries; the return value of
+            :meth:`process` is wrapped according to it.
+        clock: Function returning the current time in seconds, used to
+            compute the remaining ``max_age`` of cached responses. As expiry
+            times are stored along with the responses, this must be
+            consistent across processes sharing a store.
+        **options: Other keyword arguments forwarded to
+            :func:`~py_gql.process_graphql_query` on every call, such as
+            ``middlewares`` or ``executor_cls``.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        *,
+        store: Optional[CacheStore] = None,
+        default_max_age: int = 0,
+        encode: Callable[[GraphQLResult], bytes] = encode_json,
+        runtime: Optional[Runtime] = None,
+        clock: Callable[[], float] = time.time,
+        **options: Any
+    ):
+        self.schema = schema
+        self.store = store if store is not None else MemoryCacheStore()
+        self.default_max_age = default_max_age
+        self.runtime = runtime or BlockingRuntime()
+        self._encode = encode
+        self._clock = clock
+        self._options = options
+
+    def key(
+        self,
+        document: Union[str, Document],
+        operation_name: Optional[str] = None,
+        variables: Optional[Mapping[str, Any]] = None,
+        scope: Optional[Hashable] = None,
+    ) -> Optional[str]:
+        """
+        Compute the cache key for a request.
+
+        Returns:
+            ``None`` if the request cannot be cached, e.g. when variables
+            cannot be serialized.
+        """
+        digest = fingerprint(document, operation_name, variables, scope)
+        return "py_gql.response:%s" % digest if digest is not None else None
+
+    def process(
+        self,
+        document: Union[str, Document],
+        *,
+        variables: Optional[Mapping[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        scope: Optional[Hashable] = None,
+        root: Any = None,
+        context: Any = None,
+        instrumentation: Optional[Instrumentation] = None
+    ) -> Any:
+        """
+        Process a GraphQL request, going through the cache.
+
+        Args:
+            document: The query document.
+            variables: Raw, JSON decoded variables parsed from the request.
+            operation_name: Operation to execute.
+            scope: Identifies the user for which the request is made.
+                Responses with private fields are only cached when this is
+                set.
+            root: Root resolution value passed to the top-level resolver.
+            context: Custom application-specific execution context.
+            instrumentation: Instrumentation instance, which is only called
+                on cache misses.
+
+        Returns:
+            The :class:`CachedResponse`, wrapped according to the runtime.
+        """
+        runtime = self.runtime
+        public_key = self.key(document, operation_name, variables)
+        private_key = (
+            self.key(document, operation_name, variables, scope)
+            if scope is not None
+            else None
+        )
+
+        for key in (private_key, public_key):
+            if key is None:
+                continue
+            try:
+                body, expires, scope_name = self.store.get(key)
+            except KeyError:
+                continue
+            # Only advertise the time left so that downstream caches don't
+            # keep the response for longer than its original max age.
+            max_age = max(0, math.ceil(expires - self._clock()))
+            return runtime.ensure_wrapped(
+                CachedResponse(body, CacheHint(max_age, scope_name), hit=True)
+            )
+
+        # Parse here in order to only cache queries.
+        ast = document  # type: Union[str, Document]
+        if isinstance(document, str):
+            try:
+                ast = parse(document)
+            except GraphQLSyntaxError:
+                pass
+
+        cache_control = CacheControl(self.default_max_age)
+
+        def _on_result(result: GraphQLResult) -> CachedResponse:
+            body = self._encode(result)
+            policy = cache_control.policy
+
+            if (
+                not policy.max_age
+                or result.errors
+                or not isinstance(ast, Document)
+                or not _is_query(ast, operation_name)
+            ):
+                return CachedResponse(body, CacheHint(0, PUBLIC))
+
+            key = private_key if policy.scope == PRIVATE else public_key
+            if key is not None:
+                expires = self._clock() + policy.max_age
+                self.store.set(
+                    key, (body, expires, policy.scope), policy.max_age
+                )
+            return CachedResponse(body, policy)
+
+        return runtime.ensure_wrapped(
+            runtime.map_value(
+                process_graphql_query(
+                    self.schema,
+                    ast,
+                    variables=variables,
+                    operation_name=operation_name,
+                    root=root,
+                    context=context,
+                    instrumentation=(
+                        MultiInstrumentation(instrumentation, cache_control)
+                        if instrumentation is not None
+                        else cache_control
+                    ),
+                    runtime=runtime,
+                    **self._options,
+                ),
+                _on_result,
+            )
+        )
+
+
+def _is_query(document: Document, operation_name: Optional[str]) -> bool:
+    try:
+        return get_operation(document, operation_name).operation == "query"
+    except InvalidOperationError:
+        return False
@@ -22,6 +22,7 @@ class ResolverMap:
     def __init__(self):
         self.resolvers = {}  # type: Dict[str, Dict[str, Resolver]]
         self.subscriptions = {}  # type: Dict[str, Dict[str, Resolver]]
+        self.batch_resolvers = {}  # type: Dict[str, Dict[str, Resolver]]
         self.default_resolver = None  # type: Optional[Resolver]
         self.default_resolvers = {}  # type: Dict[str, Resolver]
 
@@ -73,7 +74,8 @@ class ResolverMap:
         fieldname: str,
         resolver: Resolver,
         *,
-        allow_override: bool = False
+        allow_override: bool = False,
+        batch: bool = False
     ) -> None:
         """
         Register a function as a resolver.
@@ -83,11 +85,19 @@ class ResolverMap:
             fieldname: Field name
             resolver: Resolver callable
             allow_override: Set this to ``True`` to allow re-definition.
+            batch: Set this to ``True`` to register the function as a batch
+                resolver (see :attr:`py_gql.schema.Field.batch_resolver`).
 
         Raises:
             ValueError: If the resolver has already been defined and
                 ``allow_override`` was ``False``.
         """
+        if batch:
+            self._register_batch_resolver(
+                typename, fieldname, resolver, allow_override=allow_override
+            )
+            return
+
         parent = self.resolvers[typename] = self.resolvers.get(typename, {})
 
         if fieldname == "*":
@@ -101,8 +111,31 @@ class ResolverMap:
 
             parent[fieldname] = resolver
 
+    def _register_batch_resolver(
+        self,
+        typename: str,
+        fieldname: str,
+        resolver: Resolver,
+        *,
+        allow_override: bool = False
+    ) -> None:
+        if fieldname == "*":
+            raise ValueError("Cannot register a default batch resolver.")
+
+        parent = self.batch_resolvers[typename] = self.batch_resolvers.get(
+            typename, {}
+        )
+
+        if fieldname in parent and not allow_override:
+            raise ValueError(
+                'Field "%s" of type "%s" already has a batch resolver.'
+                % (fieldname, typename)
+            )
+
+        parent[fieldname] = resolver
+
     def resolver(
-        self, field: str, *, allow_override: bool = False
+        self, field: str, *, allow_override: bool = False, batch: bool = False
     ) -> Callable[[TResolver], TResolver]:
         """
         Decorate a function to register it as a resolver.
@@ -110,6 +143,8 @@ class ResolverMap:
         Args:
             field: Field path in the form ``{Typename}.{Fieldname}``.
             allow_override: Set this to ``True`` to allow re-definition.
+            batch: Set this to ``True`` to register the function as a batch
+                resolver.
 
         Raises:
             ValueError: If the ``field`` value cannot be parsed.
@@ -127,7 +162,11 @@ class ResolverMap:
 
         def decorator(func: TResolver) -> TResolver:
             self.register_resolver(
-                typename, fieldname, func, allow_override=allow_override
+                typename,
+                fieldname,
+                func,
+                allow_override=allow_override,
+                batch=batch,
             )
             return func
 
@@ -210,6 +249,16 @@ class ResolverMap:
                     typename, fieldname, resolver, allow_override=allow_override
                 )
 
+        for typename, field_resolvers in other.batch_resolvers.items():
+            for fieldname, resolver in field_resolvers.items():
+                self.register_resolver(
+                    typename,
+                    fieldname,
+                    resolver,
+                    allow_override=allow_override,
+                    batch=True,
+                )
+
         for typename, field_subscriptions in other.subscriptions.items():
             for fieldname, subscription in field_subscriptions.items():
                 self.register_subscription(
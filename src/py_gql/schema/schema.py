@@ -6,6 +6,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Optional,
@@ -97,6 +98,7 @@ class Schema(ResolverMap):
         "subscription_type",
         "nodes",
         "_possible_types",
+        "_possible_type_sets",
         "_is_valid",
         "_literal_types_cache",
         "types",
@@ -104,6 +106,7 @@ class Schema(ResolverMap):
         "implementations",
         "resolvers",
         "subscriptions",
+        "batch_resolvers",
         "default_resolver",
         "default_resolvers",
     )
@@ -142,6 +145,9 @@ class Schema(ResolverMap):
         self._possible_types = (
             {}
         )  # type: Dict[GraphQLAbstractType, Sequence[ObjectType]]
+        self._possible_type_sets = (
+            {}
+        )  # type: Dict[GraphQLAbstractType, FrozenSet[ObjectType]]
         self._is_valid = None  # type: Optional[bool]
         self._literal_types_cache = {}  # type: Dict[_ast.Type, GraphQLType]
 
@@ -335,7 +341,13 @@ class Schema(ResolverMap):
         if not isinstance(type_, ObjectType):
             return False
 
-        return type_ in self.get_possible_types(abstract_type)
+        try:
+            possible_types = self._possible_type_sets[abstract_type]
+        except KeyError:
+            possible_types = frozenset(self.get_possible_types(abstract_type))
+            self._possible_type_sets[abstract_type] = possible_types
+
+        return type_ in possible_types
 
     def is_subtype(self, type_, super_type):
         """
@@ -454,10 +466,15 @@ class Schema(ResolverMap):
         fieldname: str,
         resolver: Resolver,
         *,
-        allow_override: bool = False
+        allow_override: bool = False,
+        batch: bool = False
     ) -> None:
         super().register_resolver(
-            typename, fieldname, resolver, allow_override=allow_override
+            typename,
+            fieldname,
+            resolver,
+            allow_override=allow_override,
+            batch=batch,
         )
 
         try:
@@ -482,6 +499,20 @@ class Schema(ResolverMap):
                 % (typename, fieldname)
             )
 
+        if batch:
+            if (
+                field.batch_resolver is not None
+                and not allow_override
+                and field.batch_resolver is not resolver
+            ):
+                raise ValueError(
+                    'Field "%s" of type "%s" already has a batch resolver.'
+                    % (fieldname, typename)
+                )
+
+            field.batch_resolver = resolver
+            return
+
         if (
             field.resolver is not None
             and not allow_override
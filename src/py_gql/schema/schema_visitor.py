@@ -100,6 +100,7 @@ class SchemaVisitor(object):
                 default_resolver=object_type.default_resolver,
                 description=object_type.description,
                 nodes=object_type.nodes,
+                cache_hint=object_type.cache_hint,
             )
         return object_type
 
@@ -114,6 +115,8 @@ class SchemaVisitor(object):
                 deprecation_reason=field.deprecation_reason,
                 resolver=field.resolver,
                 subscription_resolver=field.subscription_resolver,
+                batch_resolver=field.batch_resolver,
+                cache_hint=field.cache_hint,
                 node=field.node,
                 python_name=field.python_name,
             )
@@ -133,6 +136,7 @@ class SchemaVisitor(object):
                 resolve_type=interface_type.resolve_type,
                 description=interface_type.description,
                 nodes=interface_type.nodes,
+                cache_hint=interface_type.cache_hint,
             )
         return interface_type
 
@@ -50,6 +50,8 @@ class CamelCaseSchemaTransform(SchemaVisitor):
                 args=field.arguments,
                 resolver=field.resolver,
                 subscription_resolver=field.subscription_resolver,
+                batch_resolver=field.batch_resolver,
+                cache_hint=field.cache_hint,
                 description=field.description,
                 deprecation_reason=field.deprecation_reason,
                 node=field.node,
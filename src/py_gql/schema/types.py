@@ -29,6 +29,7 @@ from ._types import GraphQLType, ListType, NamedType, NonNullType  # noqa: F401
 
 
 if TYPE_CHECKING:
+    from ..execution.cache import CacheHint  # noqa: F401
     from ..execution.wrappers import ResolveInfo  # noqa: F401
 
 
@@ -282,9 +283,11 @@ class EnumValue:
         value: Python value.
             Defaults to ``name`` if omitted.
 
-            Warning:
-                Must be hashable to support reverse lookups when coercing python
-                values into enum values
+            Note:
+                Hashable values are strongly recommended as they support
+                constant time reverse lookups when serializing python values
+                into enum values. Unhashable values are supported but require
+                comparing against each unhashable value of the enum.
 
         deprecation_reason:
             If set, the value will be marked as deprecated and the introspection
@@ -385,8 +388,6 @@ class EnumType(GraphQLLeafType, NamedType):
 
         values (Dict[str, py_gql.schema.EnumValue]): Values by name
 
-        reverse_values: (Dict[H, EnumValue]): Values by value
-
         description (Optional[str]): Enum description
 
         nodes (List[Union[\
@@ -430,7 +431,10 @@ class EnumType(GraphQLLeafType, NamedType):
     ) -> None:
         self.values = []  # type: List[EnumValue]
         self._values = {}  # type: Dict[str, EnumValue]
-        self._reverse_values = {}  # type: Dict[Any, EnumValue]
+        # Reverse lookup tables used when serializing values. Unhashable values
+        # cannot be stored in a dict and are matched by equality instead.
+        self._names_by_value = {}  # type: Dict[Any, str]
+        self._unhashable_values = []  # type: List[EnumValue]
 
         for v in values:
             v = EnumValue.from_def(v)
@@ -439,7 +443,12 @@ class EnumType(GraphQLLeafType, NamedType):
                 raise ValueError("Duplicate enum value %s" % v.name)
 
             self.values.append(v)
-            self._reverse_values[v.value] = self._values[v.name] = v
+            self._values[v.name] = v
+
+            try:
+                self._names_by_value[v.value] = v.name
+            except TypeError:
+                self._unhashable_values.append(v)
 
     def get_value(self, name: str) -> Any:
         """
@@ -466,21 +475,45 @@ class EnumType(GraphQLLeafType, NamedType):
         Extract the name for a given value.
 
         Args:
-            value: Value of the value to extract, must be hashable
+            value: Value of the value to extract
 
         Returns:
-            :class:`py_gql.schema.EnumValue`: The corresponding EnumValue
+            str: The corresponding name
 
         Raises:
             UnknownEnumValue: when the value is unknown
         """
         try:
-            return self._reverse_values[value].name
-        except KeyError:
+            return self._names_by_value[value]
+        except (KeyError, TypeError):
+            for enum_value in self._unhashable_values:
+                if enum_value.value == value:
+                    return enum_value.name
+
             raise UnknownEnumValue(
                 "Invalid value %r for enum %s" % (value, self.name)
             )
 
+    def get_names(self, values: Sequence[Any]) -> List[str]:
+        """
+        Extract the names for multiple values.
+
+        Args:
+            values: Values of the values to extract
+
+        Returns:
+            The corresponding names, in the same order as the input values
+
+        Raises:
+            UnknownEnumValue: when any of the values is unknown
+        """
+        names_by_value = self._names_by_value
+        try:
+            return [names_by_value[value] for value in values]
+        except (KeyError, TypeError):
+            get_name = self.get_name
+            return [get_name(value) for value in values]
+
 
 _ScalarValueNode = Union[
     _ast.IntValue, _ast.FloatValue, _ast.StringValue, _ast.BooleanValue
@@ -537,6 +570,23 @@ class ScalarType(GraphQLLeafType, NamedType):
 
         nodes: Source nodes used when building type from the SDL
 
+        serialize_many: Bulk type serializer.
+
+            This function will receive a sequence of non null Python values and
+            must output a sequence of JSON serializable scalars of the same
+            length. Use this to implement bulk conversions when serializing
+            lists of values.
+
+            If not provided, `serialize` will be called for every value.
+
+        parse_many: Bulk type de-serializer.
+
+            This function will receive a sequence of non null JSON scalars and
+            must output a sequence of Python values of the same length. Use
+            this to implement bulk conversions when coercing lists of values.
+
+            If not provided, `parse` will be called for every value.
+
     Attributes:
         name (str): Type name
 
@@ -562,12 +612,20 @@ class ScalarType(GraphQLLeafType, NamedType):
         nodes: Optional[
             List[Union[_ast.ScalarTypeDefinition, _ast.ScalarTypeExtension]]
         ] = None,
+        serialize_many: Optional[
+            Callable[[Sequence[Any]], Sequence[_ScalarValue]]
+        ] = None,
+        parse_many: Optional[
+            Callable[[Sequence[_ScalarValue]], Sequence[Any]]
+        ] = None,
     ):
         self.name = name
         self.description = description
         self._serialize = serialize
         self._parse = parse
         self._parse_literal = parse_literal
+        self._serialize_many = serialize_many
+        self._parse_many = parse_many
         self.nodes = (
             [] if nodes is None else nodes
         )  # type: List[Union[_ast.ScalarTypeDefinition, _ast.ScalarTypeExtension]]
@@ -591,6 +649,29 @@ class ScalarType(GraphQLLeafType, NamedType):
         except (ValueError, TypeError) as err:
             raise ScalarSerializationError(str(err)) from err
 
+    def serialize_many(self, values: Sequence[Any]) -> List[_ScalarValue]:
+        """
+        Transform multiple Python values in JSON serializable ones.
+
+        Args:
+            values: Python level values, must not contain ``None``
+
+        Returns:
+            JSON scalars, in the same order as the input values
+
+        Raises:
+            ScalarSerializationError: when the type's serializer fail with
+                ValueError or TypeError (other exceptions bubble up).
+        """
+        if self._serialize_many is None:
+            serialize = self.serialize
+            return [serialize(value) for value in values]
+
+        try:
+            return list(self._serialize_many(values))
+        except (ValueError, TypeError) as err:
+            raise ScalarSerializationError(str(err)) from err
+
     def parse(self, value: _ScalarValue) -> Any:
         """
         Transform a GraphQL value in a valid Python value
@@ -610,6 +691,29 @@ class ScalarType(GraphQLLeafType, NamedType):
         except (ValueError, TypeError) as err:
             raise ScalarParsingError(str(err)) from err
 
+    def parse_many(self, values: Sequence[_ScalarValue]) -> List[Any]:
+        """
+        Transform multiple GraphQL values in valid Python values
+
+        Args:
+            values: JSON scalars, must not contain ``None``
+
+        Returns:
+            Python level values, in the same order as the input values
+
+        Raises:
+            ScalarParsingError: when the type's parser fail with
+                ValueError or TypeError (other exceptions bubble up).
+        """
+        if self._parse_many is None:
+            parse = self.parse
+            return [parse(value) for value in values]
+
+        try:
+            return list(self._parse_many(values))
+        except (ValueError, TypeError) as err:
+            raise ScalarParsingError(str(err)) from err
+
     def parse_literal(
         self,
         node: _ScalarValueNode,
@@ -707,6 +811,18 @@ class Field:
 
         resolver: Resolver function.
 
+        subscription_resolver: Resolver function used to create the source
+            stream of subscription fields.
+
+        batch_resolver: Resolver function used to resolve this field for
+            multiple parent values at once. It receives the list of parent
+            values instead of a single value and must return a list of the
+            same length. If :attr:`resolver` is not set, it will be called with
+            a single parent value when the field cannot be batched.
+
+        cache_hint: Cache hint of the field, see
+            :mod:`py_gql.execution.cache`.
+
         node: Source node used when building type from the SDL
 
     Attributes:
@@ -729,6 +845,8 @@ class Field:
 
         resolver (callable): Field resolver.
         subscription_resolver (callable): Field resolver for subscriptions.
+        batch_resolver (callable): Field resolver for multiple parent values.
+        cache_hint (Optional[py_gql.execution.cache.CacheHint]): Cache hint.
 
         node (Optional[py_gql.lang.ast.FieldDefinition]):
             Source node used when building type from the SDL
@@ -746,6 +864,8 @@ class Field:
         subscription_resolver: Optional[Callable[..., Any]] = None,
         node: Optional[_ast.FieldDefinition] = None,
         python_name: Optional[str] = None,
+        batch_resolver: Optional[Callable[..., Any]] = None,
+        cache_hint: Optional["CacheHint"] = None,
     ):
         self.name = name
         self.description = description
@@ -753,6 +873,8 @@ class Field:
         self.deprecation_reason = deprecation_reason
         self.resolver = resolver
         self.subscription_resolver = subscription_resolver
+        self.batch_resolver = batch_resolver
+        self.cache_hint = cache_hint
         self._source_args = args
         self._args = None  # type: Optional[Sequence[Argument]]
         self.node = node
@@ -811,6 +933,9 @@ class InterfaceType(GraphQLCompositeType, GraphQLAbstractType, NamedType):
 
         nodes: Source nodes used when building type from the SDL
 
+        cache_hint: Default cache hint of fields returning this type, see
+            :mod:`py_gql.execution.cache`.
+
     Attributes:
         name (str): Type name
 
@@ -823,6 +948,8 @@ class InterfaceType(GraphQLCompositeType, GraphQLAbstractType, NamedType):
 
         resolve_type (Optional[callable]): Type resolver
 
+        cache_hint (Optional[py_gql.execution.cache.CacheHint]): Cache hint.
+
         nodes (List[Union[\
             py_gql.lang.ast.InterfaceTypeDefinition,\
             py_gql.lang.ast.InterfaceTypeExtension,\
@@ -841,6 +968,7 @@ class InterfaceType(GraphQLCompositeType, GraphQLAbstractType, NamedType):
                 Union[_ast.InterfaceTypeDefinition, _ast.InterfaceTypeExtension]
             ]
         ] = None,
+        cache_hint: Optional["CacheHint"] = None,
     ):
         self.name = name
         self.description = description
@@ -850,6 +978,7 @@ class InterfaceType(GraphQLCompositeType, GraphQLAbstractType, NamedType):
             [] if nodes is None else nodes
         )  # noqa: B950, type: List[Union[_ast.InterfaceTypeDefinition, _ast.InterfaceTypeExtension]]
         self.resolve_type = resolve_type
+        self.cache_hint = cache_hint
 
 
 class ObjectType(GraphQLCompositeType, NamedType):
@@ -872,6 +1001,9 @@ class ObjectType(GraphQLCompositeType, NamedType):
 
         nodes: Source nodes used when building type from the SDL
 
+        cache_hint: Default cache hint of fields returning this type, see
+            :mod:`py_gql.execution.cache`.
+
     Attributes:
         name (str): Type name
 
@@ -887,6 +1019,8 @@ class ObjectType(GraphQLCompositeType, NamedType):
 
         default_resolver (Optional[Callable[..., Any]]):
 
+        cache_hint (Optional[py_gql.execution.cache.CacheHint]): Cache hint.
+
         nodes (List[Union[\
             py_gql.lang.ast.ObjectTypeDefinition,\
             py_gql.lang.ast.ObjectTypeExtension,\
@@ -904,12 +1038,14 @@ class ObjectType(GraphQLCompositeType, NamedType):
         nodes: Optional[
             List[Union[_ast.ObjectTypeDefinition, _ast.ObjectTypeExtension]]
         ] = None,
+        cache_hint: Optional["CacheHint"] = None,
     ):
         self.name = name
         self.description = description
         self._source_fields = fields
         self._source_fields = fields
         self.default_resolver = default_resolver
+        self.cache_hint = cache_hint
         self._fields = None  # type: Optional[Sequence[Field]]
         self._source_interfaces = interfaces
         self._interfaces = None  # type: Optional[Sequence[InterfaceType]]
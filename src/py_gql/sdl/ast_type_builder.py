@@ -371,6 +371,7 @@ class ASTTypeBuilder:
             fields=fields,
             interfaces=interfaces,
             nodes=object_type.nodes + extensions,  # type: ignore
+            cache_hint=object_type.cache_hint,
         )
 
     def _extend_field(self, field_def: Field) -> Field:
@@ -381,6 +382,8 @@ class ASTTypeBuilder:
             deprecation_reason=field_def.deprecation_reason,
             args=[self._extend_argument(a) for a in field_def.arguments],
             resolver=field_def.resolver,
+            batch_resolver=field_def.batch_resolver,
+            cache_hint=field_def.cache_hint,
             node=field_def.node,
         )
 
@@ -409,6 +412,7 @@ class ASTTypeBuilder:
             description=interface_type.description,
             fields=fields,
             nodes=interface_type.nodes + extensions,  # type: ignore
+            cache_hint=interface_type.cache_hint,
         )
 
     def _extend_enum_type(self, enum_type: EnumType) -> EnumType:
@@ -515,6 +519,8 @@ class ASTTypeBuilder:
             parse=scalar_type._parse,
             parse_literal=scalar_type._parse_literal,
             nodes=scalar_type.nodes + extensions,  # type: ignore
+            serialize_many=scalar_type._serialize_many,
+            parse_many=scalar_type._parse_many,
         )
 
     def _extend_argument(self, argument: Argument) -> Argument:
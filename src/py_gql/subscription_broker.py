@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+"""
+Subscription fan-out.
+
+:func:`~py_gql.execution.subscribe` creates a source stream and executes
+every event for each subscriber, which is wasteful when many clients subscribe
+to the same data. :class:`SubscriptionBroker` groups subscribers of identical
+subscriptions so that every event is executed and encoded once per group and
+the encoded payload is delivered to all of its subscribers.
+"""
+
+from inspect import isawaitable
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .exc import (
+    ExecutionError,
+    GraphQLResponseError,
+    GraphQLSyntaxError,
+    InvalidOperationError,
+    VariablesCoercionError,
+)
+from .execution import GraphQLResult, get_operation, subscribe
+from .execution.runtime import SubscriptionRuntime
+from .lang import parse
+from .lang.ast import Document
+from .response_cache import encode_json, fingerprint
+from .schema import Schema
+from .validation import Validator, validate_ast
+
+
+__all__ = ("SubscriptionBroker", "Subscription")
+
+_END = object()
+_UNSET = object()
+
+
+class _Node:
+    # Linked list of the events of a group. Subscribers keep a reference to the
+    # next event they will receive which means that events are released once
+    # all subscribers have received them.
+
+    __slots__ = ("value", "next")
+
+    def __init__(self) -> None:
+        self.value = _UNSET  # type: Any
+        self.next = None  # type: Optional[_Node]
+
+
+class _Group:
+
+    __slots__ = (
+        "broker",
+        "key",
+        "ready",
+        "stream",
+        "tail",
+        "last",
+        "subscribers",
+        "pending",
+        "closed",
+    )
+
+    def __init__(self, broker: "SubscriptionBroker", key: Optional[str]):
+        self.broker = broker
+        self.key = key
+        self.ready = None  # type: Any
+        self.stream = None  # type: Any
+        # First event which hasn't been requested yet, new subscribers start
+        # from there.
+        self.tail = _Node()
+        self.last = None  # type: Any
+        self.subscribers = 0
+        self.pending = 0
+        self.closed = False
+
+    def advance(self, node: _Node) -> None:
+        # Request the event for ``node``. The resulting value is shared by all
+        # subscribers.
+        node.next = self.tail = _Node()
+        self.pending += 1
+        node.value = self.last = self.broker.runtime.share_value(
+            self._pull(self.last)
+        )
+
+    async def _pull(self, previous: Any) -> Any:
+        try:
+            if isawaitable(previous):
+                # Source streams do not support concurrent iteration.
+                try:
+                    await previous
+                except Exception:
+                    pass
+
+            if self.closed:
+                return _END
+
+            try:
+                return await type(self.stream).__anext__(self.stream)
+            except StopAsyncIteration:
+                return _END
+        finally:
+            self.pending -= 1
+            if self.closed and not self.pending:
+                await self.close_stream()
+
+    async def leave(self) -> None:
+        self.subscribers -= 1
+        if self.subscribers:
+            return
+
+        self.closed = True
+        self.broker._discard(self)
+        if not self.pending:
+            await self.close_stream()
+
+    async def close_stream(self) -> None:
+        aclose = getattr(self.stream, "aclose", None)
+        self.stream = None
+        if aclose is not None:
+            await aclose()
+
+
+class Subscription:
+    """
+    Asynchronous iterator over the encoded payloads of a subscription
+    created through :meth:`SubscriptionBroker.subscribe`.
+
+    Subscriptions must be closed with :meth:`aclose` once they are not used
+    anymore for the underlying source stream to be released when all
+    subscribers of a group are gone.
+    """
+
+    __slots__ = ("_group", "_node", "_closed")
+
+    def __init__(self, group: _Group):
+        self._group = group
+        self._node = group.tail  # type: Optional[_Node]
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the subscription has been closed or the source stream is
+        exhausted.
+        """
+        return self._closed
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        node = self._node
+        if node is None:
+            raise StopAsyncIteration()
+
+        if node.value is _UNSET:
+            self._group.advance(node)
+
+        payload = node.value
+        if isawaitable(payload):
+            payload = await payload
+        if payload is _END:
+            await self.aclose()
+            raise StopAsyncIteration()
+
+        # Only move forward once the payload has been received so that a
+        # cancelled subscriber receives it on the next iteration.
+        self._node = node.next
+        return payload
+
+    async def aclose(self) -> None:
+        """
+        Unsubscribe.
+        """
+        if not self._closed:
+            self._closed = True
+            self._node = None
+            await self._group.leave()
+
+
+class SubscriptionBroker:
+    """
+    Share the execution of identical subscriptions between subscribers.
+
+    Subscribers are grouped by document, operation name, variables and an
+    optional, user supplied, scope. For every group, a single source stream is
+    created (i.e. the subscription resolver is called once) and every event
+    is executed and encoded once before being delivered to all subscribers.
+
+    Events are executed with the root and context values of the subscriber
+    which created the group; use ``scope`` to separate subscribers for which
+    the result of the execution may differ (e.g. for different users).
+
+    Events are pulled from the source stream as the subscribers request them,
+    which means that the source stream is consumed at the pace of the fastest
+    subscriber while events are kept in memory until the slowest one has
+    received them. New subscribers only receive events which have not been
+    requested by the other subscribers of their group yet.
+
+    The source stream is closed when all subscribers of a group have
+    unsubscribed. With :class:`~py_gql.execution.runtime.trio.TrioRuntime`,
+    cancelling a subscriber while it is waiting for an event interrupts the
+    event for the whole group as Trio doesn't allow running it in the
+    background.
+
+    Args:
+        schema: Schema to execute subscriptions against.
+        runtime: Runtime used to execute subscriptions.
+        encode: Function used to encode results.
+        validators: Custom validators, see
+            :func:`~py_gql.process_graphql_query`.
+        **options: Other keyword arguments forwarded to
+            :func:`~py_gql.execution.subscribe`, such as ``executor_cls``.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        *,
+        runtime: SubscriptionRuntime,
+        encode: Callable[[GraphQLResult], Any] = encode_json,
+        validators: Optional[Sequence[Validator]] = None,
+        **options: Any
+    ):
+        self.schema = schema
+        self.runtime = runtime
+        self._encode = encode
+        self._validators = validators
+        self._options = options
+        self._groups = {}  # type: Dict[str, _Group]
+
+    def __len__(self) -> int:
+        """
+        Number of active groups.
+        """
+        return len(self._groups)
+
+    def subscribe(
+        self,
+        document: Union[str, Document],
+        *,
+        variables: Optional[Mapping[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        scope: Optional[Hashable] = None,
+        root: Any = None,
+        context: Any = None
+    ) -> Any:
+        """
+        Subscribe to a GraphQL subscription, joining the existing group for
+        identical subscriptions if there is one.
+
+        Args:
+            document: The subscription document.
+            variables: Raw, JSON decoded variables parsed from the request.
+            operation_name: Operation to execute.
+            scope: Identifies which subscribers can share the result of
+                executing events.
+            root: Root resolution value passed to the subscription resolver.
+            context: Custom application-specific execution context.
+
+        Returns:
+            A :class:`Subscription` or, if the subscription could not be
+            created (e.g. invalid document or variables), a
+            :class:`~py_gql.GraphQLResult` describing the errors. Wrapped
+            according to the runtime.
+        """
+        runtime = self.runtime
+        key = fingerprint(document, operation_name, variables, scope)
+        existing = self._groups.get(key) if key is not None else None
+
+        if existing is None:
+            group_or_result = self._create_group(
+                key, document, variables, operation_name, root, context
+            )
+            if isinstance(group_or_result, GraphQLResult):
+                return runtime.ensure_wrapped(group_or_result)
+            group = group_or_result
+        else:
+            group = existing
+
+        group.subscribers += 1
+
+        def _on_error(err: GraphQLResponseError) -> GraphQLResult:
+            group.subscribers -= 1
+            self._discard(group)
+            return GraphQLResult(data=None, errors=[err])
+
+        return runtime.ensure_wrapped(
+            runtime.map_value(
+                group.ready,
+                Subscription,
+                else_=(GraphQLResponseError, _on_error),
+            )
+        )
+
+    def _create_group(
+        self,
+        key: Optional[str],
+        document: Union[str, Document],
+        variables: Optional[Mapping[str, Any]],
+        operation_name: Optional[str],
+        root: Any,
+        context: Any,
+    ) -> Union[_Group, GraphQLResult]:
+        runtime = self.runtime
+
+        if isinstance(document, str):
+            try:
+                ast = parse(document)
+            except GraphQLSyntaxError as err:
+                return GraphQLResult(errors=[err])
+        else:
+            ast = document
+
+        validation_result = validate_ast(
+            self.schema, ast, validators=self._validators
+        )
+        if not validation_result:
+            return GraphQLResult(errors=validation_result.errors)
+
+        try:
+            operation = get_operation(ast, operation_name).operation
+            if operation != "subscription":
+                raise InvalidOperationError(
+                    "Expected a subscription operation but got a %s."
+                    % operation
+                )
+            source = subscribe(
+                self.schema,
+                ast,
+                operation_name=operation_name,
+                variables=variables,
+                initial_value=root,
+                context_value=context,
+                runtime=runtime,
+                **self._options,
+            )
+        except VariablesCoercionError as err:
+            return GraphQLResult(data=None, errors=err.errors)
+        except ExecutionError as err:
+            return GraphQLResult(data=None, errors=[err])
+
+        group = _Group(self, key)
+
+        def _on_stream_created(stream: Any) -> _Group:
+            group.stream = runtime.map_stream(stream, self._encode_result)
+            return group
+
+        group.ready = runtime.share_value(
+            runtime.map_value(source, _on_stream_created)
+        )
+
+        if key is not None:
+            self._groups[key] = group
+
+        return group
+
+    def _encode_result(self, result: GraphQLResult) -> Any:
+        return self.runtime.ensure_wrapped(self._encode(result))
+
+    def _discard(self, group: _Group) -> None:
+        if group.key is not None and self._groups.get(group.key) is group:
+            del self._groups[group.key]
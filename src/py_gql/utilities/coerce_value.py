@@ -4,7 +4,7 @@ Utilities to validate Python values against a schema / types.
 """
 
 import json
-from typing import Any, Dict, List, Mapping, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
 
 from .._utils import find_one
 from ..exc import (
@@ -111,6 +111,21 @@ def _coerce_list_value(
     path: Path,
 ) -> List[Any]:
     if isinstance(value, (list, tuple)):
+        item_type = type_.type
+        if isinstance(item_type, NonNullType):
+            item_type = item_type.type
+            nullable = False
+        else:
+            nullable = True
+
+        if isinstance(item_type, ScalarType):
+            try:
+                return _coerce_scalar_list_value(value, item_type, nullable)
+            except ScalarParsingError:
+                # Go through the entries one by one in order to collect all
+                # errors and their paths.
+                pass
+
         coerced = []
         errors = []
 
@@ -137,6 +152,21 @@ def _coerce_list_value(
         return [coerce_value(value, type_.type, node=node, path=path + [0])]
 
 
+def _coerce_scalar_list_value(
+    value: Sequence[Any], type_: ScalarType, nullable: bool
+) -> List[Any]:
+    present = [entry for entry in value if entry is not None]
+
+    if len(present) == len(value):
+        return type_.parse_many(present)
+
+    if not nullable:
+        raise ScalarParsingError("Expected non-nullable type %s" % type_)
+
+    parsed = iter(type_.parse_many(present))
+    return [None if entry is None else next(parsed) for entry in value]
+
+
 def _coerce_input_object(
     value: Any, type_: InputObjectType, node: Optional[_ast.Node], path: Path
 ) -> Dict[str, Any]:
@@ -0,0 +1,674 @@
+# -*- coding: utf-8 -*-
+"""
+GraphQL over websockets.
+
+:class:`WebSocketServer` implements the server side of the two protocols
+commonly used to execute GraphQL operations (and most importantly
+subscriptions) over websockets:
+
+- :data:`GRAPHQL_TRANSPORT_WS`: the `graphql-transport-ws
+  <https://github.com/enisdenjo/graphql-ws/blob/master/PROTOCOL.md>`_
+  protocol.
+- :data:`GRAPHQL_WS`: the legacy protocol of `subscriptions-transport-ws
+  <https://github.com/apollographql/subscriptions-transport-ws>`_.
+
+The server is not tied to any web framework: messages are exchanged through a
+:class:`Transport` which is simple to implement on top of any websocket
+library. :class:`MemoryTransport` is an in-memory implementation which is
+mostly useful for testing.
+
+Operations are executed on the AsyncIO runtime, each in its own task, and
+multiplexed over the connection.
+"""
+
+import asyncio
+import collections
+import functools as ft
+import json
+import time
+from inspect import isawaitable
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from .exc import (
+    ExecutionError,
+    GraphQLResponseError,
+    GraphQLSyntaxError,
+    VariablesCoercionError,
+)
+from .execution import (
+    Executor,
+    GraphQLResult,
+    execute,
+    get_operation,
+    subscribe,
+)
+from .execution.runtime import AsyncIORuntime, StreamBuffer
+from .lang import parse
+from .lang.ast import Document
+from .schema import Schema
+from .validation import Validator, validate_ast
+
+
+__all__ = (
+    "WebSocketServer",
+    "Transport",
+    "MemoryTransport",
+    "ConnectionRejected",
+    "select_subprotocol",
+    "GRAPHQL_TRANSPORT_WS",
+    "GRAPHQL_WS",
+    "SUBPROTOCOLS",
+)
+
+GRAPHQL_TRANSPORT_WS = "graphql-transport-ws"
+GRAPHQL_WS = "graphql-ws"
+
+#: Supported subprotocols, by order of preference.
+SUBPROTOCOLS = (GRAPHQL_TRANSPORT_WS, GRAPHQL_WS)
+
+_KEEP_ALIVE = json.dumps({"type": "ka"})
+_PING = json.dumps({"type": "ping"})
+_PONG = json.dumps({"type": "pong"})
+
+_Entry = Tuple[Optional[Document], List[GraphQLResponseError]]
+
+
+def select_subprotocol(requested: Iterable[str]) -> Optional[str]:
+    """
+    Pick the protocol to use among the subprotocols requested by a client
+    (i.e. the ``Sec-WebSocket-Protocol`` header), preferring the newer one.
+
+    >>> select_subprotocol(["graphql-ws", "graphql-transport-ws"])
+    'graphql-transport-ws'
+    >>> select_subprotocol(["foo"]) is None
+    True
+    """
+    requested = set(requested)
+    for subprotocol in SUBPROTOCOLS:
+        if subprotocol in requested:
+            return subprotocol
+    return None
+
+
+class ConnectionRejected(Exception):
+    """
+    Raise this in ``on_connect`` to refuse a connection.
+    """
+
+
+class Transport:
+    """
+    Interface between :class:`WebSocketServer` and a websocket
+    implementation.
+
+    Transports exchange text messages; encoding and decoding JSON is handled
+    by the server.
+    """
+
+    async def send(self, data: str) -> None:
+        """
+        Send a message to the client.
+        """
+        raise NotImplementedError()
+
+    async def receive(self) -> Optional[str]:
+        """
+        Wait for the next message from the client.
+
+        Returns:
+            The message or ``None`` once the connection has been closed.
+        """
+        raise NotImplementedError()
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        """
+        Close the connection.
+        """
+        raise NotImplementedError()
+
+
+class MemoryTransport(Transport):
+    """
+    In-memory transport.
+
+    The server uses the :class:`Transport` methods while the client side is
+    driven through :meth:`client_send`, :meth:`client_receive` and
+    :meth:`client_close`. Messages sent after the transport has been closed
+    are discarded.
+
+    Attributes:
+        close_code (Optional[int]): Close code once the transport has been
+            closed.
+        close_reason (Optional[str]): Close reason once the transport has
+            been closed.
+    """
+
+    def __init__(self) -> None:
+        self._to_server = asyncio.Queue()  # type: asyncio.Queue[Optional[str]]
+        self._to_client = asyncio.Queue()  # type: asyncio.Queue[Optional[str]]
+        self.close_code = None  # type: Optional[int]
+        self.close_reason = None  # type: Optional[str]
+
+    @property
+    def closed(self) -> bool:
+        return self.close_code is not None
+
+    async def send(self, data: str) -> None:
+        if not self.closed:
+            self._to_client.put_nowait(data)
+
+    async def receive(self) -> Optional[str]:
+        if self.closed:
+            return None
+        return await self._to_server.get()
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        if not self.closed:
+            self.close_code = code
+            self.close_reason = reason
+            self._to_client.put_nowait(None)
+            self._to_server.put_nowait(None)
+
+    def client_send(self, message: Any) -> None:
+        """
+        Send a message to the server. Non string messages are encoded to JSON.
+        """
+        self._to_server.put_nowait(
+            message if isinstance(message, str) else json.dumps(message)
+        )
+
+    async def client_receive(self) -> Any:
+        """
+        Wait for the next message from the server.
+
+        Returns:
+            The JSON decoded message or ``None`` once the connection has been
+            closed.
+        """
+        data = await self._to_client.get()
+        if data is None:
+            # Keep reporting the closed connection.
+            self._to_client.put_nowait(None)
+            return None
+        return json.loads(data)
+
+    def client_close(self, code: int = 1000) -> None:
+        """
+        Close the connection from the client side.
+        """
+        if not self.closed:
+            self.close_code = code
+            self.close_reason = ""
+            self._to_server.put_nowait(None)
+            self._to_client.put_nowait(None)
+
+
+class WebSocketServer:
+    """
+    Execute GraphQL operations received over websockets.
+
+    A single server is meant to handle all connections: parsed and validated
+    documents are cached and shared between them. Every connection can
+    execute up to ``max_operations`` operations concurrently, additional
+    operations are refused with an error message.
+
+    Args:
+        schema: Schema to execute operations against.
+        validators: Custom validators, see
+            :func:`~py_gql.process_graphql_query`.
+        runtime: Runtime used to execute operations.
+        executor_cls: Executor class to use.
+        buffer: Buffering configuration of subscription streams, see
+            :class:`~py_gql.execution.runtime.StreamBuffer`.
+        on_connect: Called with the ``connection_init`` payload and the
+            connection context, can be a coroutine function. Its return value
+            is used as context for the operations of the connection. Raise
+            :class:`ConnectionRejected` to refuse the connection.
+        keep_alive: Interval in seconds at which keep-alive messages are
+            sent. With :data:`GRAPHQL_TRANSPORT_WS` pings are only sent when
+            the client has been idle for this long. Set to ``None`` to
+            disable keep-alive messages.
+        connection_init_timeout: Delay in seconds after which connections
+            which haven't sent a ``connection_init`` message are closed. Set
+            to ``None`` to wait forever.
+        max_operations: Maximum number of concurrent operations per
+            connection. Set to ``None`` to disable the limit.
+        document_cache_size: Maximum number of parsed and validated documents
+            to keep. Set to ``0`` to disable caching.
+        **options: Other keyword arguments forwarded to
+            :func:`~py_gql.execution.execute` when executing queries and
+            mutations, such as ``middlewares`` or ``timeout``.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        *,
+        validators: Optional[Sequence[Validator]] = None,
+        runtime: Optional[AsyncIORuntime] = None,
+        executor_cls: Type[Executor] = Executor,
+        buffer: Optional[StreamBuffer] = None,
+        on_connect: Optional[Callable[[Any, Any], Any]] = None,
+        keep_alive: Optional[float] = 10,
+        connection_init_timeout: Optional[float] = 10,
+        max_operations: Optional[int] = 100,
+        document_cache_size: int = 256,
+        **options: Any
+    ):
+        schema.validate()
+
+        self.schema = schema
+        self.runtime = runtime or AsyncIORuntime()
+        self.on_connect = on_connect
+        self.keep_alive = keep_alive
+        self.connection_init_timeout = connection_init_timeout
+        self.max_operations = max_operations
+        self._validators = validators
+        self._executor_cls = executor_cls
+        self._buffer = buffer
+        self._options = options
+        self._document_cache_size = document_cache_size
+        self._documents = (
+            collections.OrderedDict()
+        )  # type: collections.OrderedDict[str, _Entry]
+
+    async def handle(
+        self,
+        transport: Transport,
+        subprotocol: str = GRAPHQL_TRANSPORT_WS,
+        *,
+        context: Any = None,
+        root: Any = None
+    ) -> None:
+        """
+        Handle a websocket connection until it is closed.
+
+        The connection must have been accepted with ``subprotocol``; use
+        :func:`select_subprotocol` to pick it during the handshake.
+
+        Args:
+            transport: Connection to the client.
+            subprotocol: Protocol used on this connection.
+            context: Context value for the operations of this connection.
+            root: Root value for the operations of this connection.
+        """
+        if subprotocol not in SUBPROTOCOLS:
+            raise ValueError("Unsupported subprotocol %r" % subprotocol)
+
+        await _Connection(self, transport, subprotocol, context, root).run()
+
+    def prepare(self, query: str) -> _Entry:
+        """
+        Parse and validate a document, reusing cached results.
+
+        Returns:
+            The parsed document and any syntax or validation errors.
+        """
+        documents = self._documents
+        try:
+            entry = documents[query]
+        except KeyError:
+            entry = self._parse_and_validate(query)
+            if self._document_cache_size > 0:
+                documents[query] = entry
+                if len(documents) > self._document_cache_size:
+                    documents.popitem(last=False)
+        else:
+            documents.move_to_end(query)
+        return entry
+
+    def _parse_and_validate(self, query: str) -> _Entry:
+        try:
+            document = parse(query)
+        except GraphQLSyntaxError as err:
+            return None, [err]
+
+        validation_result = validate_ast(
+            self.schema, document, validators=self._validators
+        )
+        if not validation_result:
+            return None, list(validation_result.errors)
+
+        return document, []
+
+
+class _Connection:
+
+    __slots__ = (
+        "server",
+        "transport",
+        "legacy",
+        "context",
+        "root",
+        "init_received",
+        "acknowledged",
+        "last_received",
+        "operations",
+        "done",
+    )
+
+    def __init__(
+        self,
+        server: WebSocketServer,
+        transport: Transport,
+        subprotocol: str,
+        context: Any,
+        root: Any,
+    ):
+        self.server = server
+        self.transport = transport
+        self.legacy = subprotocol == GRAPHQL_WS
+        self.context = context
+        self.root = root
+        self.init_received = False
+        self.acknowledged = False
+        self.last_received = time.monotonic()
+        self.operations = {}  # type: Dict[str, asyncio.Future[Any]]
+        self.done = asyncio.get_event_loop().create_future()
+
+    async def run(self) -> None:
+        background = [asyncio.ensure_future(self._read())]
+        if self.server.connection_init_timeout is not None:
+            background.append(asyncio.ensure_future(self._init_timeout()))
+
+        try:
+            await asyncio.wait(
+                [background[0], self.done], return_when=asyncio.FIRST_COMPLETED
+            )
+            if background[0].done():
+                # Surface transport errors.
+                background[0].result()
+        finally:
+            if not self.done.done():
+                self.done.set_result(None)
+            pending = background + list(self.operations.values())
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _read(self) -> None:
+        while not self.done.done():
+            data = await self.transport.receive()
+            if data is None:
+                return
+            self.last_received = time.monotonic()
+            await self._handle(data)
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        await self.transport.send(json.dumps(message, separators=(",", ":")))
+
+    async def _close(self, code: int, reason: str) -> None:
+        if not self.done.done():
+            self.done.set_result(None)
+            await self.transport.close(code, reason)
+
+    async def _init_timeout(self) -> None:
+        await asyncio.sleep(self.server.connection_init_timeout)  # type: ignore
+        if not self.init_received:
+            await self._close(4408, "Connection initialisation timeout")
+
+    async def _keep_alive(self, interval: float) -> None:
+        if self.legacy:
+            # Legacy clients expect keep-alive messages at regular intervals
+            # regardless of other traffic.
+            while True:
+                await self.transport.send(_KEEP_ALIVE)
+                await asyncio.sleep(interval)
+
+        delay = interval
+        while True:
+            await asyncio.sleep(delay)
+            idle = time.monotonic() - self.last_received
+            if idle >= interval:
+                await self.transport.send(_PING)
+                delay = interval
+            else:
+                delay = interval - idle
+
+    async def _handle(self, data: str) -> None:
+        try:
+            message = json.loads(data)
+            type_ = message["type"]
+        except (ValueError, TypeError, KeyError):
+            return await self._invalid("Invalid message")
+
+        if not isinstance(type_, str):
+            return await self._invalid("Invalid message")
+
+        if type_ == "connection_init":
+            return await self._init(message.get("payload"))
+
+        if self.legacy:
+            if type_ == "start":
+                return await self._start(message)
+            elif type_ == "stop":
+                return self._stop(message.get("id"))
+            elif type_ == "connection_terminate":
+                return await self._close(1000, "")
+        else:
+            if type_ == "subscribe":
+                return await self._start(message)
+            elif type_ == "complete":
+                return self._stop(message.get("id"))
+            elif type_ == "ping":
+                return await self.transport.send(_PONG)
+            elif type_ == "pong":
+                return None
+
+        await self._invalid("Unknown message type %r" % type_)
+
+    async def _invalid(self, reason: str, op_id: Any = None) -> None:
+        if not self.legacy:
+            await self._close(4400, reason)
+        elif op_id is None:
+            await self._send(
+                {"type": "connection_error", "payload": {"message": reason}}
+            )
+        else:
+            await self._send_error(op_id, reason)
+
+    async def _init(self, payload: Any) -> None:
+        if self.init_received:
+            if not self.legacy:
+                await self._close(4429, "Too many initialisation requests")
+            return
+
+        self.init_received = True
+
+        on_connect = self.server.on_connect
+        if on_connect is not None:
+            try:
+                context = on_connect(payload, self.context)
+                if isawaitable(context):
+                    context = await context
+            except ConnectionRejected as err:
+                reason = str(err) or "Forbidden"
+                if self.legacy:
+                    await self._send(
+                        {
+                            "type": "connection_error",
+                            "payload": {"message": reason},
+                        }
+                    )
+                return await self._close(4403, reason)
+            self.context = context
+
+        self.acknowledged = True
+        await self._send({"type": "connection_ack"})
+
+        if self.server.keep_alive is not None:
+            task = asyncio.ensure_future(
+                self._keep_alive(self.server.keep_alive)
+            )
+            # Cancelled along with the connection.
+            self.done.add_done_callback(lambda _: task.cancel())
+
+    async def _start(self, message: Dict[str, Any]) -> None:
+        op_id = message.get("id")
+        payload = message.get("payload")
+        if (
+            not isinstance(op_id, str)
+            or not isinstance(payload, dict)
+            or not isinstance(payload.get("query"), str)
+        ):
+            return await self._invalid(
+                "Invalid %s message" % message["type"],
+                op_id if isinstance(op_id, str) else None,
+            )
+
+        if not self.acknowledged:
+            if self.legacy:
+                return await self._send_error(
+                    op_id, "Connection has not been initialised"
+                )
+            return await self._close(4401, "Unauthorized")
+
+        if op_id in self.operations:
+            if not self.legacy:
+                return await self._close(
+                    4409, "Subscriber for %s already exists" % op_id
+                )
+            self._stop(op_id)
+
+        limit = self.server.max_operations
+        if limit is not None and len(self.operations) >= limit:
+            return await self._send_error(
+                op_id, "Too many concurrent operations"
+            )
+
+        task = asyncio.ensure_future(
+            self._execute(
+                op_id,
+                payload["query"],
+                payload.get("variables"),
+                payload.get("operationName"),
+            )
+        )
+        self.operations[op_id] = task
+        task.add_done_callback(ft.partial(self._discard, op_id))
+
+    def _stop(self, op_id: Any) -> None:
+        task = self.operations.pop(op_id, None)
+        if task is not None:
+            task.cancel()
+
+    def _discard(self, op_id: str, task: "asyncio.Future[Any]") -> None:
+        if self.operations.get(op_id) is task:
+            del self.operations[op_id]
+
+    async def _execute(self, op_id: str, *args: Any) -> None:
+        try:
+            await self._run(op_id, *args)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Let the client know before the error is reported by the event
+            # loop.
+            await self._send_error(op_id, "Internal server error")
+            raise
+
+    async def _run(
+        self,
+        op_id: str,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> None:
+        server = self.server
+        document, errors = server.prepare(query)
+        if document is None:
+            return await self._send_errors(op_id, errors)
+
+        try:
+            operation = get_operation(document, operation_name).operation
+            if operation == "subscription":
+                stream = await subscribe(
+                    server.schema,
+                    document,
+                    operation_name=operation_name,
+                    variables=variables,
+                    initial_value=self.root,
+                    context_value=self.context,
+                    runtime=server.runtime,
+                    executor_cls=server._executor_cls,
+                    buffer=server._buffer,
+                )
+            else:
+                result = await execute(
+                    server.schema,
+                    document,
+                    operation_name=operation_name,
+                    variables=variables,
+                    initial_value=self.root,
+                    context_value=self.context,
+                    runtime=server.runtime,
+                    executor_cls=server._executor_cls,
+                    **server._options,
+                )
+        except VariablesCoercionError as err:
+            return await self._send_errors(op_id, err.errors)
+        except ExecutionError as err:
+            return await self._send_errors(op_id, [err])
+
+        if operation == "subscription":
+            try:
+                async for result in stream:
+                    await self._send_result(op_id, result)
+            finally:
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+        else:
+            await self._send_result(op_id, result)
+
+        # Release the id before notifying the client which may reuse it.
+        self.operations.pop(op_id, None)
+        await self._send({"type": "complete", "id": op_id})
+
+    async def _send_result(self, op_id: str, result: GraphQLResult) -> None:
+        await self._send(
+            {
+                "type": "data" if self.legacy else "next",
+                "id": op_id,
+                "payload": result.response(),
+            }
+        )
+
+    async def _send_errors(
+        self, op_id: str, errors: Sequence[GraphQLResponseError]
+    ) -> None:
+        # Errors preventing execution of an operation (syntax, validation,
+        # variables, etc.)
+        payload = [err.to_dict() for err in errors]
+        self.operations.pop(op_id, None)
+        if self.legacy:
+            await self._send(
+                {"type": "data", "id": op_id, "payload": {"errors": payload}}
+            )
+            await self._send({"type": "complete", "id": op_id})
+        else:
+            await self._send({"type": "error", "id": op_id, "payload": payload})
+
+    async def _send_error(self, op_id: str, message: str) -> None:
+        # Protocol level errors for a given operation.
+        await self._send(
+            {
+                "type": "error",
+                "id": op_id,
+                "payload": (
+                    {"message": message}
+                    if self.legacy
+                    else [{"message": message}]
+                ),
+            }
+        )
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+WSGI adapter.
+
+:class:`GraphQLApp` serves a schema over HTTP as a `WSGI
+<https://www.python.org/dev/peps/pep-3333/>`_ application which can be run
+by any WSGI server (e.g. ``gunicorn``) or mounted in any WSGI framework.
+
+>>> from py_gql import build_schema
+>>> app = GraphQLApp(build_schema("type Query { hello: String }"))
+>>> # wsgiref.simple_server.make_server("", 8000, app).serve_forever()
+"""
+
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from ._graphql import process_graphql_batch
+from ._http import (
+    BaseGraphQLApp,
+    HTTPError,
+    executable,
+    merge_results,
+    status_line,
+)
+from .execution import BlockingExecutor
+from .execution.runtime import Runtime
+from .schema import Schema
+
+
+__all__ = ("GraphQLApp",)
+
+
+class GraphQLApp(BaseGraphQLApp):
+    """
+    WSGI application executing GraphQL requests.
+
+    Supports the same requests and options as :class:`py_gql.asgi.GraphQLApp`
+    and the response body is returned as an iterator of chunks of about
+    ``chunk_size`` bytes.
+
+    Args:
+        schema: Schema to execute requests against.
+        runtime: Runtime used to execute requests. Defaults to executing
+            resolvers in the current thread with
+            :class:`~py_gql.execution.BlockingExecutor`; runtimes returning
+            futures such as
+            :class:`~py_gql.execution.runtime.ThreadPoolRuntime` are
+            supported.
+        context: Function called with the WSGI environ to build the context
+            value of a request. Defaults to using the environ itself.
+        **kwargs: See :class:`py_gql.asgi.GraphQLApp`.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        *,
+        runtime: Optional[Runtime] = None,
+        context: Optional[Callable[[Any], Any]] = None,
+        **kwargs: Any
+    ):
+        if runtime is None:
+            kwargs.setdefault("executor_cls", BlockingExecutor)
+        super().__init__(schema, context=context, **kwargs)
+        self.runtime = runtime
+
+    def __call__(
+        self, environ: Dict[str, Any], start_response: Callable[..., Any]
+    ) -> Iterable[bytes]:
+        try:
+            operations, batch = self.prepare(
+                environ["REQUEST_METHOD"],
+                environ.get("QUERY_STRING", ""),
+                environ.get("CONTENT_TYPE", ""),
+                self._read_body(environ),
+            )
+        except HTTPError as err:
+            status, headers, chunks = self.error_response(err)
+        else:
+            to_execute = executable(operations)
+            results = []  # type: Any
+            if to_execute:
+                results = process_graphql_batch(
+                    self.schema,
+                    to_execute,
+                    root=self.root,
+                    context=(
+                        self.context(environ)
+                        if self.context is not None
+                        else environ
+                    ),
+                    runtime=self.runtime,
+                    **self._options,
+                )
+                if isinstance(results, Future):
+                    results = results.result()
+
+            status, headers, chunks = self.response(
+                merge_results(operations, results),
+                batch,
+                environ.get("HTTP_ACCEPT_ENCODING", ""),
+            )
+
+        start_response(status_line(status), headers)
+        return chunks
+
+    def _read_body(self, environ: Dict[str, Any]) -> bytes:
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length header")
+
+        if self.max_body_size is not None and length > self.max_body_size:
+            raise HTTPError(413, "Request body is too large")
+
+        return environ["wsgi.input"].read(length) if length > 0 else b""
@@ -1,14 +1,22 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 import collections
 import random
 
+import pytest
+
 import py_gql
+from py_gql.execution.runtime import AsyncIORuntime, ThreadPoolRuntime
+from py_gql.execution.runtime.hints import non_blocking
 
 
 SIZE = 10000
 
 FooType = collections.namedtuple("Object", ["x", "y", "z"])
+Foo = collections.namedtuple("Foo", ["x", "y", "z"])
+Bar = collections.namedtuple("Bar", ["x"])
+
 
 LIST_OF_INTS = range(SIZE)
 LIST_OF_FLOATS = [random.random() for x in range(SIZE)]
@@ -16,6 +24,8 @@ LIST_OF_STRINGS = [str(x) for x in range(SIZE)]
 LIST_OF_BOOLS = [bool(x % 2) for x in range(SIZE)]
 LIST_OF_OBJECTS = [FooType(x, x, x) for x in range(SIZE)]
 LIST_OF_DICTS = [{"x": x, "y": x, "z": x} for x in range(SIZE)]
+LIST_OF_UNIONS = [Foo(x, x, x) if x % 2 else Bar(x) for x in range(SIZE)]
+LIST_OF_ENUMS = [("RED", "GREEN", "BLUE")[x % 3] for x in range(SIZE)]
 
 schema = py_gql.build_schema(
     """
@@ -23,6 +33,29 @@ schema = py_gql.build_schema(
         x: Int,
         y: Int,
         z: Int,
+        computed: Int,
+        batch_computed: Int,
+        non_blocking_computed: Int,
+    }
+
+    type Bar {
+        x: Int,
+    }
+
+    type AsyncFoo {
+        x: Int,
+        y: Int,
+        z: Int,
+        computed: Int,
+        batch_computed: Int,
+    }
+
+    union FooOrBar = Foo | Bar
+
+    enum Color {
+        RED
+        GREEN
+        BLUE
     }
 
     type Query {
@@ -34,6 +67,9 @@ schema = py_gql.build_schema(
         list_of_bools: [Boolean],
         list_of_objects: [Foo],
         list_of_dicts: [Foo],
+        list_of_enums: [Color],
+        list_of_unions: [FooOrBar],
+        async_list_of_objects: [AsyncFoo],
     }
     """
 )
@@ -71,6 +107,45 @@ def _resolve_list_of_floats(*_, **__):
     return LIST_OF_FLOATS
 
 
+@schema.resolver("Query.list_of_enums")
+def _resolve_list_of_enums(*_, **__):
+    return LIST_OF_ENUMS
+
+
+@schema.resolver("Query.list_of_unions")
+def _resolve_list_of_unions(*_, **__):
+    return LIST_OF_UNIONS
+
+
+@schema.resolver("Query.async_list_of_objects")
+async def _resolve_async_list_of_objects(*_, **__):
+    return LIST_OF_OBJECTS
+
+
+# Async resolver which never actually needs to wait, e.g. a cache hit.
+@schema.resolver("AsyncFoo.x")
+async def _resolve_async_foo_x(root, *_, **__):
+    return root.x
+
+
+@schema.resolver("Foo.computed")
+@schema.resolver("AsyncFoo.computed")
+def _resolve_computed(root, *_, **__):
+    return root.x * 2
+
+
+@schema.resolver("Foo.non_blocking_computed")
+@non_blocking
+def _resolve_non_blocking_computed(root, *_, **__):
+    return root.x * 2
+
+
+@schema.resolver("Foo.batch_computed", batch=True)
+@schema.resolver("AsyncFoo.batch_computed", batch=True)
+def _resolve_batch_computed(roots, *_, **__):
+    return [root.x * 2 for root in roots]
+
+
 def test_list_of_ints(benchmark):
     benchmark(py_gql.graphql_blocking, schema, "{ list_of_ints }")
 
@@ -95,6 +170,10 @@ def test_list_of_string_ids(benchmark):
     benchmark(py_gql.graphql_blocking, schema, "{ list_of_string_ids }")
 
 
+def test_list_of_enums(benchmark):
+    benchmark(py_gql.graphql_blocking, schema, "{ list_of_enums }")
+
+
 def test_list_of_objects_one_field(benchmark):
     benchmark(py_gql.graphql_blocking, schema, "{ list_of_objects { x } }")
 
@@ -103,6 +182,20 @@ def test_list_of_objects_two_fields(benchmark):
     benchmark(py_gql.graphql_blocking, schema, "{ list_of_objects { x y } }")
 
 
+def test_list_of_objects_computed_field(benchmark):
+    benchmark(
+        py_gql.graphql_blocking, schema, "{ list_of_objects { computed } }"
+    )
+
+
+def test_list_of_objects_batch_computed_field(benchmark):
+    benchmark(
+        py_gql.graphql_blocking,
+        schema,
+        "{ list_of_objects { batch_computed } }",
+    )
+
+
 def test_list_of_dicts_one_field(benchmark):
     benchmark(py_gql.graphql_blocking, schema, "{ list_of_dicts { x } }")
 
@@ -111,6 +204,74 @@ def test_list_of_dicts_two_fields(benchmark):
     benchmark(py_gql.graphql_blocking, schema, "{ list_of_dicts { x y } }")
 
 
+def test_list_of_unions(benchmark):
+    benchmark(
+        py_gql.graphql_blocking,
+        schema,
+        "{ list_of_unions { ... on Foo { x } ... on Bar { x } } }",
+    )
+
+
+@pytest.mark.parametrize("eager", [False, True], ids=["default", "eager"])
+@pytest.mark.parametrize(
+    "query",
+    [
+        "{ async_list_of_objects { y z } }",
+        "{ async_list_of_objects { x y z } }",
+    ],
+    ids=["sync_fields", "mixed_fields"],
+)
+def test_async_list_of_objects(benchmark, eager, query):
+    loop = asyncio.new_event_loop()
+    runtime = AsyncIORuntime(
+        loop=loop, execute_blocking_functions_in_thread=False, eager=eager
+    )
+    try:
+        benchmark(
+            lambda: loop.run_until_complete(
+                py_gql.process_graphql_query(schema, query, runtime=runtime)
+            )
+        )
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize(
+    "field", ["computed", "batch_computed"],
+)
+def test_async_list_of_objects_computed_field(benchmark, field):
+    # Synchronous resolvers are run in threads by default.
+    loop = asyncio.new_event_loop()
+    runtime = AsyncIORuntime(loop=loop)
+    query = "{ async_list_of_objects { %s } }" % field
+    try:
+        benchmark(
+            lambda: loop.run_until_complete(
+                py_gql.process_graphql_query(schema, query, runtime=runtime)
+            )
+        )
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "{ list_of_objects { x y z } }",
+        "{ list_of_objects { computed } }",
+        "{ list_of_objects { non_blocking_computed } }",
+    ],
+    ids=["default_resolvers", "computed", "non_blocking_computed"],
+)
+def test_threadpool_list_of_objects(benchmark, query):
+    runtime = ThreadPoolRuntime(max_workers=4)
+    benchmark(
+        lambda: py_gql.process_graphql_query(
+            schema, query, runtime=runtime
+        ).result()
+    )
+
+
 def test_introspection_query(benchmark, fixture_file):
     github_schema = py_gql.build_schema(fixture_file("github-schema.graphql"))
     query = py_gql.utilities.introspection_query()
@@ -1,7 +1,13 @@
 # -*- coding: utf-8 -*-
+import functools as ft
+
 import pytest
 
-from py_gql.execution import BlockingExecutor, Executor
+from py_gql.execution import (
+    BlockingExecutor,
+    BreadthFirstExecutor,
+    Executor,
+)
 from py_gql.execution.runtime import (
     AsyncIORuntime,
     BlockingRuntime,
@@ -16,6 +22,16 @@ from ._test_utils import assert_execution as assert_execution_original
         pytest.param((Executor, BlockingRuntime), id="default"),
         pytest.param((BlockingExecutor, BlockingRuntime), id="blocking"),
         pytest.param((Executor, AsyncIORuntime), id="asyncio"),
+        pytest.param(
+            (Executor, ft.partial(AsyncIORuntime, eager=True)),
+            id="asyncio-eager",
+        ),
+        pytest.param(
+            (BreadthFirstExecutor, BlockingRuntime), id="breadth-first"
+        ),
+        pytest.param(
+            (BreadthFirstExecutor, AsyncIORuntime), id="breadth-first-asyncio"
+        ),
         pytest.param((Executor, ThreadPoolRuntime), id="threadpool"),
     )
 )
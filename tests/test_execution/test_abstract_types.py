@@ -286,6 +286,106 @@ async def test_type_resolution_supports_object_attribute(assert_execution):
     )
 
 
+async def test_type_resolution_mixes_class_and_instance_attributes(
+    assert_execution,
+):
+    PetType = InterfaceType("Pet", [Field("name", String)])
+
+    DogType = ObjectType("Dog", [Field("name", String)], interfaces=[PetType])
+    CatType = ObjectType("Cat", [Field("name", String)], interfaces=[PetType])
+
+    class Pet:
+        __typename__ = "Dog"
+
+        def __init__(self, name, typename=None):
+            self.name = name
+            if typename is not None:
+                self.__typename__ = typename
+
+    class Cat:
+        __slots__ = ("name",)
+
+        def __init__(self, name):
+            self.name = name
+
+    schema = Schema(
+        ObjectType(
+            "Query",
+            [
+                Field(
+                    "pets",
+                    ListType(PetType),
+                    resolver=lambda *_: [
+                        Pet("Odie"),
+                        Pet("Garfield", "Cat"),
+                        Cat("Tom"),
+                        {"name": "Snoopy", "__typename__": "Dog"},
+                        Pet("Pluto"),
+                    ],
+                )
+            ],
+        ),
+        types=[DogType, CatType],
+    )
+
+    await assert_execution(
+        schema,
+        "{ pets { name, __typename } }",
+        expected_data={
+            "pets": [
+                {"name": "Odie", "__typename": "Dog"},
+                {"name": "Garfield", "__typename": "Cat"},
+                {"name": "Tom", "__typename": "Cat"},
+                {"name": "Snoopy", "__typename": "Dog"},
+                {"name": "Pluto", "__typename": "Dog"},
+            ]
+        },
+    )
+
+
+async def test_type_resolution_supports_dynamic_typename_attributes(
+    assert_execution,
+):
+    PetType = InterfaceType("Pet", [Field("name", String)])
+
+    DogType = ObjectType("Dog", [Field("name", String)], interfaces=[PetType])
+    CatType = ObjectType("Cat", [Field("name", String)], interfaces=[PetType])
+
+    class Pet:
+        def __init__(self, name, typename):
+            self.name = name
+            self._typename = typename
+
+        @property
+        def __typename__(self):
+            return self._typename
+
+    schema = Schema(
+        ObjectType(
+            "Query",
+            [
+                Field(
+                    "pets",
+                    ListType(PetType),
+                    resolver=lambda *_: [Pet("Odie", "Dog"), Pet("Tom", "Cat")],
+                )
+            ],
+        ),
+        types=[DogType, CatType],
+    )
+
+    await assert_execution(
+        schema,
+        "{ pets { name, __typename } }",
+        expected_data={
+            "pets": [
+                {"name": "Odie", "__typename": "Dog"},
+                {"name": "Tom", "__typename": "Cat"},
+            ]
+        },
+    )
+
+
 NamedType = InterfaceType("Named", [Field("name", String)])
 
 DogType = ObjectType(
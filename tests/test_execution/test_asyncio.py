@@ -4,16 +4,26 @@ Execution tests specific to AsyncIORuntime().
 """
 
 import asyncio
-from typing import Any, Awaitable, cast
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, List, cast
 
 import pytest
 
 from py_gql import build_schema
 from py_gql.exc import ResolverError
+from py_gql.execution import Instrumentation
 from py_gql.execution.runtime import AsyncIORuntime
+from py_gql.execution.runtime.hints import max_concurrency, non_blocking
 
 from ._test_utils import assert_execution
 
+# Coroutines are only started eagerly with asyncio.eager_task_factory.
+requires_eager_tasks = pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="Requires Python 3.12+"
+)
 
 schema = build_schema(
     """
@@ -175,6 +185,23 @@ async def test_AsyncIORuntime_gather_values_surfaces_errors():
         AsyncIORuntime().gather_values([a()])
 
 
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_gather_values_closes_pending_on_error():
+    async def a():
+        return 42
+
+    coro = a()
+
+    def values():
+        yield coro
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        AsyncIORuntime().gather_values(values())
+
+    assert coro.cr_frame is None
+
+
 @pytest.mark.asyncio
 async def test_AsyncIORuntime_map_value_sync_ok():
     assert AsyncIORuntime().map_value(42, lambda x: x * 2) == 84
@@ -228,3 +255,390 @@ async def test_AsyncIORuntime_map_value_async_caught(raiser):
         )
         == 42
     )
+
+
+class _ConcurrencyTracker:
+    def __init__(self):
+        self.current = 0
+        self.max = 0
+
+    async def track(self, value):
+        self.current += 1
+        self.max = max(self.max, self.current)
+        await asyncio.sleep(0.001)
+        self.current -= 1
+        return value
+
+
+def _concurrency_schema(tracker, **decorators):
+    limited_schema = build_schema(
+        """
+        type Item {
+            value: Int
+        }
+
+        type Query {
+            items: [Item]
+        }
+        """
+    )
+
+    limited_schema.register_resolver(
+        "Query", "items", lambda *_: list(range(20))
+    )
+
+    async def resolve_value(root, *_):
+        return await tracker.track(root)
+
+    for decorator in decorators.values():
+        resolve_value = decorator(resolve_value)
+
+    limited_schema.register_resolver("Item", "value", resolve_value)
+    return limited_schema
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_max_concurrency():
+    tracker = _ConcurrencyTracker()
+
+    await assert_execution(
+        _concurrency_schema(tracker),
+        "{ items { value } }",
+        expected_data={"items": [{"value": i} for i in range(20)]},
+        runtime=AsyncIORuntime(max_concurrency=3),
+    )
+
+    assert tracker.max == 3
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_max_concurrency_blocking_resolvers():
+    tracker = _ConcurrencyTracker()
+    schema_ = _concurrency_schema(tracker)
+    lock = threading.Lock()
+    current = [0, 0]
+
+    def resolve_value(root, *_):
+        with lock:
+            current[0] += 1
+            current[1] = max(current)
+        time.sleep(0.001)
+        with lock:
+            current[0] -= 1
+        return root
+
+    schema_.register_resolver(
+        "Item", "value", resolve_value, allow_override=True
+    )
+
+    await assert_execution(
+        schema_,
+        "{ items { value } }",
+        expected_data={"items": [{"value": i} for i in range(20)]},
+        runtime=AsyncIORuntime(max_concurrency=2),
+    )
+
+    assert current[1] <= 2
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_resolver_max_concurrency():
+    tracker = _ConcurrencyTracker()
+
+    await assert_execution(
+        _concurrency_schema(tracker, limit=max_concurrency(2)),
+        "{ items { value } }",
+        expected_data={"items": [{"value": i} for i in range(20)]},
+        runtime=AsyncIORuntime(),
+    )
+
+    assert tracker.max == 2
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_resolver_and_global_max_concurrency():
+    tracker = _ConcurrencyTracker()
+
+    await assert_execution(
+        _concurrency_schema(tracker, limit=max_concurrency(5)),
+        "{ items { value } }",
+        expected_data={"items": [{"value": i} for i in range(20)]},
+        runtime=AsyncIORuntime(max_concurrency=3),
+    )
+
+    assert tracker.max == 3
+
+
+def test_AsyncIORuntime_rejects_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        AsyncIORuntime(max_concurrency=0)
+
+
+def test_max_concurrency_rejects_invalid_limit():
+    with pytest.raises(ValueError):
+        max_concurrency(0)
+
+
+def _thread_name_schema(resolver):
+    thread_schema = build_schema("type Query { thread: String }")
+    thread_schema.register_resolver("Query", "thread", resolver)
+    return thread_schema
+
+
+def _current_thread_name(*_):
+    return threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_uses_provided_executor():
+    with ThreadPoolExecutor(1, thread_name_prefix="custom") as executor:
+        await assert_execution(
+            _thread_name_schema(_current_thread_name),
+            "{ thread }",
+            expected_data={"thread": "custom_0"},
+            runtime=AsyncIORuntime(executor=executor),
+        )
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_creates_executor_with_max_workers():
+    with AsyncIORuntime(max_workers=1) as runtime:
+        await assert_execution(
+            _thread_name_schema(_current_thread_name),
+            "{ thread }",
+            expected_data={"thread": "py_gql_0"},
+            runtime=runtime,
+        )
+
+    with pytest.raises(RuntimeError):
+        runtime._executor.submit(_current_thread_name)
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_does_not_shutdown_provided_executor():
+    with ThreadPoolExecutor(1) as executor:
+        AsyncIORuntime(executor=executor).shutdown()
+        assert executor.submit(lambda: 42).result() == 42
+
+
+def test_AsyncIORuntime_rejects_executor_and_max_workers():
+    with pytest.raises(ValueError):
+        AsyncIORuntime(executor=ThreadPoolExecutor(1), max_workers=1)
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_runs_non_blocking_resolvers_inline():
+    await assert_execution(
+        _thread_name_schema(non_blocking(lambda *_: _current_thread_name())),
+        "{ thread }",
+        expected_data={"thread": threading.current_thread().name},
+        runtime=AsyncIORuntime(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_thread_pool_stats():
+    runtime = AsyncIORuntime(max_workers=1)
+    tracker = _ConcurrencyTracker()
+    schema_ = _concurrency_schema(tracker)
+    schema_.register_resolver(
+        "Item",
+        "value",
+        lambda root, *_: time.sleep(0.001) or root,
+        allow_override=True,
+    )
+
+    await assert_execution(
+        schema_,
+        "{ items { value } }",
+        expected_data={"items": [{"value": i} for i in range(20)]},
+        runtime=runtime,
+    )
+
+    stats = runtime.thread_pool_stats
+    # Query.items + 20 x Item.value
+    assert stats.submitted == stats.completed == 21
+    assert stats.queued == stats.running == 0
+    assert 1 < stats.max_queued <= 21
+    assert stats.max_wait_time > 0
+    assert 0 < stats.average_wait_time <= stats.max_wait_time
+
+
+@requires_eager_tasks
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_eager_unwraps_coroutines_synchronously():
+    async def a():
+        return 42
+
+    async def b():
+        return a()
+
+    assert AsyncIORuntime(eager=True).unwrap_value(b()) == 42
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_eager_unwraps_done_futures_synchronously():
+    future = asyncio.get_event_loop().create_future()
+    future.set_result(42)
+    assert AsyncIORuntime(eager=True).unwrap_value(future) == 42
+
+
+@requires_eager_tasks
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_eager_map_value_synchronously():
+    async def a():
+        return 42
+
+    assert AsyncIORuntime(eager=True).map_value(a(), lambda x: x * 2) == 84
+
+
+@requires_eager_tasks
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_eager_map_value_caught():
+    async def a():
+        raise ValueError()
+
+    assert (
+        AsyncIORuntime(eager=True).map_value(
+            a(), lambda x: x, (ValueError, lambda _: 42)
+        )
+        == 42
+    )
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_eager_map_value_suspended_coroutine():
+    async def a():
+        await asyncio.sleep(0)
+        return 42
+
+    result = AsyncIORuntime(eager=True).map_value(a(), lambda x: x * 2)
+    assert await cast(Awaitable[int], result) == 84
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_eager_map_value_on_same_pending_future():
+    future = asyncio.get_event_loop().create_future()
+
+    async def a():
+        return await future
+
+    runtime = AsyncIORuntime(eager=True)
+    first = runtime.map_value(a(), lambda x: x * 2)
+    second = runtime.map_value(a(), lambda x: x * 3)
+    future.set_result(14)
+    assert await cast(Awaitable[int], first) == 28
+    assert await cast(Awaitable[int], second) == 42
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="Requires contextvars")
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_eager_coroutines_keep_their_task_and_context():
+    import contextvars
+
+    var = contextvars.ContextVar("var", default=None)  # type: Any
+
+    async def a():
+        task = asyncio.current_task()
+        var.set(42)
+        await asyncio.sleep(0)
+        assert asyncio.current_task() is task
+        return var.get()
+
+    runtime = AsyncIORuntime(eager=True)
+    result = runtime.gather_values(
+        [runtime.map_value(a(), lambda x: x), runtime.map_value(a(), str)]
+    )
+
+    assert await cast(Awaitable[List[Any]], result) == [42, "42"]
+    assert var.get() is None
+
+
+@requires_eager_tasks
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_eager_forwards_cancellation():
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def a():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    task = asyncio.ensure_future(
+        AsyncIORuntime(eager=True).ensure_wrapped(
+            AsyncIORuntime(eager=True).unwrap_value(a())
+        )
+    )
+    assert started.is_set()
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_eager_execution():
+    await assert_execution(
+        schema,
+        "{ a, nested, sync_a, b(sleep: 0.001), error }",
+        expected_data={
+            "a": 42,
+            "nested": 42,
+            "sync_a": 42,
+            "b": 42,
+            "error": None,
+        },
+        expected_errors=[("FOO", (38, 43), "error")],
+        runtime=AsyncIORuntime(eager=True),
+    )
+
+
+class _CancellationCounter(Instrumentation):
+    def __init__(self):
+        self.cancelled = []  # type: List[str]
+
+    def on_field_cancelled(self, root, ctx, info):
+        self.cancelled.append(info.field_definition.name)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("eager", [False, True])
+async def test_AsyncIORuntime_fatal_error_cancels_sibling_resolvers(eager):
+    events = []  # type: List[str]
+    schema = build_schema("type Query { slow: Int, crash: Int, fast: Int }")
+
+    @schema.resolver("Query.slow")
+    async def resolve_slow(*_: Any) -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+        return 42
+
+    @schema.resolver("Query.crash")
+    async def resolve_crash(*_: Any) -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError("Crash")
+
+    schema.register_resolver("Query", "fast", lambda *_: 42)
+
+    instrumentation = _CancellationCounter()
+
+    await assert_execution(
+        schema,
+        "{ slow, crash, fast }",
+        runtime=AsyncIORuntime(eager=eager),
+        instrumentation=instrumentation,
+        expected_exc=(RuntimeError, "Crash"),
+    )
+
+    # Cancellation is delivered on the next iteration of the loop.
+    await asyncio.sleep(0)
+
+    assert events == ["cancelled"]
+    assert instrumentation.cancelled == ["slow"]
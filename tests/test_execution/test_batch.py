@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for batch resolvers and the BreadthFirstExecutor.
+"""
+
+import asyncio
+
+import pytest
+
+from py_gql import build_schema
+from py_gql.schema import Field, ListType, ObjectType, Schema, String
+from py_gql.exc import ResolverError
+from py_gql.execution import (
+    BlockingExecutor,
+    BreadthFirstExecutor,
+    Executor,
+    batch_resolver,
+)
+from py_gql.execution.runtime import AsyncIORuntime
+
+from ._test_utils import assert_execution as assert_execution_original
+
+
+CHARACTERS = {
+    1: {"id": 1, "name": "Luke", "friends": [2, 3]},
+    2: {"id": 2, "name": "Han", "friends": [1, 3]},
+    3: {"id": 3, "name": "Leia", "friends": [1, 2]},
+}
+
+QUERY = """
+{
+    heroes {
+        name
+        friends {
+            name
+            friends { name }
+        }
+    }
+}
+"""
+
+
+def _names(*names):
+    return [{"name": name} for name in names]
+
+
+EXPECTED = {
+    "heroes": [
+        {
+            "name": "Luke",
+            "friends": [
+                {"name": "Han", "friends": _names("Luke", "Leia")},
+                {"name": "Leia", "friends": _names("Luke", "Han")},
+            ],
+        },
+        {
+            "name": "Han",
+            "friends": [
+                {"name": "Luke", "friends": _names("Han", "Leia")},
+                {"name": "Leia", "friends": _names("Luke", "Han")},
+            ],
+        },
+    ]
+}
+
+
+def _schema(friends_resolver):
+    schema = build_schema(
+        """
+        type Character {
+            id: Int!
+            name: String!
+            friends: [Character!]
+        }
+
+        type Query {
+            heroes: [Character!]!
+        }
+        """
+    )
+
+    schema.register_resolver(
+        "Query", "heroes", lambda *_: [CHARACTERS[1], CHARACTERS[2]]
+    )
+    schema.register_resolver("Character", "friends", friends_resolver)
+    return schema
+
+
+class _FriendsLoader:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, roots, ctx, info):
+        self.calls.append([root["id"] for root in roots])
+        return [[CHARACTERS[i] for i in root["friends"]] for root in roots]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_is_supported_by_all_executors(assert_execution):
+    await assert_execution(
+        _schema(batch_resolver(_FriendsLoader())), QUERY, expected_data=EXPECTED
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("runtime_cls", [None, AsyncIORuntime])
+async def test_batch_resolver_is_called_once_per_list_with_executor(
+    runtime_cls,
+):
+    loader = _FriendsLoader()
+    await assert_execution_original(
+        _schema(batch_resolver(loader)),
+        QUERY,
+        expected_data=EXPECTED,
+        runtime=runtime_cls() if runtime_cls else None,
+    )
+    assert loader.calls == [[1, 2], [2, 3], [1, 3]]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_is_called_once_per_list_with_blocking_executor():
+    loader = _FriendsLoader()
+    await assert_execution_original(
+        _schema(batch_resolver(loader)),
+        QUERY,
+        expected_data=EXPECTED,
+        executor_cls=BlockingExecutor,
+    )
+    assert loader.calls == [[1, 2], [2, 3], [1, 3]]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_is_called_with_single_value_outside_lists():
+    loader = _FriendsLoader()
+    schema = _schema(batch_resolver(loader))
+    schema.register_resolver(
+        "Query", "heroes", lambda *_: [CHARACTERS[1]], allow_override=True
+    )
+    await assert_execution_original(
+        schema,
+        "{ heroes { friends { name } } }",
+        expected_data={"heroes": [{"friends": _names("Han", "Leia")}]},
+    )
+    assert loader.calls == [[1]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("runtime_cls", [None, AsyncIORuntime])
+async def test_batch_resolver_is_called_once_per_level(runtime_cls):
+    loader = _FriendsLoader()
+    await assert_execution_original(
+        _schema(batch_resolver(loader)),
+        QUERY,
+        expected_data=EXPECTED,
+        executor_cls=BreadthFirstExecutor,
+        runtime=runtime_cls() if runtime_cls else None,
+    )
+    assert loader.calls == [[1, 2], [2, 3, 1, 3]]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_resolver():
+    calls = []
+
+    @batch_resolver
+    async def resolve_friends(roots, ctx, info):
+        calls.append(len(roots))
+        await asyncio.sleep(0)
+        return [[CHARACTERS[i] for i in root["friends"]] for root in roots]
+
+    await assert_execution_original(
+        _schema(resolve_friends),
+        QUERY,
+        expected_data=EXPECTED,
+        executor_cls=BreadthFirstExecutor,
+        runtime=AsyncIORuntime(),
+    )
+    assert calls == [2, 4]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "executor_cls", [Executor, BlockingExecutor, BreadthFirstExecutor]
+)
+async def test_batch_resolver_error_fails_all_parent_values(executor_cls):
+    @batch_resolver
+    def resolve_friends(roots, ctx, info):
+        raise ResolverError("Cannot load friends")
+
+    await assert_execution_original(
+        _schema(resolve_friends),
+        "{ heroes { name friends { name } } }",
+        expected_data={
+            "heroes": [
+                {"name": "Luke", "friends": None},
+                {"name": "Han", "friends": None},
+            ]
+        },
+        expected_errors=[
+            ("Cannot load friends", (16, 32), "heroes[0].friends"),
+            ("Cannot load friends", (16, 32), "heroes[1].friends"),
+        ],
+        executor_cls=executor_cls,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "executor_cls", [Executor, BlockingExecutor, BreadthFirstExecutor]
+)
+async def test_batch_resolver_must_return_one_value_per_parent(executor_cls):
+    await assert_execution_original(
+        _schema(batch_resolver(lambda roots, *_: [])),
+        "{ heroes { friends { name } } }",
+        expected_exc=(
+            RuntimeError,
+            'Batch resolver for field "heroes[0].friends" returned 0 values '
+            "for 2 parent values",
+        ),
+        executor_cls=executor_cls,
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_must_return_a_list():
+    await assert_execution_original(
+        _schema(batch_resolver(lambda roots, *_: None)),
+        "{ heroes { friends { name } } }",
+        expected_exc=(
+            RuntimeError,
+            'Batch resolver for field "heroes[0].friends" must return a list '
+            "of values",
+        ),
+        executor_cls=BreadthFirstExecutor,
+    )
+
+
+@pytest.mark.asyncio
+async def test_middlewares_receive_all_parent_values():
+    seen = []
+
+    def middleware(next_, roots, ctx, info, **args):
+        if info.field_definition.name == "friends":
+            seen.append(len(roots))
+        return next_(roots, ctx, info, **args)
+
+    await assert_execution_original(
+        _schema(batch_resolver(_FriendsLoader())),
+        QUERY,
+        expected_data=EXPECTED,
+        executor_cls=BreadthFirstExecutor,
+        middlewares=[middleware],
+    )
+    assert seen == [2, 4]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("runtime_cls", [None, AsyncIORuntime])
+async def test_breadth_first_executor_resolves_fields_level_by_level(
+    runtime_cls,
+):
+    depths = []
+
+    def middleware(next_, root, ctx, info, **args):
+        depths.append(len([key for key in info.path if isinstance(key, str)]))
+        return next_(root, ctx, info, **args)
+
+    await assert_execution_original(
+        _schema(lambda root, *_: [CHARACTERS[i] for i in root["friends"]]),
+        QUERY,
+        expected_data=EXPECTED,
+        executor_cls=BreadthFirstExecutor,
+        runtime=runtime_cls() if runtime_cls else None,
+        middlewares=[middleware],
+    )
+
+    assert depths == [1] + [2] * 4 + [3] * 8 + [4] * 8
+
+
+@pytest.mark.asyncio
+async def test_field_batch_resolver(assert_execution):
+    loader = _FriendsLoader()
+    schema = _schema(None)
+    schema.register_resolver("Character", "friends", loader, batch=True)
+    await assert_execution(schema, QUERY, expected_data=EXPECTED)
+    assert max(len(ids) for ids in loader.calls) > 1
+
+
+@pytest.mark.asyncio
+async def test_field_batch_resolver_with_decorator():
+    schema = _schema(None)
+
+    @schema.resolver("Character.friends", batch=True)
+    def resolve_friends(roots, ctx, info):
+        return [[CHARACTERS[i] for i in root["friends"]] for root in roots]
+
+    friends = schema.get_type("Character").field_map["friends"]  # type: ignore
+    assert friends.batch_resolver is resolve_friends
+
+    await assert_execution_original(schema, QUERY, expected_data=EXPECTED)
+
+
+@pytest.mark.asyncio
+async def test_field_resolver_is_preferred_for_single_values():
+    value_type = ObjectType(
+        "Value",
+        [
+            Field(
+                "name",
+                String,
+                resolver=lambda root, *_: "single",
+                batch_resolver=lambda roots, *_: ["batch" for _ in roots],
+            )
+        ],
+    )
+
+    schema = Schema(
+        ObjectType(
+            "Query",
+            [
+                Field(
+                    "values", ListType(value_type), resolver=lambda *_: [1, 2]
+                ),
+                Field("value", value_type, resolver=lambda *_: 1),
+            ],
+        )
+    )
+
+    await assert_execution_original(
+        schema,
+        "{ values { name }, value { name } }",
+        expected_data={
+            "values": [{"name": "batch"}, {"name": "batch"}],
+            "value": {"name": "single"},
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_on_abstract_list_items():
+    schema = build_schema(
+        """
+        interface Named { name: String }
+        type Person implements Named { name: String, friends: [Person] }
+        type Pet implements Named { name: String }
+        type Query { things: [Named] }
+        """
+    )
+
+    calls = []
+
+    @schema.resolver("Person.friends", batch=True)
+    def resolve_friends(roots, *_):
+        calls.append([root["name"] for root in roots])
+        return [[] for _ in roots]
+
+    schema.register_resolver(
+        "Query",
+        "things",
+        lambda *_: [
+            {"__typename__": "Person", "name": "A"},
+            {"__typename__": "Pet", "name": "B"},
+            {"__typename__": "Person", "name": "C"},
+        ],
+    )
+
+    await assert_execution_original(
+        schema,
+        "{ things { name ... on Person { friends { name } } } }",
+        expected_data={
+            "things": [
+                {"name": "A", "friends": []},
+                {"name": "B"},
+                {"name": "C", "friends": []},
+            ]
+        },
+    )
+    assert calls == [["A", "C"]]
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+"""
+Field level caching and cache policies.
+"""
+
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from py_gql import build_schema
+from py_gql.exc import CoercionError, ResolverError, SchemaDirectiveError
+from py_gql.execution.cache import (
+    PRIVATE,
+    CacheControl,
+    CacheControlDirective,
+    CacheHint,
+    FieldCache,
+    MemoryCacheStore,
+    get_cache_hint,
+    set_cache_hint,
+)
+from py_gql.execution.runtime import AsyncIORuntime
+from py_gql.schema.transforms import CamelCaseSchemaTransform, transform_schema
+
+from ._test_utils import assert_execution as assert_execution_original
+from ._test_utils import process_request
+
+
+SDL = """
+type Country {
+    code: String!
+    name: String
+}
+
+type Viewer @cacheControl(maxAge: 30, scope: PRIVATE) {
+    name: String
+}
+
+type Query {
+    countries(prefix: String): [Country!]! @cacheControl(maxAge: 3600)
+    country(code: String!): Country @cacheControl(maxAge: 60)
+    viewer: Viewer
+    uncached: Int
+}
+"""
+
+
+def _schema(calls: List[str]) -> Any:
+    schema = build_schema(SDL, schema_directives=(CacheControlDirective,))
+
+    @schema.resolver("Query.countries")
+    def resolve_countries(*_: Any, prefix: str = "") -> List[Any]:
+        calls.append("countries")
+        return [
+            {"id": code, "code": code}
+            for code in ("FR", "GB", "FI")
+            if code.startswith(prefix)
+        ]
+
+    @schema.resolver("Query.country")
+    def resolve_country(*_: Any, code: str) -> Any:
+        calls.append("country")
+        if code == "XX":
+            raise ResolverError("Unknown country")
+        return {"id": code, "code": code}
+
+    @schema.resolver("Query.viewer")
+    def resolve_viewer(_root: Any, ctx: Any, *_: Any) -> Any:
+        calls.append("viewer")
+        return {"name": ctx["user"]}
+
+    return schema
+
+
+def test_directive_sets_cache_hints():
+    schema = _schema([])
+    query_type = schema.query_type
+
+    assert [
+        get_cache_hint(query_type, field) for field in query_type.fields
+    ] == [CacheHint(3600), CacheHint(60), CacheHint(30, PRIVATE), None]
+
+
+def test_cache_hints_are_preserved_by_schema_transforms():
+    schema = transform_schema(
+        build_schema(
+            """
+            type Viewer @cacheControl(maxAge: 30, scope: PRIVATE) {
+                name: String
+            }
+
+            type Query {
+                foo_bar: Int @cacheControl(maxAge: 10)
+                viewer: Viewer
+            }
+            """,
+            schema_directives=(CacheControlDirective,),
+        ),
+        CamelCaseSchemaTransform(),
+    )
+    query_type = schema.query_type
+
+    assert [
+        get_cache_hint(query_type, query_type.field_map[name])
+        for name in ("fooBar", "viewer")
+    ] == [CacheHint(10), CacheHint(30, PRIVATE)]
+
+
+def test_directive_definition_is_added_to_the_schema():
+    schema = _schema([])
+    assert "cacheControl" in schema.directives
+    assert schema.has_type("CacheControlScope")
+
+
+@pytest.mark.parametrize(
+    "max_age, error_cls, message",
+    [
+        (
+            "null",
+            CoercionError,
+            'Argument "maxAge" of type "Int!" was provided invalid value '
+            "null (Expected non null value.)",
+        ),
+        (
+            "-1",
+            SchemaDirectiveError,
+            'Invalid "@cacheControl" directive: maxAge must be >= 0, got -1',
+        ),
+    ],
+)
+def test_directive_rejects_invalid_max_age(max_age, error_cls, message):
+    with pytest.raises(error_cls) as exc_info:
+        build_schema(
+            "type Query { a: Int @cacheControl(maxAge: %s) }" % max_age,
+            schema_directives=[CacheControlDirective],
+        )
+    assert str(exc_info.value) == message
+
+
+def test_set_cache_hint_validates_arguments():
+    schema = _schema([])
+    with pytest.raises(ValueError):
+        set_cache_hint(schema.query_type, -1)
+    with pytest.raises(ValueError):
+        set_cache_hint(schema.query_type, 10, "SHARED")
+
+
+@pytest.mark.asyncio
+async def test_cached_fields_are_resolved_once(assert_execution):
+    calls = []  # type: List[str]
+    schema = _schema(calls)
+    field_cache = FieldCache()
+
+    for _ in range(2):
+        await assert_execution(
+            schema,
+            '{ countries(prefix: "F") { code } country(code: "GB") { code } }',
+            field_cache=field_cache,
+            expected_data={
+                "countries": [{"code": "FR"}, {"code": "FI"}],
+                "country": {"code": "GB"},
+            },
+        )
+
+    assert calls == ["countries", "country"]
+
+
+@pytest.mark.asyncio
+async def test_cache_is_keyed_on_arguments():
+    calls = []  # type: List[str]
+    schema = _schema(calls)
+    field_cache = FieldCache()
+
+    for code in ("GB", "FR", "GB"):
+        await assert_execution_original(
+            schema,
+            '{ country(code: "%s") { code } }' % code,
+            field_cache=field_cache,
+            expected_data={"country": {"code": code}},
+        )
+
+    assert calls == ["country", "country"]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    calls = []  # type: List[str]
+    schema = _schema(calls)
+    field_cache = FieldCache()
+
+    for _ in range(2):
+        await assert_execution_original(
+            schema,
+            '{ country(code: "XX") { code } }',
+            field_cache=field_cache,
+            expected_data={"country": None},
+            expected_errors=[("Unknown country", (2, 30), "country")],
+        )
+
+    assert calls == ["country", "country"]
+
+
+@pytest.mark.asyncio
+async def test_private_fields_require_a_session_key():
+    calls = []  # type: List[str]
+    schema = _schema(calls)
+
+    for user in ("alice", "alice"):
+        await assert_execution_original(
+            schema,
+            "{ viewer { name } }",
+            field_cache=FieldCache(),
+            context_value={"user": user},
+            expected_data={"viewer": {"name": user}},
+        )
+
+    assert calls == ["viewer", "viewer"]
+
+
+@pytest.mark.asyncio
+async def test_private_fields_are_cached_per_session():
+    calls = []  # type: List[str]
+    schema = _schema(calls)
+    field_cache = FieldCache(session_key=lambda ctx: ctx["user"])
+
+    for user in ("alice", "bob", "alice"):
+        await assert_execution_original(
+            schema,
+            "{ viewer { name } }",
+            field_cache=field_cache,
+            context_value={"user": user},
+            expected_data={"viewer": {"name": user}},
+        )
+
+    assert calls == ["viewer", "viewer"]
+
+
+@pytest.mark.asyncio
+async def test_nested_fields_are_keyed_on_parent_identity():
+    calls = []  # type: List[str]
+    schema = _schema(calls)
+    country_type = schema.get_type("Country")
+    name_field = country_type.field_map["name"]  # type: ignore
+    set_cache_hint(name_field, 60)
+
+    @schema.resolver("Country.name")
+    async def resolve_name(root: Any, *_: Any) -> str:
+        calls.append(root["code"])
+        await asyncio.sleep(0)
+        return root["code"].lower()
+
+    field_cache = FieldCache()
+
+    for prefix in ("F", ""):
+        await process_request(
+            schema,
+            '{ countries(prefix: "%s") { name } }' % prefix,
+            field_cache=field_cache,
+            runtime=AsyncIORuntime(),
+        )
+
+    assert calls == ["countries", "FR", "FI", "countries", "GB"]
+
+
+def test_memory_store_expires_entries():
+    now = [0.0]
+    store = MemoryCacheStore(clock=lambda: now[0])
+    store.set("key", 42, 10)
+    assert store.get("key") == 42
+
+    now[0] = 10
+    with pytest.raises(KeyError):
+        store.get("key")
+    assert len(store) == 0
+
+
+def test_memory_store_evicts_least_recently_used_entries():
+    store = MemoryCacheStore(max_size=2)
+    store.set("a", 1, 10)
+    store.set("b", 2, 10)
+    store.get("a")
+    store.set("c", 3, 10)
+
+    assert store.get("a") == 1
+    assert store.get("c") == 3
+    with pytest.raises(KeyError):
+        store.get("b")
+
+
+@pytest.mark.asyncio
+async def test_cache_control_extension():
+    cache_control = CacheControl()
+    result = await process_request(
+        _schema([]),
+        '{ countries { code } country(code: "FR") { code } }',
+        instrumentation=cache_control,
+    )
+    result.add_extension(cache_control)
+
+    assert result.response()["extensions"] == {
+        "cacheControl": {
+            "version": 1,
+            "policy": {"maxAge": 60, "scope": "PUBLIC"},
+        }
+    }
+    assert cache_control.http_header() == "max-age=60, public"
+
+
+@pytest.mark.asyncio
+async def test_cache_control_private_policy():
+    cache_control = CacheControl()
+    await process_request(
+        _schema([]),
+        "{ countries { code } viewer { name } }",
+        instrumentation=cache_control,
+        context={"user": "alice"},
+    )
+
+    assert cache_control.policy == CacheHint(30, PRIVATE)
+    assert cache_control.http_header() == "max-age=30, private"
+
+
+@pytest.mark.asyncio
+async def test_cache_control_fields_without_hint_are_not_cacheable():
+    cache_control = CacheControl()
+    await process_request(
+        _schema([]),
+        "{ countries { code } uncached }",
+        instrumentation=cache_control,
+    )
+
+    assert cache_control.policy == CacheHint(0)
+    assert cache_control.http_header() is None
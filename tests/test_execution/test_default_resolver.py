@@ -1,7 +1,18 @@
 # -*- coding: utf-8 -*-
 
+import collections
+
 from py_gql import build_schema
-from py_gql.schema import Argument, Field, Int, Schema, String
+from py_gql.execution.default_resolver import specialized_default_resolver
+from py_gql.schema import (
+    Argument,
+    Field,
+    Int,
+    ListType,
+    ObjectType,
+    Schema,
+    String,
+)
 
 from ._test_utils import assert_sync_execution, create_test_schema
 
@@ -68,6 +79,106 @@ class TestDefaultResolver:
             expected_data={"test": 789},
         )
 
+    def test_handles_mixed_root_types_in_lists(self):
+        Point = collections.namedtuple("Point", ["x"])
+
+        class Obj:
+            def __init__(self, value):
+                self.x = value
+
+        class Method:
+            def x(self, ctx, info):
+                return 42
+
+        schema = create_test_schema(
+            ListType(ObjectType("Object", [Field("x", Int)]))
+        )
+
+        assert_sync_execution(
+            schema,
+            "{ test { x } }",
+            initial_value={
+                "test": [
+                    Point(1),
+                    {"x": 2},
+                    Obj(3),
+                    Point(4),
+                    {},
+                    Method(),
+                    collections.OrderedDict(x=5),
+                    None,
+                ]
+            },
+            expected_data={
+                "test": [
+                    {"x": 1},
+                    {"x": 2},
+                    {"x": 3},
+                    {"x": 4},
+                    {"x": None},
+                    {"x": 42},
+                    {"x": 5},
+                    None,
+                ]
+            },
+        )
+
+
+class TestSpecializedDefaultResolver:
+    def test_looks_up_key(self):
+        resolver = specialized_default_resolver("foo")
+        assert resolver({"foo": 42}, None, None) == 42
+        assert resolver({}, None, None) is None
+
+    def test_looks_up_attribute(self):
+        Foo = collections.namedtuple("Foo", ["foo"])
+        resolver = specialized_default_resolver("foo")
+        assert resolver(Foo(42), None, None) == 42
+        assert resolver(object(), None, None) is None
+
+    def test_evaluates_methods(self):
+        class Foo:
+            def foo(self, ctx, info, *, value):
+                return ctx + value
+
+        resolver = specialized_default_resolver("foo")
+        assert resolver(Foo(), 40, None, value=2) == 42
+
+    def test_falls_back_when_root_type_changes(self):
+        Foo = collections.namedtuple("Foo", ["foo"])
+        resolver = specialized_default_resolver("foo")
+        assert resolver({"foo": 1}, None, None) == 1
+        assert resolver(Foo(2), None, None) == 2
+        assert resolver({"foo": 3}, None, None) == 3
+
+    def test_evaluates_callable_namedtuple_fields(self):
+        Foo = collections.namedtuple("Foo", ["foo"])
+        resolver = specialized_default_resolver("foo")
+        assert resolver(Foo(lambda ctx, info: ctx), 42, None) == 42
+
+    def test_respects_overridden_namedtuple_fields(self):
+        class Foo(collections.namedtuple("Foo", ["foo"])):
+            @property
+            def foo(self):
+                return self[0] * 2
+
+        resolver = specialized_default_resolver("foo")
+        assert resolver(Foo(21), None, None) == 42
+
+    def test_missing_attributes_resolve_to_none(self):
+        class Foo:
+            __slots__ = ("foo",)
+
+            @property
+            def bar(self):
+                raise AttributeError("bar")
+
+        foo = Foo()
+        assert specialized_default_resolver("foo")(foo, None, None) is None
+        assert specialized_default_resolver("bar")(foo, None, None) is None
+        foo.foo = 42
+        assert specialized_default_resolver("foo")(foo, None, None) == 42
+
 
 class TestOverrides:
     def _override_test_schema(self) -> Schema:
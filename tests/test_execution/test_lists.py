@@ -7,11 +7,13 @@ import pytest
 
 from py_gql._utils import deduplicate, lazy
 from py_gql.schema import (
+    EnumType,
     Field,
     Int,
     ListType,
     NonNullType,
     ObjectType,
+    ScalarType,
     Schema,
     String,
 )
@@ -225,3 +227,96 @@ async def test_nullable_list_of_non_nullable_items_fail(
         expected_errors=[expected_err],
         assert_execution=assert_execution,
     )
+
+
+@pytest.mark.parametrize(
+    "test_type",
+    [ListType(Int), ListType(NonNullType(Int))],
+    ids=["[T]", "[T!]"],
+)
+async def test_list_of_invalid_scalars_fail(assert_execution, test_type):
+    await run_test(
+        test_type,
+        [1, "foo", 2],
+        expected_exc=RuntimeError,
+        expected_msg=(
+            'Field "nest.test[1]" cannot be serialized as "Int": '
+            "Int cannot represent non integer value: foo"
+        ),
+        assert_execution=assert_execution,
+    )
+
+
+async def test_list_of_enums_ok(assert_execution):
+    await run_test(
+        ListType(EnumType("Color", [("RED", 1), ("BLUE", 2)])),
+        [1, None, 2, 1],
+        expected_data=["RED", None, "BLUE", "RED"],
+        assert_execution=assert_execution,
+    )
+
+
+async def test_list_of_invalid_enums_fail(assert_execution):
+    await run_test(
+        ListType(NonNullType(EnumType("Color", [("RED", 1), ("BLUE", 2)]))),
+        [1, 2, 3],
+        expected_exc=RuntimeError,
+        expected_msg=(
+            'Field "nest.test[2]" cannot be serialized as "Color": '
+            "Invalid value 3 for enum Color"
+        ),
+        assert_execution=assert_execution,
+    )
+
+
+async def test_list_of_scalars_uses_serialize_many(assert_execution):
+    calls = []
+
+    def serialize_many(values):
+        calls.append(list(values))
+        return [v * 2 for v in values]
+
+    await run_test(
+        ListType(ScalarType("Double", int, int, serialize_many=serialize_many)),
+        [1, None, 2],
+        expected_data=[2, None, 4],
+        assert_execution=assert_execution,
+    )
+    assert calls == [[1, 2]]
+
+
+async def test_list_of_scalars_serialize_many_errors_report_entry_path(
+    assert_execution,
+):
+    def serialize_many(values):
+        return [int(v) for v in values]
+
+    await run_test(
+        ListType(ScalarType("Custom", int, int, serialize_many=serialize_many)),
+        [1, "foo", 2],
+        expected_exc=RuntimeError,
+        expected_msg=(
+            'Field "nest.test[1]" cannot be serialized as "Custom": '
+            "invalid literal for int() with base 10: 'foo'"
+        ),
+        assert_execution=assert_execution,
+    )
+
+
+async def test_list_of_non_nullable_scalars_serialized_to_null_fail(
+    assert_execution,
+):
+    await run_test(
+        ListType(
+            NonNullType(
+                ScalarType("Even", lambda v: v if v % 2 == 0 else None, int)
+            )
+        ),
+        [1, 2, None],
+        expected_data=[None, 2, None],
+        expected_errors=[
+            ('Field "nest.test[0]" is not nullable', (9, 13), "nest.test[0]"),
+            ('Field "nest.test[2]" is not nullable', (9, 13), "nest.test[2]"),
+        ],
+        assert_execution=assert_execution,
+    )
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Per execution resolver memoization.
+"""
+
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from py_gql import build_schema
+from py_gql.exc import ResolverError
+from py_gql.execution import memoize, memoize_by
+from py_gql.execution.runtime import AsyncIORuntime
+
+from ._test_utils import assert_execution as assert_execution_original
+
+
+SDL = """
+type User {
+    id: ID!
+    name: String
+    friend: User
+}
+
+type Query {
+    viewer: User
+    user(id: ID!): User
+    users: [User!]!
+}
+"""
+
+USERS = {
+    "1": {"id": "1", "name": "alice", "friend_id": "2"},
+    "2": {"id": "2", "name": "bob", "friend_id": "1"},
+}
+
+
+def _schema(calls: List[Any]) -> Any:
+    schema = build_schema(SDL)
+
+    @schema.resolver("Query.viewer")
+    @memoize
+    def resolve_viewer(*_: Any) -> Any:
+        calls.append("viewer")
+        return USERS["1"]
+
+    @schema.resolver("Query.user")
+    @memoize
+    def resolve_user(*_: Any, id: str) -> Any:
+        calls.append(("user", id))
+        return USERS[id]
+
+    @schema.resolver("Query.users")
+    def resolve_users(*_: Any) -> Any:
+        return [USERS["1"], USERS["2"], USERS["1"]]
+
+    @schema.resolver("User.friend")
+    @memoize
+    def resolve_friend(root: Any, *_: Any) -> Any:
+        calls.append(("friend", root["id"]))
+        return USERS[root["friend_id"]]
+
+    return schema
+
+
+@pytest.mark.asyncio
+async def test_duplicate_fields_are_resolved_once(assert_execution):
+    calls = []  # type: List[Any]
+    await assert_execution(
+        _schema(calls),
+        """
+        {
+            viewer { name }
+            me: viewer { id }
+            ...F
+        }
+        fragment F on Query { viewer { name } }
+        """,
+        expected_data={"viewer": {"name": "alice"}, "me": {"id": "1"}},
+    )
+    assert calls == ["viewer"]
+
+
+@pytest.mark.asyncio
+async def test_calls_are_keyed_on_arguments(assert_execution):
+    calls = []  # type: List[Any]
+    await assert_execution(
+        _schema(calls),
+        """
+        {
+            a: user(id: "1") { name }
+            b: user(id: "2") { name }
+            c: user(id: "1") { id }
+        }
+        """,
+        expected_data={
+            "a": {"name": "alice"},
+            "b": {"name": "bob"},
+            "c": {"id": "1"},
+        },
+    )
+    assert calls == [("user", "1"), ("user", "2")]
+
+
+@pytest.mark.asyncio
+async def test_calls_are_keyed_on_parent_identity(assert_execution):
+    calls = []  # type: List[Any]
+    await assert_execution(
+        _schema(calls),
+        "{ users { friend { name } } }",
+        expected_data={
+            "users": [
+                {"friend": {"name": "bob"}},
+                {"friend": {"name": "alice"}},
+                {"friend": {"name": "bob"}},
+            ]
+        },
+    )
+    assert calls == [("friend", "1"), ("friend", "2")]
+
+
+@pytest.mark.asyncio
+async def test_memoize_by_custom_key():
+    calls = []  # type: List[Any]
+    schema = _schema(calls)
+
+    @schema.resolver("User.friend", allow_override=True)
+    @memoize_by(lambda root, args: root["friend_id"])
+    def resolve_friend(root: Any, *_: Any) -> Any:
+        calls.append(("friend", root["id"]))
+        return USERS[root["friend_id"]]
+
+    await assert_execution_original(
+        schema,
+        "{ viewer { friend { name } } users { friend { id } } }",
+        expected_data={
+            "viewer": {"friend": {"name": "bob"}},
+            "users": [
+                {"friend": {"id": "2"}},
+                {"friend": {"id": "1"}},
+                {"friend": {"id": "2"}},
+            ],
+        },
+    )
+    assert [c for c in calls if c[0] == "friend"] == [
+        ("friend", "1"),
+        ("friend", "2"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_values_are_not_shared_across_executions():
+    calls = []  # type: List[Any]
+    schema = _schema(calls)
+
+    for _ in range(2):
+        await assert_execution_original(
+            schema, "{ viewer { id } }", expected_data={"viewer": {"id": "1"}}
+        )
+
+    assert calls == ["viewer", "viewer"]
+
+
+@pytest.mark.asyncio
+async def test_unhashable_keys_are_not_memoized():
+    calls = []  # type: List[Any]
+    schema = _schema(calls)
+
+    @schema.resolver("Query.viewer", allow_override=True)
+    @memoize_by(lambda root, args: [])
+    def resolve_viewer(*_: Any) -> Any:
+        calls.append("viewer")
+        return USERS["1"]
+
+    await assert_execution_original(
+        schema,
+        "{ viewer { id } me: viewer { id } }",
+        expected_data={"viewer": {"id": "1"}, "me": {"id": "1"}},
+    )
+    assert calls == ["viewer", "viewer"]
+
+
+@pytest.mark.asyncio
+async def test_middlewares_are_called_for_every_field(assert_execution):
+    calls = []  # type: List[Any]
+    seen = []  # type: List[Any]
+
+    def middleware(next_, root, ctx, info, **args):
+        seen.append(info.path)
+        return next_(root, ctx, info, **args)
+
+    await assert_execution(
+        _schema(calls),
+        "{ viewer { id } me: viewer { id } }",
+        middlewares=[middleware],
+        expected_data={"viewer": {"id": "1"}, "me": {"id": "1"}},
+    )
+    assert calls == ["viewer"]
+    assert ["viewer"] in seen and ["me"] in seen
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("eager", [False, True])
+async def test_concurrent_duplicates_share_the_same_call(eager):
+    calls = []  # type: List[Any]
+    schema = _schema(calls)
+
+    @schema.resolver("Query.viewer", allow_override=True)
+    @memoize
+    async def resolve_viewer(*_: Any) -> Any:
+        calls.append("viewer")
+        await asyncio.sleep(0.01)
+        return USERS["1"]
+
+    await assert_execution_original(
+        schema,
+        "{ viewer { id } me: viewer { name } }",
+        runtime=AsyncIORuntime(eager=eager),
+        expected_data={"viewer": {"id": "1"}, "me": {"name": "alice"}},
+    )
+    assert calls == ["viewer"]
+
+
+@pytest.mark.asyncio
+async def test_shared_errors_are_reported_for_every_field():
+    calls = []  # type: List[Any]
+    schema = _schema(calls)
+
+    @schema.resolver("Query.viewer", allow_override=True)
+    @memoize
+    async def resolve_viewer(*_: Any) -> Any:
+        calls.append("viewer")
+        await asyncio.sleep(0)
+        raise ResolverError("Not logged in")
+
+    await assert_execution_original(
+        schema,
+        "{ viewer { id } me: viewer { name } }",
+        runtime=AsyncIORuntime(),
+        expected_data={"viewer": None, "me": None},
+        expected_errors=[
+            ("Not logged in", (2, 15), "viewer"),
+            ("Not logged in", (16, 35), "me"),
+        ],
+    )
+    assert calls == ["viewer"]
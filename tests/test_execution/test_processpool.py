@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Execution tests specific to ProcessPoolRuntime().
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from py_gql import build_schema
+from py_gql.exc import ResolverError
+from py_gql.execution.runtime import ProcessPoolRuntime
+from py_gql.execution.runtime.hints import cpu_bound, is_cpu_bound
+
+from ._test_utils import assert_execution, process_request
+
+
+schema = build_schema(
+    """
+    type Query {
+        pid: Int!
+        local_pid: Int!
+        factorial(n: Int!): String!
+        context: Boolean!
+        error: Int
+    }
+    """
+)
+
+
+# Resolvers sent to worker processes must be picklable, i.e. defined at the
+# module level.
+
+
+@schema.resolver("Query.pid")
+@cpu_bound
+def resolve_pid(*_: Any) -> int:
+    return os.getpid()
+
+
+@schema.resolver("Query.local_pid")
+def resolve_local_pid(*_: Any) -> int:
+    return os.getpid()
+
+
+@schema.resolver("Query.factorial")
+@cpu_bound
+def resolve_factorial(_root: Any, _ctx: Any, _info: Any, *, n: int) -> str:
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return str(result)
+
+
+@schema.resolver("Query.context")
+@cpu_bound
+def resolve_context(_root: Any, ctx: Any, info: Any) -> bool:
+    return ctx is None and info is None
+
+
+@schema.resolver("Query.error")
+@cpu_bound
+def resolve_error(*_: Any) -> None:
+    raise ResolverError("FOO")
+
+
+@pytest.fixture(scope="module")
+def runtime():
+    runtime = ProcessPoolRuntime(max_workers=2, thread_max_workers=2)
+    yield runtime
+    runtime.shutdown()
+
+
+def test_cpu_bound_hint():
+    assert is_cpu_bound(resolve_pid)
+    assert not is_cpu_bound(resolve_local_pid)
+
+
+@pytest.mark.asyncio
+async def test_cpu_bound_resolvers_run_in_other_process(runtime):
+    data, errors = await process_request(
+        schema, "{ pid, local_pid }", runtime=runtime
+    )
+    assert not errors
+    assert data["pid"] != os.getpid()
+    assert data["local_pid"] == os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_cpu_bound_resolvers_receive_arguments(runtime):
+    await assert_execution(
+        schema,
+        "{ factorial(n: 5), context }",
+        runtime=runtime,
+        expected_data={"factorial": "120", "context": True},
+    )
+
+
+@pytest.mark.asyncio
+async def test_cpu_bound_resolver_errors_are_handled(runtime):
+    await assert_execution(
+        schema,
+        "{ error }",
+        runtime=runtime,
+        expected_data={"error": None},
+        expected_errors=[("FOO", (2, 7), "error")],
+    )
+
+
+@pytest.mark.asyncio
+async def test_custom_executor():
+    with ThreadPoolExecutor(1) as executor:
+        runtime = ProcessPoolRuntime(executor=executor)
+        await assert_execution(
+            schema,
+            "{ factorial(n: 3) }",
+            runtime=runtime,
+            expected_data={"factorial": "6"},
+        )
+        runtime.shutdown()
+        # Executor is not owned by the runtime.
+        assert executor.submit(lambda: 1).result() == 1
+
+
+def test_cannot_set_both_executor_and_max_workers():
+    with ProcessPoolExecutor(1) as executor:
+        with pytest.raises(ValueError):
+            ProcessPoolRuntime(executor=executor, max_workers=1)
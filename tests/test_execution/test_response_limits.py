@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Response size tracking and limits.
+"""
+
+import json
+from typing import Any, List, Tuple
+
+import pytest
+
+from py_gql import build_schema
+from py_gql.exc import ResponseTooLarge
+from py_gql.execution import Instrumentation, MultiInstrumentation
+from py_gql.execution.runtime import AsyncIORuntime
+
+from ._test_utils import assert_execution as assert_execution_original
+from ._test_utils import process_request
+
+
+schema = build_schema(
+    """
+    enum Color { RED, GREEN }
+
+    type Item {
+        id: Int!
+        name: String
+        tags: [String]
+        color: Color
+    }
+
+    type Query {
+        items(count: Int!): [Item!]!
+    }
+    """
+)
+
+
+@schema.resolver("Query.items")
+def resolve_items(*_: Any, count: int) -> List[Any]:
+    return [
+        {
+            "id": i,
+            "name": "item-%d" % i if i % 2 else None,
+            "tags": ["a", None, "bc"],
+            "color": "RED",
+        }
+        for i in range(count)
+    ]
+
+
+QUERY = "{ items(count: %d) { id name tags color } }"
+
+
+class SizeRecorder(Instrumentation):
+    def __init__(self):
+        self.sizes = []  # type: List[Tuple[int, int]]
+
+    def on_response_size(self, nodes, size):
+        self.sizes.append((nodes, size))
+
+
+@pytest.mark.asyncio
+async def test_response_size_is_reported(assert_execution):
+    recorder = SizeRecorder()
+
+    await assert_execution(
+        schema, QUERY % 2, instrumentation=recorder,
+    )
+
+    assert len(recorder.sizes) == 1
+    nodes, size = recorder.sizes[0]
+    # items + 2 * (item, id, name, tags, 3 tags, color)
+    assert nodes == 17
+
+    result = await process_request(schema, QUERY % 2)
+    encoded = json.dumps(result.data, separators=(",", ":"))
+    assert abs(size - len(encoded)) <= 5
+
+
+@pytest.mark.asyncio
+async def test_response_size_is_reported_through_multi_instrumentation(
+    assert_execution,
+):
+    recorder = SizeRecorder()
+
+    await assert_execution(
+        schema,
+        QUERY % 2,
+        instrumentation=MultiInstrumentation(Instrumentation(), recorder),
+    )
+
+    assert [nodes for nodes, _ in recorder.sizes] == [17]
+
+
+@pytest.mark.asyncio
+async def test_execution_within_limits(assert_execution):
+    await assert_execution(
+        schema,
+        QUERY % 1,
+        max_response_nodes=9,
+        max_response_size=100,
+        expected_data={
+            "items": [
+                {
+                    "id": 0,
+                    "name": None,
+                    "tags": ["a", None, "bc"],
+                    "color": "RED",
+                }
+            ]
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_max_response_nodes(assert_execution):
+    await assert_execution(
+        schema,
+        QUERY % 1000,
+        max_response_nodes=100,
+        expected_exc=(
+            ResponseTooLarge,
+            "Response exceeded the limit of 100 values",
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_max_response_size(assert_execution):
+    await assert_execution(
+        schema,
+        QUERY % 1000,
+        max_response_size=1000,
+        expected_exc=(
+            ResponseTooLarge,
+            "Response exceeded the limit of 1000 bytes",
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_size_is_reported_when_aborting():
+    recorder = SizeRecorder()
+
+    await assert_execution_original(
+        schema,
+        QUERY % 1000,
+        max_response_nodes=100,
+        instrumentation=recorder,
+        expected_exc=ResponseTooLarge,
+    )
+
+    assert len(recorder.sizes) == 1
+    assert 100 < recorder.sizes[0][0] < 110
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("runtime_cls", [None, AsyncIORuntime])
+async def test_process_graphql_query_reports_response_too_large(runtime_cls):
+    result = await process_request(
+        schema,
+        QUERY % 1000,
+        runtime=runtime_cls() if runtime_cls else None,
+        max_response_nodes=100,
+    )
+
+    assert result.response() == {
+        "data": None,
+        "errors": [{"message": "Response exceeded the limit of 100 values"}],
+    }
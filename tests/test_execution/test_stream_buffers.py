@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Buffered subscription streams.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, List
+
+import pytest
+
+from py_gql import build_schema
+from py_gql.execution import subscribe
+from py_gql.execution.runtime import AsyncIORuntime, StreamBuffer
+from py_gql.execution.runtime.streams import (
+    BLOCK,
+    COALESCE,
+    DROP_NEWEST,
+    DROP_OLDEST,
+)
+from py_gql.lang import parse
+
+
+async def _source(pulled: List[int], count: int = 10) -> AsyncIterator[int]:
+    for i in range(1, count + 1):
+        pulled.append(i)
+        yield i
+
+
+async def _identity(value: Any) -> Any:
+    return value
+
+
+async def _collect(stream: Any) -> List[Any]:
+    return [value async for value in stream]
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"policy": "foo"}, {"max_size": 0}, {"concurrency": 0}]
+)
+def test_stream_buffer_validates_arguments(kwargs):
+    with pytest.raises(ValueError):
+        StreamBuffer(**kwargs)
+
+
+def test_coalesce_keeps_a_single_value():
+    assert StreamBuffer(max_size=10, policy=COALESCE).max_size == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy, expected, dropped",
+    [
+        (BLOCK, list(range(1, 11)), 0),
+        (DROP_OLDEST, [1, 9, 10], 7),
+        (DROP_NEWEST, [1, 2, 3], 7),
+        (COALESCE, [1, 10], 8),
+    ],
+)
+async def test_buffer_policies(policy, expected, dropped):
+    stream = AsyncIORuntime().map_stream(
+        _source([]), _identity, buffer=StreamBuffer(2, policy)
+    )
+    assert await _collect(stream) == expected
+    assert stream.dropped == dropped
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure():
+    pulled = []  # type: List[int]
+    stream = AsyncIORuntime().map_stream(
+        _source(pulled), _identity, buffer=StreamBuffer(3, concurrency=2)
+    )
+
+    assert await stream.__anext__() == 1
+    await asyncio.sleep(0.01)
+    # 2 mapped values waiting to be consumed, 3 queued values and 1 value
+    # waiting for space in the queue.
+    assert pulled == [1, 2, 3, 4, 5, 6, 7]
+
+    assert await stream.__anext__() == 2
+    await asyncio.sleep(0.01)
+    assert pulled == [1, 2, 3, 4, 5, 6, 7, 8]
+
+
+@pytest.mark.asyncio
+async def test_values_are_mapped_concurrently_and_delivered_in_order():
+    running = 0
+    max_running = 0
+
+    async def map_value(value: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001 * (10 - value))
+        running -= 1
+        return value
+
+    stream = AsyncIORuntime().map_stream(
+        _source([]), map_value, buffer=StreamBuffer(10, concurrency=3)
+    )
+
+    assert await _collect(stream) == list(range(1, 11))
+    assert max_running == 3
+
+
+@pytest.mark.asyncio
+async def test_source_errors_are_raised_after_buffered_values():
+    async def source() -> AsyncIterator[int]:
+        yield 1
+        yield 2
+        raise ValueError("foo")
+
+    stream = AsyncIORuntime().map_stream(
+        source(), _identity, buffer=StreamBuffer(10)
+    )
+
+    assert await stream.__anext__() == 1
+    assert await stream.__anext__() == 2
+    with pytest.raises(ValueError):
+        await stream.__anext__()
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_aclose_stops_the_source_stream():
+    closed = []  # type: List[bool]
+
+    async def source() -> AsyncIterator[int]:
+        try:
+            i = 0
+            while True:
+                i += 1
+                yield i
+                await asyncio.sleep(0)
+        finally:
+            closed.append(True)
+
+    stream = AsyncIORuntime().map_stream(
+        source(), _identity, buffer=StreamBuffer(2)
+    )
+
+    assert await stream.__anext__() == 1
+    await stream.aclose()
+    await asyncio.sleep(0)
+
+    assert closed == [True]
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_with_buffer():
+    schema = build_schema(
+        """
+        type Query { a: Int }
+        type Subscription { counter: Int! }
+        """
+    )
+    pulled = []  # type: List[int]
+
+    @schema.subscription("Subscription.counter")
+    def counter(*_: Any) -> AsyncIterator[int]:
+        return _source(pulled)
+
+    schema.register_resolver("Subscription", "counter", lambda e, *_: e)
+
+    stream = await subscribe(
+        schema,
+        parse("subscription { counter }"),
+        runtime=AsyncIORuntime(),
+        buffer=StreamBuffer(1, DROP_NEWEST),
+    )
+
+    assert [r.response() for r in await _collect(stream)] == [
+        {"data": {"counter": 1}},
+        {"data": {"counter": 2}},
+    ]
+    assert pulled == list(range(1, 11))
@@ -5,8 +5,12 @@ import asyncio
 import pytest
 
 from py_gql.exc import ExecutionError, ResolverError
-from py_gql.execution import subscribe
-from py_gql.execution.runtime import AsyncIORuntime, BlockingRuntime
+from py_gql.execution import Executor, subscribe
+from py_gql.execution.runtime import (
+    AsyncIORuntime,
+    BlockingRuntime,
+    StreamBuffer,
+)
 from py_gql.lang import parse
 from py_gql.schema import (
     Argument,
@@ -238,3 +242,56 @@ async def test_simple_counter_subscription_with_error():
         )
         for x in range(1, 11)
     ] == [r.response() for r in await collect_async_iterator(response_stream)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_events_do_not_share_errors():
+    async def resolver(event, *_, **__):
+        # Later events complete first.
+        await asyncio.sleep(0.001 * (10 - event))
+        if event % 2:
+            raise ResolverError("I don't like odd numbers.")
+        return event
+
+    schema = subscription_schema(
+        Field(
+            "counter",
+            Int,
+            args=[Argument("delay", NonNullType(Float))],
+            subscription_resolver=lambda *_, delay: AsyncCounter(delay, 10),
+            resolver=resolver,
+        )
+    )
+
+    response_stream = await subscribe(
+        schema,
+        parse("subscription { counter(delay: 0) }"),
+        runtime=AsyncIORuntime(),
+        buffer=StreamBuffer(10, concurrency=5),
+    )
+
+    assert [
+        (r.data, [str(e) for e in r.errors])
+        for r in await collect_async_iterator(response_stream)
+    ] == [
+        (
+            {"counter": None if x % 2 else x},
+            ["I don't like odd numbers."] if x % 2 else [],
+        )
+        for x in range(1, 11)
+    ]
+
+
+def test_fork_shares_caches_but_not_execution_state():
+    schema = subscription_schema(Field("counter", Int))
+    executor = Executor(schema, parse("subscription { counter }"), {}, None)
+    executor.add_error(ResolverError("foo"))
+    executor.response_nodes = 10
+
+    forked = executor.fork()
+
+    assert type(forked) is Executor
+    assert forked.errors == [] and forked.response_nodes == 0
+    assert len(executor.errors) == 1 and executor.response_nodes == 10
+    assert forked._resolver_cache is executor._resolver_cache
+    assert forked._grouped_fields is executor._grouped_fields
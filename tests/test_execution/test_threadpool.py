@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Execution tests specific to ThreadPoolRuntime().
+"""
+
+import threading
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, List
+
+import pytest
+
+from py_gql import build_schema
+from py_gql.execution import Instrumentation, execute
+from py_gql.execution.runtime import ThreadPoolRuntime
+from py_gql.execution.runtime.hints import non_blocking
+from py_gql.execution.runtime.threadpool import (
+    Deferred,
+    chain,
+    gather_futures,
+    unwrap_future,
+)
+from py_gql.lang import parse
+
+from ._test_utils import process_request
+
+
+def _done(value: Any) -> "Future[Any]":
+    f = Future()  # type: Future[Any]
+    f.set_result(value)
+    return f
+
+
+def test_deferred_runs_callbacks_once_done():
+    d = Deferred()  # type: Deferred[int]
+    seen = []
+    d.add_done_callback(lambda f: seen.append(f.result()))
+    assert not seen and not d.done()
+
+    d.set_result(42)
+    d.add_done_callback(lambda f: seen.append(f.result()))
+
+    assert seen == [42, 42]
+
+
+def test_deferred_ignores_result_once_done():
+    d = Deferred()  # type: Deferred[int]
+    d.set_exception(ValueError("foo"))
+    d.set_result(42)
+    assert not d.cancel()
+
+    with pytest.raises(ValueError):
+        d.result()
+
+
+def test_deferred_result_blocks_until_done():
+    d = Deferred()  # type: Deferred[int]
+    with pytest.raises(FutureTimeoutError):
+        d.result(timeout=0)
+
+    threading.Timer(0.01, d.set_result, [42]).start()
+    assert d.result(timeout=2) == 42
+
+
+def test_deferred_as_future():
+    d = Deferred()  # type: Deferred[int]
+    f = d.as_future()
+    assert isinstance(f, Future)
+    d.set_result(42)
+    assert f.result() == 42
+
+
+def test_deferred_as_future_propagates_cancellation():
+    d = Deferred()  # type: Deferred[int]
+    d.as_future().cancel()
+    assert d.cancelled()
+    with pytest.raises(CancelledError):
+        d.result()
+
+
+def test_chain_processes_completed_futures_synchronously():
+    assert chain(_done(21), lambda x: x * 2) == 42
+
+
+def test_unwrap_future_processes_completed_futures_synchronously():
+    assert unwrap_future(_done(_done(42))) == 42
+
+
+def test_share_value_does_not_propagate_cancellation():
+    runtime = ThreadPoolRuntime(1)
+    source = Future()  # type: Future[int]
+    shared = runtime.share_value(source)
+
+    first = runtime.map_value(shared, lambda x: x + 1)
+    second = runtime.map_value(shared, lambda x: x * 2)
+    first.cancel()
+    source.set_result(2)
+
+    assert first.cancelled()
+    assert not source.cancelled()
+    assert runtime.ensure_wrapped(second).result(timeout=1) == 4
+    assert runtime.map_value(shared, lambda x: x - 1) == 1
+
+
+def test_gather_futures_returns_list_if_all_completed():
+    assert gather_futures([1, _done(2), _done(3)]) == [1, 2, 3]
+
+
+def test_gather_futures_from_multiple_threads():
+    futures = [Future() for _ in range(100)]  # type: ignore
+    gathered = gather_futures(futures)
+
+    threads = [
+        threading.Thread(target=f.set_result, args=(i,))
+        for i, f in enumerate(futures)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert gathered.result(timeout=2) == list(range(100))
+
+
+def test_gather_futures_propagates_first_exception():
+    futures = [Future(), Future()]  # type: ignore
+    for f in futures:
+        f.set_running_or_notify_cancel()
+    gathered = gather_futures(futures)
+    futures[0].set_exception(ValueError("foo"))
+    futures[1].set_exception(ValueError("bar"))
+
+    with pytest.raises(ValueError) as exc_info:
+        gathered.result()
+
+    assert str(exc_info.value) == "foo"
+
+
+def test_gather_futures_cancels_pending_futures_on_error():
+    futures = [Future(), Future()]  # type: ignore
+    chained = chain(futures[1], lambda x: x)
+    gathered = gather_futures([futures[0], chained])
+    futures[0].set_exception(ValueError("foo"))
+
+    with pytest.raises(ValueError):
+        gathered.result()
+
+    assert chained.cancelled()
+    assert futures[1].cancelled()
+
+
+schema = build_schema(
+    """
+    type Query {
+        thread: String!
+        non_blocking_thread: String!
+    }
+    """
+)
+
+
+@schema.resolver("Query.thread")
+def resolve_thread(*_: Any) -> str:
+    return threading.current_thread().name
+
+
+@schema.resolver("Query.non_blocking_thread")
+@non_blocking
+def resolve_non_blocking_thread(*_: Any) -> str:
+    return threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_non_blocking_resolvers_are_called_inline():
+    runtime = ThreadPoolRuntime(1, thread_name_prefix="pool")
+    data, errors = await process_request(
+        schema, "{ thread, non_blocking_thread }", runtime=runtime
+    )
+    assert not errors
+    assert data["thread"].startswith("pool")
+    assert data["non_blocking_thread"] == threading.current_thread().name
+
+
+def test_fatal_error_cancels_queued_sibling_resolvers():
+    s = build_schema("type Query { crash: Int, queued: Int }")
+    release = threading.Event()
+    called = []  # type: List[str]
+    cancelled = []  # type: List[str]
+
+    @s.resolver("Query.crash")
+    def resolve_crash(*_: Any) -> None:
+        release.wait(2)
+        raise RuntimeError("Crash")
+
+    @s.resolver("Query.queued")
+    def resolve_queued(*_: Any) -> int:
+        called.append("queued")
+        return 42
+
+    class CancellationCounter(Instrumentation):
+        def on_field_cancelled(self, root, ctx, info):
+            cancelled.append(info.field_definition.name)
+
+    result = execute(
+        s,
+        parse("{ crash, queued }"),
+        runtime=ThreadPoolRuntime(1),
+        instrumentation=CancellationCounter(),
+    )
+    release.set()
+
+    with pytest.raises(RuntimeError):
+        result.result(timeout=2)
+
+    assert called == []
+    assert cancelled == ["queued"]
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+Execution deadlines and resolver timeouts.
+"""
+
+import asyncio
+import time
+from typing import Any, List
+
+import pytest
+
+from py_gql import build_schema, graphql_blocking
+from py_gql.execution import BlockingExecutor, Executor, execute
+from py_gql.execution.runtime import AsyncIORuntime, ThreadPoolRuntime
+from py_gql.execution.runtime.hints import timeout
+from py_gql.execution.runtime.threadpool import _TIMEOUTS
+from py_gql.lang import parse
+
+from ._test_utils import assert_execution
+
+
+def test_timeout_hint_must_be_positive():
+    with pytest.raises(ValueError):
+        timeout(0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_cls", [Executor, BlockingExecutor])
+async def test_blocking_execution_skips_resolvers_past_the_deadline(
+    executor_cls,
+):
+    schema = build_schema("type Query { slow: Int, fast: Int }")
+
+    @schema.resolver("Query.slow")
+    def resolve_slow(*_: Any) -> int:
+        time.sleep(0.05)
+        return 42
+
+    schema.register_resolver("Query", "fast", lambda *_: 42)
+
+    # Synchronous resolvers cannot be interrupted.
+    await assert_execution(
+        schema,
+        "{ slow, fast }",
+        executor_cls=executor_cls,
+        timeout=0.01,
+        expected_data={"slow": 42, "fast": None},
+        expected_errors=[('Field "fast" timed out', (8, 12), "fast")],
+    )
+
+
+def test_graphql_blocking_timeout():
+    schema = build_schema("type Query { slow: Int, fast: Int }")
+    schema.register_resolver("Query", "slow", lambda *_: time.sleep(0.05) or 42)
+    schema.register_resolver("Query", "fast", lambda *_: 42)
+
+    result = graphql_blocking(schema, "{ slow, fast }", timeout=0.01)
+    assert result.data == {"slow": 42, "fast": None}
+
+
+def _async_schema(events: List[str]) -> Any:
+    schema = build_schema(
+        "type Query { slow: Int, fast: Int, limited: Int, items: [Item] }"
+        "type Item { value: Int }"
+    )
+
+    async def resolve_slow(*_: Any) -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+        return 42
+
+    async def resolve_fast(*_: Any) -> int:
+        await asyncio.sleep(0)
+        return 42
+
+    schema.register_resolver("Query", "slow", resolve_slow)
+    schema.register_resolver("Query", "fast", resolve_fast)
+    schema.register_resolver("Query", "limited", timeout(0.01)(resolve_slow))
+    schema.register_resolver("Query", "items", lambda *_: [1, 2])
+
+    @schema.resolver("Item.value", batch=True)
+    async def resolve_values(roots, *_):
+        await asyncio.sleep(10)
+
+    return schema
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("eager", [False, True])
+async def test_asyncio_deadline_cancels_pending_resolvers(eager):
+    events = []  # type: List[str]
+    start = time.monotonic()
+
+    await assert_execution(
+        _async_schema(events),
+        "{ slow, fast }",
+        runtime=AsyncIORuntime(eager=eager),
+        timeout=0.05,
+        expected_data={"slow": None, "fast": 42},
+        expected_errors=[('Field "slow" timed out', (2, 6), "slow")],
+    )
+
+    assert time.monotonic() - start < 1
+    assert events == ["cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_asyncio_resolver_timeout_hint():
+    events = []  # type: List[str]
+
+    await assert_execution(
+        _async_schema(events),
+        "{ limited, fast }",
+        runtime=AsyncIORuntime(),
+        expected_data={"limited": None, "fast": 42},
+        expected_errors=[('Field "limited" timed out', (2, 9), "limited")],
+    )
+
+    assert events == ["cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_asyncio_resolver_timeout_reports_full_path():
+    schema = build_schema(
+        "type Query { items: [Item] } type Item { slow: Int, fast: Int }"
+    )
+
+    @schema.resolver("Item.slow")
+    @timeout(0.01)
+    async def resolve_slow(*_: Any) -> int:
+        await asyncio.sleep(10)
+        return 42
+
+    schema.register_resolver("Query", "items", lambda *_: [1])
+    schema.register_resolver("Item", "fast", lambda *_: 42)
+
+    await assert_execution(
+        schema,
+        "{ items { slow, fast } }",
+        runtime=AsyncIORuntime(),
+        expected_data={"items": [{"slow": None, "fast": 42}]},
+        expected_errors=[
+            ('Field "items[0].slow" timed out', (10, 14), "items[0].slow")
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_asyncio_deadline_fails_all_batched_values():
+    await assert_execution(
+        _async_schema([]),
+        "{ items { value } }",
+        runtime=AsyncIORuntime(),
+        timeout=0.25,
+        expected_data={"items": [{"value": None}, {"value": None}]},
+        expected_errors=[
+            ('Field "items[0].value" timed out', (10, 15), "items[0].value"),
+            ('Field "items[0].value" timed out', (10, 15), "items[1].value"),
+        ],
+    )
+
+
+def test_threadpool_deadline_abandons_pending_resolvers():
+    schema = build_schema("type Query { slow: Int, fast: Int }")
+    schema.register_resolver("Query", "slow", lambda *_: time.sleep(1) or 42)
+    schema.register_resolver("Query", "fast", lambda *_: 42)
+
+    start = time.monotonic()
+    data, errors = execute(
+        schema,
+        parse("{ slow, fast }"),
+        runtime=ThreadPoolRuntime(2),
+        timeout=0.05,
+    ).result(timeout=2)
+
+    assert time.monotonic() - start < 0.5
+    assert data == {"slow": None, "fast": 42}
+    assert [str(err) for err in errors] == ['Field "slow" timed out']
+
+
+def test_threadpool_releases_timers_of_completed_values():
+    schema = build_schema("type Query { fast: Int }")
+    schema.register_resolver(
+        "Query", "fast", lambda *_: time.sleep(0.001) or 42
+    )
+    runtime = ThreadPoolRuntime(2)
+    scheduled = len(_TIMEOUTS)
+
+    for _ in range(100):
+        data, errors = execute(
+            schema, parse("{ fast }"), runtime=runtime, timeout=60,
+        ).result(timeout=2)
+        assert data == {"fast": 42} and not errors
+
+    assert len(_TIMEOUTS) == scheduled
+    # Cancelled entries don't accumulate until their deadline.
+    assert len(_TIMEOUTS._heap) < 100
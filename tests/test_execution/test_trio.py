@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+Execution tests specific to TrioRuntime().
+"""
+
+import threading
+from typing import Any, List, Optional
+
+import pytest
+
+from py_gql import build_schema, process_graphql_query
+from py_gql.exc import ResolverError
+from py_gql.execution import Instrumentation, execute, memoize, subscribe
+from py_gql.execution.runtime import StreamBuffer
+from py_gql.execution.runtime.hints import non_blocking
+from py_gql.lang import parse
+from py_gql.subscription_broker import SubscriptionBroker
+
+trio = pytest.importorskip("trio")
+
+from py_gql.execution.runtime.trio import TrioRuntime  # noqa: E402
+
+
+schema = build_schema(
+    """
+    type Query {
+        a: Int!
+        sync_a: Int!
+        thread: String!
+        non_blocking_thread: String!
+        slow: Int
+        error: Int
+        crash: Int
+    }
+
+    type Subscription {
+        counter: Int!
+    }
+    """
+)
+
+events = []  # type: List[str]
+
+
+@schema.resolver("Query.a")
+async def resolve_a(*_: Any) -> int:
+    await trio.sleep(0)
+    return 42
+
+
+@schema.resolver("Query.sync_a")
+def resolve_sync_a(*_: Any) -> int:
+    return 42
+
+
+@schema.resolver("Query.thread")
+def resolve_thread(*_: Any) -> str:
+    return threading.current_thread().name
+
+
+@schema.resolver("Query.non_blocking_thread")
+@non_blocking
+def resolve_non_blocking_thread(*_: Any) -> str:
+    return threading.current_thread().name
+
+
+@schema.resolver("Query.slow")
+async def resolve_slow(*_: Any) -> int:
+    try:
+        await trio.sleep(1)
+    except trio.Cancelled:
+        events.append("cancelled")
+        raise
+    events.append("finished")
+    return 42
+
+
+@schema.resolver("Query.error")
+async def resolve_error(*_: Any) -> None:
+    await trio.sleep(0)
+    raise ResolverError("FOO")
+
+
+@schema.resolver("Query.crash")
+async def resolve_crash(*_: Any) -> None:
+    await trio.sleep(0.01)
+    raise RuntimeError("Crash")
+
+
+@schema.subscription("Subscription.counter")
+async def counter_subscription(*_: Any) -> Any:
+    for i in range(3):
+        await trio.sleep(0)
+        yield i
+
+
+schema.register_resolver("Subscription", "counter", lambda event, *_: event)
+
+
+def _run(
+    query: str, instrumentation: Optional[Instrumentation] = None, **kwargs: Any
+) -> Any:
+    async def main():
+        return await process_graphql_query(
+            schema,
+            query,
+            runtime=TrioRuntime(**kwargs),
+            instrumentation=instrumentation,
+        )
+
+    return trio.run(main)
+
+
+def test_resolves_sync_and_async_fields():
+    result = _run("{ a, sync_a }")
+    assert result.response() == {"data": {"a": 42, "sync_a": 42}}
+
+
+def test_resolver_errors_are_handled():
+    data, errors = _run("{ a, error }")
+    assert data == {"a": 42, "error": None}
+    assert [str(err) for err in errors] == ["FOO"]
+
+
+def test_blocking_resolvers_run_in_threads():
+    data, errors = _run("{ thread, non_blocking_thread }")
+    assert not errors
+    assert data["thread"] != threading.current_thread().name
+    assert data["non_blocking_thread"] == threading.current_thread().name
+
+
+def test_execute_without_threads():
+    data, _ = _run("{ thread }", execute_blocking_functions_in_thread=False)
+    assert data["thread"] == threading.current_thread().name
+
+
+def test_fatal_error_cancels_sibling_resolvers():
+    del events[:]
+    cancelled = []  # type: List[str]
+
+    class CancellationCounter(Instrumentation):
+        def on_field_cancelled(self, root, ctx, info):
+            cancelled.append(info.field_definition.name)
+
+    with pytest.raises(RuntimeError) as exc_info:
+        _run("{ slow, crash }", instrumentation=CancellationCounter())
+
+    assert str(exc_info.value) == "Crash"
+    assert events == ["cancelled"]
+    assert cancelled == ["slow"]
+
+
+def test_timeout():
+    del events[:]
+
+    async def main():
+        return await process_graphql_query(
+            schema, "{ slow, a }", runtime=TrioRuntime(), timeout=0.05
+        )
+
+    data, errors = trio.run(main)
+
+    assert data == {"slow": None, "a": 42}
+    assert [str(err) for err in errors] == ['Field "slow" timed out']
+    assert events == ["cancelled"]
+
+
+def test_memoized_resolvers_share_concurrent_calls():
+    calls = []  # type: List[str]
+    s = build_schema("type Query { a: Int, b: Int }")
+
+    @s.resolver("Query.a")
+    @memoize
+    async def resolve_a(*_: Any) -> int:
+        calls.append("a")
+        await trio.sleep(0.01)
+        return 42
+
+    @s.resolver("Query.b")
+    @memoize
+    async def resolve_b(*_: Any) -> int:
+        calls.append("b")
+        await trio.sleep(0)
+        raise ResolverError("b")
+
+    async def main():
+        return await process_graphql_query(
+            s, "{ a, x: a, b, y: b }", runtime=TrioRuntime()
+        )
+
+    data, errors = trio.run(main)
+
+    assert data == {"a": 42, "x": 42, "b": None, "y": None}
+    assert sorted(err.path for err in errors) == [["b"], ["y"]]
+    assert sorted(calls) == ["a", "b"]
+
+
+def test_max_concurrency_is_validated():
+    with pytest.raises(ValueError):
+        TrioRuntime(max_concurrency=0)
+
+
+def test_max_concurrency():
+    running = 0
+    max_running = 0
+
+    s = build_schema("type Query { a: Int, b: Int, c: Int }")
+
+    async def resolve(*_: Any) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await trio.sleep(0.01)
+        running -= 1
+        return 1
+
+    for name in "abc":
+        s.register_resolver("Query", name, resolve)
+
+    async def main():
+        return await execute(
+            s, parse("{ a, b, c }"), runtime=TrioRuntime(max_concurrency=1)
+        )
+
+    assert trio.run(main).response() == {"data": {"a": 1, "b": 1, "c": 1}}
+    assert max_running == 1
+
+
+def test_subscription():
+    async def main():
+        stream = await subscribe(
+            schema, parse("subscription { counter }"), runtime=TrioRuntime()
+        )
+        return [result.response() async for result in stream]
+
+    assert trio.run(main) == [{"data": {"counter": i}} for i in range(3)]
+
+
+def test_subscription_broker():
+    async def main():
+        broker = SubscriptionBroker(schema, runtime=TrioRuntime())
+        first = await broker.subscribe("subscription { counter }")
+        second = await broker.subscribe("subscription { counter }")
+        received = [[], []]  # type: List[List[bytes]]
+
+        async def consume(index, subscription):
+            async for payload in subscription:
+                received[index].append(payload)
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(consume, 0, first)
+            nursery.start_soon(consume, 1, second)
+
+        return received, len(broker)
+
+    received, groups = trio.run(main)
+    expected = [b'{"data":{"counter":%d}}' % i for i in range(3)]
+    assert received == [expected, expected]
+    assert groups == 0
+
+
+def test_buffered_streams_are_not_supported():
+    with pytest.raises(NotImplementedError):
+        TrioRuntime().map_stream(
+            iter(()), lambda x: x, buffer=StreamBuffer()  # type: ignore
+        )
+
+
+def test_subscribe_rejects_buffer():
+    with pytest.raises(RuntimeError) as exc_info:
+        subscribe(
+            schema,
+            parse("subscription { counter }"),
+            runtime=TrioRuntime(),
+            buffer=StreamBuffer(),
+        )
+
+    assert str(exc_info.value) == (
+        "Runtime of type '%s' doesn't support buffered subscription streams."
+        % TrioRuntime
+    )
@@ -7,9 +7,15 @@ import asyncio
 
 import pytest
 
-from py_gql._graphql import graphql, graphql_blocking, process_graphql_query
+from py_gql._graphql import (
+    graphql,
+    graphql_blocking,
+    process_graphql_batch,
+    process_graphql_query,
+)
 from py_gql.exc import ResolverError, SchemaError
-from py_gql.execution.runtime import ThreadPoolRuntime
+from py_gql.execution import memoize
+from py_gql.execution.runtime import AsyncIORuntime, ThreadPoolRuntime
 from py_gql.schema import Schema, String
 from py_gql.sdl import build_schema
 
@@ -355,3 +361,98 @@ async def test_graphql_with_async_resolvers():
             }
         ],
     } == result.response()
+
+
+def test_batch_results_are_returned_in_order(starwars_schema):
+    results = process_graphql_batch(
+        starwars_schema,
+        [
+            ("{ hero { name } }", None, None),
+            ("{ hero {", None, None),
+            ("{ hero { foo } }", None, None),
+            ("query ($id: String!) { human(id: $id) { name } }", {}, None),
+            (
+                "query A { hero { name } } query B { droid(id: $id) { name } }",
+                {"id": "2001"},
+                "A",
+            ),
+            ("query A { hero { name } }", None, "B"),
+        ],
+    )
+
+    assert [r.response() for r in results][0] == {
+        "data": {"hero": {"name": "R2-D2"}}
+    }
+    assert [[e.message for e in r.errors] for r in results[1:]] == [
+        ['Expected Name but found "<EOF>"'],
+        ['Cannot query field "foo" on type "Character".'],
+        ['Variable "$id" of required type "String!" was not provided.'],
+        ['Variable "$id" is not defined on "B" operation'],
+        ['No operation "B" in document'],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_operations_are_executed_concurrently():
+    schema = build_schema("type Query { value(delay: Float!): Float }")
+    running = []  # type: list
+    overlapping = []  # type: list
+
+    @schema.resolver("Query.value")
+    async def resolve_value(*_, delay):
+        running.append(delay)
+        overlapping.append(len(running))
+        await asyncio.sleep(delay)
+        running.remove(delay)
+        return delay
+
+    query = "query ($delay: Float!) { value(delay: $delay) }"
+    results = await process_graphql_batch(
+        schema,
+        [(query, {"delay": 0.02}, None), (query, {"delay": 0.01}, None)],
+        runtime=AsyncIORuntime(),
+    )
+
+    assert overlapping == [1, 2]
+    assert [r.response() for r in results] == [
+        {"data": {"value": 0.02}},
+        {"data": {"value": 0.01}},
+    ]
+
+
+def test_batch_shares_documents_and_memoized_values(monkeypatch):
+    import py_gql._graphql
+
+    schema = build_schema("type Query { viewer: String, other: String }")
+    calls = []  # type: list
+    parsed = []  # type: list
+    parse = py_gql._graphql.parse
+
+    def _parse(document):
+        parsed.append(document)
+        return parse(document)
+
+    monkeypatch.setattr(py_gql._graphql, "parse", _parse)
+
+    @schema.resolver("Query.viewer")
+    @memoize
+    def resolve_viewer(*_):
+        calls.append("viewer")
+        return "alice"
+
+    results = process_graphql_batch(
+        schema,
+        [
+            ("{ viewer }", None, None),
+            ("{ viewer }", None, None),
+            ("{ me: viewer, other }", None, None),
+        ],
+    )
+
+    assert [r.response() for r in results] == [
+        {"data": {"viewer": "alice"}},
+        {"data": {"viewer": "alice"}},
+        {"data": {"me": "alice", "other": None}},
+    ]
+    assert calls == ["viewer"]
+    assert parsed == ["{ viewer }", "{ me: viewer, other }"]
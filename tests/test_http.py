@@ -0,0 +1,427 @@
+# -*- coding: utf-8 -*-
+"""
+Test the ASGI and WSGI adapters.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import pickle
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import pytest
+
+from py_gql import build_schema
+from py_gql._http import HTTPError, RequestError
+from py_gql.asgi import GraphQLApp as ASGIApp
+from py_gql.execution.cache import MemoryCacheStore
+from py_gql.execution.runtime import ThreadPoolRuntime
+from py_gql.wsgi import GraphQLApp as WSGIApp
+
+
+SDL = """
+type Query {
+    hello(name: String = "world"): String
+    items(count: Int!): [String!]!
+    user: String
+}
+
+type Mutation {
+    increment: Int
+}
+"""
+
+Response = Tuple[int, Dict[str, str], List[bytes]]
+
+
+def _schema() -> Any:
+    schema = build_schema(SDL)
+
+    @schema.resolver("Query.hello")
+    def hello(*_: Any, name: str) -> str:
+        return "Hello %s!" % name
+
+    @schema.resolver("Query.items")
+    def items(*_: Any, count: int) -> List[str]:
+        return ["item-%d" % i for i in range(count)]
+
+    @schema.resolver("Query.user")
+    def user(_: Any, ctx: Any, *__: Any) -> str:
+        return ctx["user"]
+
+    @schema.resolver("Mutation.increment")
+    def increment(*_: Any) -> int:
+        return 1
+
+    return schema
+
+
+def _wsgi_client(**kwargs: Any) -> Any:
+    app = WSGIApp(_schema(), **kwargs)
+
+    async def request(
+        method: str,
+        query_string: str = "",
+        body: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        environ = {
+            "REQUEST_METHOD": method,
+            "QUERY_STRING": query_string,
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.input": io.BytesIO(body),
+        }
+        for name, value in (headers or {}).items():
+            if name == "content-type":
+                environ["CONTENT_TYPE"] = value
+            else:
+                environ["HTTP_" + name.upper().replace("-", "_")] = value
+
+        started = []  # type: List[Any]
+
+        def start_response(status, response_headers):
+            started.append((int(status.split()[0]), dict(response_headers)))
+
+        chunks = list(app(environ, start_response))
+        return started[0][0], started[0][1], chunks
+
+    return request
+
+
+def _asgi_client(**kwargs: Any) -> Any:
+    app = ASGIApp(_schema(), **kwargs)
+
+    async def request(
+        method: str,
+        query_string: str = "",
+        body: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        scope = {
+            "type": "http",
+            "method": method,
+            "query_string": query_string.encode("latin-1"),
+            "headers": [
+                (k.encode("latin-1"), v.encode("latin-1"))
+                for k, v in (headers or {}).items()
+            ],
+        }
+        # Send the body in 2 parts.
+        messages = [
+            {"type": "http.request", "body": body[:5], "more_body": True},
+            {"type": "http.request", "body": body[5:]},
+        ]
+        sent = []  # type: List[Dict[str, Any]]
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        await app(scope, receive, send)
+
+        start, chunks = sent[0], sent[1:]
+        assert start["type"] == "http.response.start"
+        assert not chunks[-1].get("more_body", False)
+        return (
+            start["status"],
+            {k.decode(): v.decode() for k, v in start["headers"]},
+            [c["body"] for c in chunks if c["body"]],
+        )
+
+    return request
+
+
+@pytest.fixture(params=[_asgi_client, _wsgi_client], ids=["asgi", "wsgi"])
+def client(request):
+    return request.param
+
+
+def _json(chunks: List[bytes]) -> Any:
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def _post(request: Any, data: Any, **headers: str) -> Any:
+    headers["content-type"] = "application/json"
+    return request(
+        "POST",
+        body=json.dumps(data).encode("utf-8"),
+        headers={k.replace("_", "-"): v for k, v in headers.items()},
+    )
+
+
+@pytest.mark.asyncio
+async def test_get(client):
+    status, headers, body = await client()(
+        "GET",
+        urlencode(
+            {
+                "query": "query ($name: String) { hello(name: $name) }",
+                "variables": json.dumps({"name": "bob"}),
+            }
+        ),
+    )
+    assert status == 200
+    assert headers["content-type"] == "application/json"
+    assert _json(body) == {"data": {"hello": "Hello bob!"}}
+
+
+@pytest.mark.asyncio
+async def test_get_refuses_mutations(client):
+    status, headers, body = await client()(
+        "GET", urlencode({"query": "mutation { increment }"})
+    )
+    assert status == 405
+    assert headers["allow"] == "POST"
+    assert _json(body) == {
+        "errors": [
+            {
+                "message": "Can only perform a mutation operation from a POST "
+                "request"
+            }
+        ]
+    }
+
+
+@pytest.mark.asyncio
+async def test_post_json(client):
+    status, _, body = await _post(
+        client(),
+        {
+            "query": "query A { hello } mutation B { increment }",
+            "operationName": "B",
+        },
+    )
+    assert status == 200
+    assert _json(body) == {"data": {"increment": 1}}
+
+
+@pytest.mark.asyncio
+async def test_post_graphql(client):
+    status, _, body = await client()(
+        "POST",
+        urlencode({"variables": json.dumps({"name": "alice"})}),
+        b"query ($name: String) { hello(name: $name) }",
+        {"content-type": "application/graphql; charset=utf-8"},
+    )
+    assert status == 200
+    assert _json(body) == {"data": {"hello": "Hello alice!"}}
+
+
+@pytest.mark.asyncio
+async def test_batch(client):
+    status, _, body = await _post(
+        client(),
+        [
+            {"query": "{ hello }"},
+            {"query": "{ hello"},
+            {"variables": {}},
+            {"query": "{ items(count: 2) }"},
+        ],
+    )
+    assert status == 200
+    results = _json(body)
+    [syntax_error] = results[1]["errors"]
+    assert syntax_error["message"].startswith('Expected Name but found "<EOF>"')
+    assert results[:1] + results[2:] == [
+        {"data": {"hello": "Hello world!"}},
+        {"errors": [{"message": "Must provide query string."}]},
+        {"data": {"items": ["item-0", "item-1"]}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batching_can_be_disabled(client):
+    status, _, body = await _post(client(batching=False), [{"query": "{}"}])
+    assert status == 400
+    assert _json(body) == {
+        "errors": [{"message": "Batched requests are not supported"}]
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, body, headers, status, message",
+    [
+        ("PUT", b"", {}, 405, "Method not allowed"),
+        (
+            "POST",
+            b"{",
+            {"content-type": "application/json"},
+            400,
+            "Invalid JSON body",
+        ),
+        (
+            "POST",
+            b"[]",
+            {"content-type": "application/json"},
+            400,
+            "Empty batch",
+        ),
+        (
+            "POST",
+            b'{"query": 42}',
+            {"content-type": "application/json"},
+            400,
+            "Invalid query parameter",
+        ),
+        (
+            "POST",
+            b"",
+            {"content-type": "text/plain"},
+            415,
+            "Unsupported content type 'text/plain'",
+        ),
+        (
+            "POST",
+            b'{"query": "{ hello }"}' + b" " * 100,
+            {"content-type": "application/json"},
+            413,
+            "Request body is too large",
+        ),
+    ],
+)
+async def test_invalid_requests(client, method, body, headers, status, message):
+    response = await client(max_body_size=100)(method, "", body, headers)
+    assert response[0] == status
+    assert _json(response[2]) == {"errors": [{"message": message}]}
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries(client):
+    request = client(persisted_queries=MemoryCacheStore())
+    query = "{ hello }"
+    digest = hashlib.sha256(query.encode("utf-8")).hexdigest()
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": digest}}
+
+    _, _, body = await _post(request, {"extensions": extensions})
+    assert _json(body) == {
+        "errors": [
+            {
+                "message": "PersistedQueryNotFound",
+                "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+            }
+        ]
+    }
+
+    _, _, body = await _post(
+        request, {"query": query, "extensions": extensions}
+    )
+    assert _json(body) == {"data": {"hello": "Hello world!"}}
+
+    _, _, body = await request(
+        "GET", urlencode({"extensions": json.dumps(extensions)})
+    )
+    assert _json(body) == {"data": {"hello": "Hello world!"}}
+
+    _, _, body = await _post(
+        request, {"query": "{ items(count: 1) }", "extensions": extensions}
+    )
+    assert _json(body) == {
+        "errors": [{"message": "Provided sha256Hash does not match query"}]
+    }
+
+
+@pytest.mark.asyncio
+async def test_response_is_streamed_in_chunks(client):
+    _, _, body = await _post(
+        client(chunk_size=100),
+        [{"query": "{ items(count: 100) }"}, {"query": "{ hello }"}],
+    )
+    assert len(body) > 10
+    assert all(len(chunk) < 200 for chunk in body)
+    assert _json(body) == [
+        {"data": {"items": ["item-%d" % i for i in range(100)]}},
+        {"data": {"hello": "Hello world!"}},
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "count, accept_encoding, compressed",
+    [
+        (100, "gzip, deflate", True),
+        (100, "deflate", False),
+        (100, "gzip;q=0", False),
+        (1, "gzip", False),
+    ],
+)
+async def test_gzip(client, count, accept_encoding, compressed):
+    _, headers, body = await _post(
+        client(gzip=True, gzip_min_size=500, chunk_size=200),
+        {"query": "{ items(count: %d) }" % count},
+        accept_encoding=accept_encoding,
+    )
+
+    assert (headers.get("content-encoding") == "gzip") is compressed
+    data = b"".join(body)
+    if compressed:
+        data = gzip.decompress(data)
+    assert json.loads(data.decode("utf-8")) == {
+        "data": {"items": ["item-%d" % i for i in range(count)]}
+    }
+
+
+@pytest.mark.asyncio
+async def test_context_factory(client):
+    def context(request):
+        return {"user": "alice"}
+
+    _, _, body = await _post(client(context=context), {"query": "{ user }"})
+    assert _json(body) == {"data": {"user": "alice"}}
+
+
+@pytest.mark.asyncio
+async def test_asgi_async_context_factory():
+    async def context(scope):
+        return {"user": scope["method"]}
+
+    _, _, body = await _post(
+        _asgi_client(context=context), {"query": "{ user }"}
+    )
+    assert _json(body) == {"data": {"user": "POST"}}
+
+
+@pytest.mark.asyncio
+async def test_wsgi_with_thread_pool_runtime():
+    _, _, body = await _post(
+        _wsgi_client(runtime=ThreadPoolRuntime(2)),
+        [{"query": "{ hello }"}, {"query": "{ items(count: 1) }"}],
+    )
+    assert _json(body) == [
+        {"data": {"hello": "Hello world!"}},
+        {"data": {"items": ["item-0"]}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_asgi_lifespan():
+    app = ASGIApp(_schema())
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []  # type: List[Any]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    await app({"type": "lifespan"}, receive, send)
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        HTTPError(405, "Method not allowed", [("allow", "POST")]),
+        RequestError("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND"),
+    ],
+)
+def test_errors_can_be_pickled(error):
+    copy = pickle.loads(pickle.dumps(error))
+    assert type(copy) is type(error)
+    assert copy.__dict__ == error.__dict__
+    assert str(copy) == str(error)
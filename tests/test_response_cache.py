@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+import json
+from typing import Any, List
+
+import pytest
+
+from py_gql import build_schema
+from py_gql.execution.cache import (
+    PRIVATE,
+    CacheControlDirective,
+    CacheHint,
+    MemoryCacheStore,
+)
+from py_gql.execution.runtime import AsyncIORuntime
+from py_gql.response_cache import ResponseCache
+
+
+SDL = """
+type User @cacheControl(maxAge: 30, scope: PRIVATE) {
+    name: String
+}
+
+type Query {
+    greeting(name: String): String @cacheControl(maxAge: 60)
+    viewer: User
+    now: Int
+}
+
+type Mutation {
+    greet: String @cacheControl(maxAge: 60)
+}
+"""
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def schema(calls):
+    schema = build_schema(SDL, schema_directives=(CacheControlDirective,))
+
+    @schema.resolver("Query.greeting")
+    def resolve_greeting(*_: Any, name: str = "World") -> str:
+        calls.append("greeting")
+        return "Hello %s" % name
+
+    @schema.resolver("Query.viewer")
+    def resolve_viewer(_root: Any, ctx: Any, *_: Any) -> Any:
+        calls.append("viewer")
+        return {"name": ctx}
+
+    @schema.resolver("Mutation.greet")
+    def resolve_greet(*_: Any) -> str:
+        calls.append("greet")
+        return "Hello"
+
+    schema.register_resolver("Query", "now", lambda *_: 42)
+    return schema
+
+
+def test_cache_hit_skips_execution(schema, calls):
+    cache = ResponseCache(schema)
+
+    first = cache.process("{ greeting }")
+    second = cache.process("{ greeting }")
+
+    assert not first.hit and second.hit
+    assert json.loads(second.body) == {"data": {"greeting": "Hello World"}}
+    assert second.body == first.body
+    assert second.policy == CacheHint(60)
+    assert second.http_header() == "max-age=60, public"
+    assert calls == ["greeting"]
+
+
+def test_cache_hit_reports_remaining_max_age(schema, calls):
+    now = [0.0]
+    cache = ResponseCache(
+        schema,
+        store=MemoryCacheStore(clock=lambda: now[0]),
+        clock=lambda: now[0],
+    )
+
+    cache.process("{ greeting }")
+    now[0] = 59.5
+    response = cache.process("{ greeting }")
+
+    assert response.hit
+    assert response.policy == CacheHint(1)
+
+    now[0] = 60
+    assert not cache.process("{ greeting }").hit
+
+    now[0] = 75
+    response = cache.process("{ greeting }")
+    assert response.hit
+    assert response.http_header() == "max-age=45, public"
+    assert calls == ["greeting", "greeting"]
+
+
+def test_cache_key_includes_variables_and_operation(schema, calls):
+    cache = ResponseCache(schema)
+    query = """
+    query A($name: String) { greeting(name: $name) }
+    query B($name: String) { greeting(name: $name) }
+    """
+
+    for operation_name, variables in [
+        ("A", {"name": "Foo"}),
+        ("A", {"name": "Bar"}),
+        ("B", {"name": "Foo"}),
+        ("A", {"name": "Foo"}),
+    ]:
+        cache.process(query, operation_name=operation_name, variables=variables)
+
+    assert calls == ["greeting"] * 3
+
+
+def test_variables_are_canonicalized(schema):
+    cache = ResponseCache(schema)
+    assert cache.key("{ a }", None, {"a": 1, "b": 2}) == cache.key(
+        "{ a }", None, {"b": 2, "a": 1}
+    )
+
+
+def test_uncacheable_fields_are_not_cached(schema, calls):
+    cache = ResponseCache(schema)
+
+    for _ in range(2):
+        response = cache.process("{ greeting now }")
+        assert response.http_header() is None
+
+    assert calls == ["greeting", "greeting"]
+
+
+def test_default_max_age(schema, calls):
+    cache = ResponseCache(schema, default_max_age=10)
+
+    for _ in range(2):
+        response = cache.process("{ greeting now }")
+
+    assert response.hit
+    assert response.policy == CacheHint(10)
+
+
+def test_errors_are_not_cached(schema):
+    cache = ResponseCache(schema)
+
+    for query in ("{ greeting", "{ unknown }"):
+        for _ in range(2):
+            response = cache.process(query)
+            assert not response.hit
+            assert "errors" in json.loads(response.body)
+
+
+def test_mutations_are_not_cached(schema, calls):
+    cache = ResponseCache(schema, default_max_age=10)
+
+    for _ in range(2):
+        response = cache.process("mutation { greet }")
+        assert not response.hit
+        assert response.http_header() is None
+
+    assert calls == ["greet", "greet"]
+
+
+def test_private_responses_are_cached_per_scope(schema, calls):
+    cache = ResponseCache(schema)
+    responses = []  # type: List[Any]
+
+    for user in ("alice", "bob", "alice", None, None):
+        responses.append(
+            cache.process(
+                "{ greeting viewer { name } }", scope=user, context=user
+            )
+        )
+
+    assert [r.hit for r in responses] == [False, False, True, False, False]
+    assert json.loads(responses[2].body)["data"]["viewer"] == {"name": "alice"}
+    assert responses[2].policy == CacheHint(30, PRIVATE)
+    assert calls.count("viewer") == 4
+
+
+def test_public_responses_are_shared_across_scopes(schema, calls):
+    cache = ResponseCache(schema)
+
+    assert not cache.process("{ greeting }", scope="alice").hit
+    assert cache.process("{ greeting }", scope="bob").hit
+    assert cache.process("{ greeting }").hit
+    assert calls == ["greeting"]
+
+
+@pytest.mark.asyncio
+async def test_async_runtime(schema, calls):
+    cache = ResponseCache(schema, runtime=AsyncIORuntime())
+
+    first = await cache.process("{ greeting }")
+    second = await cache.process("{ greeting }")
+
+    assert second.hit and second.body == first.body
+    assert calls == ["greeting"]
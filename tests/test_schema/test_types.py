@@ -24,6 +24,7 @@ from py_gql.schema import (
     ListType,
     NonNullType,
     RegexType,
+    ScalarType,
     String,
 )
 
@@ -71,6 +72,32 @@ def test_EnumType_get_name_fail():
     assert str(exc_info.value) == "Invalid value 2 for enum Enum"
 
 
+def test_EnumType_get_name_unhashable_value():
+    t = EnumType("Enum", [("ONE", [1]), ("TWO", {"two": 2}), ("THREE", 3)])
+    assert t.get_name([1]) == "ONE"
+    assert t.get_name({"two": 2}) == "TWO"
+    assert t.get_name(3) == "THREE"
+
+
+def test_EnumType_get_name_unhashable_value_fail():
+    t = EnumType("Enum", [("ONE", [1])])
+    with pytest.raises(UnknownEnumValue) as exc_info:
+        t.get_name([2])
+    assert str(exc_info.value) == "Invalid value [2] for enum Enum"
+
+
+def test_EnumType_get_names_ok():
+    t = EnumType("Enum", [("ONE", 1), ("TWO", [2])])
+    assert t.get_names([1, [2], 1]) == ["ONE", "TWO", "ONE"]
+
+
+def test_EnumType_get_names_fail():
+    t = EnumType("Enum", [("ONE", 1)])
+    with pytest.raises(UnknownEnumValue) as exc_info:
+        t.get_names([1, 2])
+    assert str(exc_info.value) == "Invalid value 2 for enum Enum"
+
+
 def test_EnumType_from_python_enum():
     class FooEnum(enum.Enum):
         A = "A"
@@ -161,6 +188,55 @@ def test_scalar_serialization_fail(type_, input_, err):
     assert str(exc_info.value) == err
 
 
+class TestBulkScalarMethods:
+    def test_serialize_many_defaults_to_serialize(self):
+        assert Int.serialize_many([1, 2.0, True]) == [1, 2, 1]
+
+    def test_serialize_many_default_fail(self):
+        with pytest.raises(ScalarSerializationError) as exc_info:
+            Int.serialize_many([1, "one"])
+        assert str(exc_info.value) == (
+            "Int cannot represent non integer value: one"
+        )
+
+    def test_parse_many_defaults_to_parse(self):
+        assert Int.parse_many([1, 2]) == [1, 2]
+
+    def test_custom_serialize_many_and_parse_many(self):
+        calls = []
+
+        def serialize_many(values):
+            calls.append(("serialize", list(values)))
+            return [str(v) for v in values]
+
+        def parse_many(values):
+            calls.append(("parse", list(values)))
+            return [int(v) for v in values]
+
+        type_ = ScalarType(
+            "Custom",
+            serialize=str,
+            parse=int,
+            serialize_many=serialize_many,
+            parse_many=parse_many,
+        )
+
+        assert type_.serialize_many([1, 2]) == ["1", "2"]
+        assert type_.parse_many(["1", "2"]) == [1, 2]
+        assert calls == [("serialize", [1, 2]), ("parse", ["1", "2"])]
+
+    def test_custom_parse_many_fail(self):
+        type_ = ScalarType(
+            "Custom",
+            serialize=str,
+            parse=int,
+            parse_many=lambda values: [int(v) for v in values],
+        )
+
+        with pytest.raises(ScalarParsingError):
+            type_.parse_many(["1", "foo"])
+
+
 class TestUUID:
     def test_parse_string(self):
         assert UUID.parse("c4da8450-ec7a-4d3b-9ade-18194daeb2d6") == uuid.UUID(
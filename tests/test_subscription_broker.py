@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, List
+
+import pytest
+
+from py_gql import GraphQLResult, build_schema
+from py_gql.execution.runtime import AsyncIORuntime
+from py_gql.subscription_broker import Subscription, SubscriptionBroker
+
+
+SDL = """
+type Query {
+    hello: String
+}
+
+type Subscription {
+    counter(step: Int = 1): Int!
+    user: String
+}
+"""
+
+QUERY = "subscription ($step: Int) { counter(step: $step) }"
+
+
+class _Source:
+    def __init__(self) -> None:
+        self.queue = asyncio.Queue()  # type: asyncio.Queue
+        self.created = 0
+        self.closed = 0
+        self.executed = []  # type: List[int]
+
+    def schema(self) -> Any:
+        schema = build_schema(SDL)
+
+        async def events(step: int) -> AsyncIterator[int]:
+            try:
+                while True:
+                    value = await self.queue.get()
+                    if value is None:
+                        return
+                    yield value * step
+            finally:
+                self.closed += 1
+
+        @schema.subscription("Subscription.counter")
+        def counter(*_: Any, step: int) -> AsyncIterator[int]:
+            self.created += 1
+            return events(step)
+
+        @schema.resolver("Subscription.counter")
+        def resolve_counter(event: int, *_: Any, **__: Any) -> int:
+            self.executed.append(event)
+            return event
+
+        @schema.subscription("Subscription.user")
+        async def user(*_: Any) -> AsyncIterator[int]:
+            while True:
+                yield await self.queue.get()
+
+        @schema.resolver("Subscription.user")
+        def resolve_user(event: int, ctx: Any, *_: Any) -> str:
+            return "%s:%d" % (ctx["user"], event)
+
+        return schema
+
+
+def _decode(payload: bytes) -> Any:
+    return json.loads(payload.decode("utf8"))
+
+
+@pytest.mark.asyncio
+async def test_identical_subscriptions_share_a_single_execution():
+    source = _Source()
+    broker = SubscriptionBroker(source.schema(), runtime=AsyncIORuntime())
+
+    subscriptions = [await broker.subscribe(QUERY) for _ in range(3)]
+    assert all(isinstance(s, Subscription) for s in subscriptions)
+    assert len(broker) == 1
+
+    for value in (1, 2):
+        source.queue.put_nowait(value)
+
+    received = [
+        [await s.__anext__(), await s.__anext__()] for s in subscriptions
+    ]
+
+    expected = [b'{"data":{"counter":1}}', b'{"data":{"counter":2}}']
+    assert received == [expected] * 3
+    assert source.created == 1
+    assert source.executed == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_are_grouped_by_variables_and_scope():
+    source = _Source()
+    broker = SubscriptionBroker(source.schema(), runtime=AsyncIORuntime())
+
+    await broker.subscribe(QUERY)
+    await broker.subscribe(QUERY, variables={"step": 1})
+    await broker.subscribe(QUERY, variables={"step": 2})
+    await broker.subscribe(QUERY, variables={"step": 2})
+    await broker.subscribe(QUERY, variables={"step": 2}, scope="alice")
+
+    assert len(broker) == 4
+    assert source.created == 4
+
+
+@pytest.mark.asyncio
+async def test_events_are_executed_with_the_context_of_the_first_subscriber():
+    source = _Source()
+    broker = SubscriptionBroker(source.schema(), runtime=AsyncIORuntime())
+
+    alice = await broker.subscribe(
+        "subscription { user }", scope="alice", context={"user": "alice"}
+    )
+    bob = await broker.subscribe(
+        "subscription { user }", scope="bob", context={"user": "bob"}
+    )
+    other = await broker.subscribe(
+        "subscription { user }", scope="bob", context={"user": "other"}
+    )
+
+    source.queue.put_nowait(1)
+    source.queue.put_nowait(2)
+
+    assert [_decode(await s.__anext__()) for s in (alice, bob, other)] == [
+        {"data": {"user": "alice:1"}},
+        {"data": {"user": "bob:2"}},
+        {"data": {"user": "bob:2"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_source_stream_is_closed_when_all_subscribers_are_gone():
+    source = _Source()
+    broker = SubscriptionBroker(source.schema(), runtime=AsyncIORuntime())
+
+    first = await broker.subscribe(QUERY)
+    second = await broker.subscribe(QUERY)
+
+    source.queue.put_nowait(1)
+    await first.__anext__()
+    await second.__anext__()
+
+    await first.aclose()
+    assert first.closed
+    assert len(broker) == 1 and source.closed == 0
+
+    await second.aclose()
+    assert len(broker) == 0 and source.closed == 1
+
+    # New subscribers create a new group.
+    await broker.subscribe(QUERY)
+    assert source.created == 2
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_end_with_the_source_stream():
+    source = _Source()
+    broker = SubscriptionBroker(source.schema(), runtime=AsyncIORuntime())
+
+    subscriptions = [await broker.subscribe(QUERY) for _ in range(2)]
+
+    for value in (1, 2, None):
+        source.queue.put_nowait(value)
+
+    for subscription in subscriptions:
+        assert [_decode(p) async for p in subscription] == [
+            {"data": {"counter": 1}},
+            {"data": {"counter": 2}},
+        ]
+        assert subscription.closed
+
+    assert len(broker) == 0
+
+
+@pytest.mark.asyncio
+async def test_late_subscribers_only_receive_new_events():
+    source = _Source()
+    broker = SubscriptionBroker(source.schema(), runtime=AsyncIORuntime())
+
+    early = await broker.subscribe(QUERY)
+    source.queue.put_nowait(1)
+    assert _decode(await early.__anext__()) == {"data": {"counter": 1}}
+
+    late = await broker.subscribe(QUERY)
+    source.queue.put_nowait(2)
+    assert _decode(await late.__anext__()) == {"data": {"counter": 2}}
+    assert _decode(await early.__anext__()) == {"data": {"counter": 2}}
+    assert source.executed == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_a_subscriber_does_not_affect_the_others():
+    source = _Source()
+    broker = SubscriptionBroker(source.schema(), runtime=AsyncIORuntime())
+
+    first = await broker.subscribe(QUERY)
+    second = await broker.subscribe(QUERY)
+
+    pending = asyncio.ensure_future(first.__anext__())
+    await asyncio.sleep(0)
+    pending.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+    await first.aclose()
+
+    source.queue.put_nowait(1)
+    assert _decode(await second.__anext__()) == {"data": {"counter": 1}}
+    assert source.closed == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_subscribers_receive_events_in_order():
+    source = _Source()
+    broker = SubscriptionBroker(source.schema(), runtime=AsyncIORuntime())
+
+    async def consume(subscription: Subscription) -> List[Any]:
+        return [_decode(p)["data"]["counter"] async for p in subscription]
+
+    subscriptions = [await broker.subscribe(QUERY) for _ in range(10)]
+    consumers = asyncio.gather(*(consume(s) for s in subscriptions))
+
+    for value in range(1, 6):
+        source.queue.put_nowait(value)
+        await asyncio.sleep(0)
+    source.queue.put_nowait(None)
+
+    assert await consumers == [[1, 2, 3, 4, 5]] * 10
+    assert source.executed == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "document, variables, expected",
+    [
+        ("subscription { counter(", None, "Expected Name"),
+        ("subscription { foo }", None, "Cannot query field"),
+        ("{ hello }", None, "Expected a subscription operation"),
+        (QUERY, {"step": "foo"}, "Variable"),
+    ],
+)
+async def test_invalid_subscriptions_return_errors(
+    document, variables, expected
+):
+    broker = SubscriptionBroker(_Source().schema(), runtime=AsyncIORuntime())
+    result = await broker.subscribe(document, variables=variables)
+
+    assert isinstance(result, GraphQLResult)
+    assert str(result.errors[0]).startswith(expected)
+    assert len(broker) == 0
@@ -11,6 +11,7 @@ from py_gql.schema import (
     Int,
     ListType,
     NonNullType,
+    ScalarType,
     String,
 )
 from py_gql.utilities import coerce_value
@@ -196,6 +197,45 @@ def test_ListType_raises_for_invalid_items():
     )
 
 
+def test_ListType_with_null_items():
+    _test([1, None, "3"], ListType(Int), [1, None, 3])
+
+
+def test_ListType_raises_for_null_non_nullable_item():
+    _test(
+        [1, None, "3"],
+        ListType(NonNullType(Int)),
+        None,
+        "Expected non-nullable type Int! not to be null at value[1]",
+    )
+
+
+def test_ListType_uses_parse_many():
+    calls = []
+
+    def parse_many(values):
+        calls.append(list(values))
+        return [int(v) * 2 for v in values]
+
+    type_ = ScalarType("Double", str, int, parse_many=parse_many)
+
+    _test(["1", None, "3"], ListType(type_), [2, None, 6])
+    assert calls == [["1", "3"]]
+
+
+def test_ListType_parse_many_errors_report_entry_path():
+    type_ = ScalarType(
+        "Custom", str, int, parse_many=lambda values: [int(v) for v in values]
+    )
+
+    _test(
+        ["1", "abc"],
+        ListType(type_),
+        None,
+        "invalid literal for int() with base 10: 'abc' at value[1]",
+    )
+
+
 def test_nested_error():
     _test(
         [{"foo": "abc"}],
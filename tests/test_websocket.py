@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from typing import Any, AsyncIterator, List
+
+import pytest
+
+from py_gql import build_schema
+from py_gql.websocket import (
+    GRAPHQL_TRANSPORT_WS,
+    GRAPHQL_WS,
+    ConnectionRejected,
+    MemoryTransport,
+    WebSocketServer,
+)
+
+
+SDL = """
+type Query {
+    hello(name: String = "world"): String
+    whoami: String
+}
+
+type Subscription {
+    counter(max: Int!): Int!
+    events: Int!
+}
+"""
+
+
+class _Env:
+    def __init__(self, subprotocol: str = GRAPHQL_TRANSPORT_WS, **kwargs: Any):
+        self.events = asyncio.Queue()  # type: asyncio.Queue
+        self.closed = []  # type: List[bool]
+        self.server = WebSocketServer(self.schema(), **kwargs)
+        self.transport = MemoryTransport()
+        self.task = asyncio.ensure_future(
+            self.server.handle(
+                self.transport, subprotocol, context={"user": "anonymous"}
+            )
+        )
+
+    def schema(self) -> Any:
+        schema = build_schema(SDL)
+
+        @schema.resolver("Query.hello")
+        def hello(*_: Any, name: str) -> str:
+            return "Hello %s!" % name
+
+        @schema.resolver("Query.whoami")
+        def whoami(_: Any, ctx: Any, *__: Any) -> str:
+            return ctx["user"]
+
+        @schema.subscription("Subscription.counter")
+        async def counter(*_: Any, max: int) -> AsyncIterator[int]:
+            for i in range(1, max + 1):
+                yield i
+
+        @schema.subscription("Subscription.events")
+        async def events(*_: Any) -> AsyncIterator[int]:
+            try:
+                while True:
+                    yield await self.events.get()
+            finally:
+                self.closed.append(True)
+
+        schema.register_resolver(
+            "Subscription", "counter", lambda e, *_, **__: e
+        )
+        schema.register_resolver("Subscription", "events", lambda e, *_: e)
+        return schema
+
+    def send(self, message: Any) -> None:
+        self.transport.client_send(message)
+
+    async def receive(self) -> Any:
+        return await asyncio.wait_for(self.transport.client_receive(), 1)
+
+    async def init(self, payload: Any = None) -> None:
+        self.send({"type": "connection_init", "payload": payload})
+        assert await self.receive() == {"type": "connection_ack"}
+
+    async def closed_with(self) -> Any:
+        assert await self.receive() is None
+        await asyncio.wait_for(self.task, 1)
+        return self.transport.close_code, self.transport.close_reason
+
+
+@pytest.mark.asyncio
+async def test_query():
+    env = _Env(keep_alive=None)
+    await env.init()
+
+    env.send(
+        {
+            "type": "subscribe",
+            "id": "1",
+            "payload": {
+                "query": "query ($name: String) { hello(name: $name) }",
+                "variables": {"name": "bob"},
+            },
+        }
+    )
+
+    assert await env.receive() == {
+        "type": "next",
+        "id": "1",
+        "payload": {"data": {"hello": "Hello bob!"}},
+    }
+    assert await env.receive() == {"type": "complete", "id": "1"}
+
+    env.transport.client_close()
+    await asyncio.wait_for(env.task, 1)
+
+
+@pytest.mark.asyncio
+async def test_subscription():
+    env = _Env(keep_alive=None)
+    await env.init()
+
+    env.send(
+        {
+            "type": "subscribe",
+            "id": "1",
+            "payload": {"query": "subscription { counter(max: 2) }"},
+        }
+    )
+
+    assert [await env.receive() for _ in range(3)] == [
+        {"type": "next", "id": "1", "payload": {"data": {"counter": 1}}},
+        {"type": "next", "id": "1", "payload": {"data": {"counter": 2}}},
+        {"type": "complete", "id": "1"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_operations_are_multiplexed_and_can_be_stopped():
+    env = _Env(keep_alive=None)
+    await env.init()
+
+    for op_id in ("a", "b"):
+        env.send(
+            {
+                "type": "subscribe",
+                "id": op_id,
+                "payload": {"query": "subscription { events }"},
+            }
+        )
+    await asyncio.sleep(0.01)
+
+    env.events.put_nowait(1)
+    env.events.put_nowait(2)
+
+    received = [await env.receive() for _ in range(2)]
+    assert sorted(m["payload"]["data"]["events"] for m in received) == [1, 2]
+
+    env.send({"type": "complete", "id": "a"})
+    await asyncio.sleep(0.01)
+    assert env.closed == [True]
+
+    env.events.put_nowait(3)
+    message = await env.receive()
+    assert message["id"] == "b"
+    assert message["payload"] == {"data": {"events": 3}}
+
+    env.transport.client_close()
+    await asyncio.wait_for(env.task, 1)
+    assert env.closed == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_request_errors():
+    env = _Env(keep_alive=None)
+    await env.init()
+
+    env.send({"type": "subscribe", "id": "1", "payload": {"query": "{ foo }"}})
+
+    message = await env.receive()
+    assert message["type"] == "error" and message["id"] == "1"
+    assert message["payload"][0]["message"].startswith("Cannot query field")
+
+
+@pytest.mark.asyncio
+async def test_documents_are_cached(monkeypatch):
+    import py_gql.websocket
+
+    parsed = []  # type: List[str]
+    parse = py_gql.websocket.parse
+
+    def _parse(query):
+        parsed.append(query)
+        return parse(query)
+
+    monkeypatch.setattr(py_gql.websocket, "parse", _parse)
+
+    env = _Env(keep_alive=None, document_cache_size=1)
+    await env.init()
+
+    for i, query in enumerate(["{ hello }", "{ hello }", "{ whoami }"]):
+        env.send(
+            {"type": "subscribe", "id": str(i), "payload": {"query": query}}
+        )
+        await env.receive()
+        await env.receive()
+
+    assert parsed == ["{ hello }", "{ whoami }"]
+    assert list(env.server._documents) == ["{ whoami }"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_operations_are_limited():
+    env = _Env(keep_alive=None, max_operations=1)
+    await env.init()
+
+    for op_id in ("1", "2"):
+        env.send(
+            {
+                "type": "subscribe",
+                "id": op_id,
+                "payload": {"query": "subscription { events }"},
+            }
+        )
+
+    assert await env.receive() == {
+        "type": "error",
+        "id": "2",
+        "payload": [{"message": "Too many concurrent operations"}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_on_connect_sets_the_context():
+    async def on_connect(payload, context):
+        if payload is None:
+            raise ConnectionRejected("Who are you?")
+        return {"user": payload["token"]}
+
+    env = _Env(keep_alive=None, on_connect=on_connect)
+    await env.init({"token": "alice"})
+    env.send(
+        {"type": "subscribe", "id": "1", "payload": {"query": "{ whoami }"}}
+    )
+
+    assert (await env.receive())["payload"] == {"data": {"whoami": "alice"}}
+
+
+@pytest.mark.asyncio
+async def test_on_connect_rejects_the_connection():
+    def on_connect(payload, context):
+        raise ConnectionRejected("Who are you?")
+
+    env = _Env(keep_alive=None, on_connect=on_connect)
+    env.send({"type": "connection_init"})
+
+    assert await env.closed_with() == (4403, "Who are you?")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "messages, expected",
+    [
+        (["{"], (4400, "Invalid message")),
+        ([{"type": "foo"}], (4400, "Unknown message type 'foo'")),
+        (
+            [{"type": "subscribe", "id": "1", "payload": {"query": "{a}"}}],
+            (4401, "Unauthorized"),
+        ),
+        (
+            [{"type": "connection_init"}, {"type": "connection_init"}],
+            (4429, "Too many initialisation requests"),
+        ),
+        (
+            [
+                {"type": "connection_init"},
+                {
+                    "type": "subscribe",
+                    "id": "1",
+                    "payload": {"query": "subscription { events }"},
+                },
+                {
+                    "type": "subscribe",
+                    "id": "1",
+                    "payload": {"query": "subscription { events }"},
+                },
+            ],
+            (4409, "Subscriber for 1 already exists"),
+        ),
+    ],
+)
+async def test_protocol_errors_close_the_connection(messages, expected):
+    env = _Env(keep_alive=None)
+    for message in messages:
+        env.send(message)
+
+    while True:
+        message = await env.receive()
+        if message is None:
+            break
+
+    await asyncio.wait_for(env.task, 1)
+    assert (env.transport.close_code, env.transport.close_reason) == expected
+
+
+@pytest.mark.asyncio
+async def test_connection_init_timeout():
+    env = _Env(keep_alive=None, connection_init_timeout=0.01)
+    assert await env.closed_with() == (
+        4408,
+        "Connection initialisation timeout",
+    )
+
+
+@pytest.mark.asyncio
+async def test_ping_pong():
+    env = _Env(keep_alive=None)
+    env.send({"type": "ping"})
+    assert await env.receive() == {"type": "pong"}
+
+
+@pytest.mark.asyncio
+async def test_pings_are_only_sent_to_idle_clients():
+    env = _Env(keep_alive=0.05)
+    await env.init()
+
+    for _ in range(5):
+        await asyncio.sleep(0.02)
+        env.send({"type": "pong"})
+    assert env.transport._to_client.empty()
+
+    assert await env.receive() == {"type": "ping"}
+
+
+@pytest.mark.asyncio
+async def test_legacy_protocol():
+    env = _Env(GRAPHQL_WS, keep_alive=10)
+    env.send({"type": "connection_init"})
+    assert await env.receive() == {"type": "connection_ack"}
+    assert await env.receive() == {"type": "ka"}
+
+    env.send({"type": "start", "id": "1", "payload": {"query": "{ hello }"}})
+    assert await env.receive() == {
+        "type": "data",
+        "id": "1",
+        "payload": {"data": {"hello": "Hello world!"}},
+    }
+    assert await env.receive() == {"type": "complete", "id": "1"}
+
+    env.send({"type": "start", "id": "2", "payload": {"query": "{ foo }"}})
+    message = await env.receive()
+    assert message["type"] == "data"
+    assert message["payload"]["errors"][0]["message"].startswith(
+        "Cannot query field"
+    )
+    assert await env.receive() == {"type": "complete", "id": "2"}
+
+    env.send(
+        {
+            "type": "start",
+            "id": "3",
+            "payload": {"query": "subscription { events }"},
+        }
+    )
+    await asyncio.sleep(0.01)
+    env.send({"type": "stop", "id": "3"})
+    await asyncio.sleep(0.01)
+    assert env.closed == [True]
+
+    env.send({"type": "connection_terminate"})
+    assert await env.closed_with() == (1000, "")
+
+
+@pytest.mark.asyncio
+async def test_legacy_protocol_reports_invalid_messages():
+    env = _Env(GRAPHQL_WS, keep_alive=None)
+    env.send("{")
+    assert await env.receive() == {
+        "type": "connection_error",
+        "payload": {"message": "Invalid message"},
+    }
+
+    env.send({"type": "start", "id": "1", "payload": {"query": "{ hello }"}})
+    assert await env.receive() == {
+        "type": "error",
+        "id": "1",
+        "payload": {"message": "Connection has not been initialised"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_unsupported_subprotocol():
+    server = WebSocketServer(_Env(keep_alive=None).schema())
+    with pytest.raises(ValueError):
+        await server.handle(MemoryTransport(), "foo")